@@ -0,0 +1,200 @@
+import numpy as np
+import migracoes
+
+# Caminho colunar para análises: a tabela é lida em lotes direto para arrays
+# NumPy tipados (centavos inteiros, código de tipo, datetime64) e as agregações
+# são feitas com operações vetorizadas, sem criar uma tupla Python por linha.
+# Exemplo:
+#   with Conexao() as conexao:
+#       colunas = conexao.read_columns()
+#   saldo_por_periodo(colunas, 'mes')
+
+# Códigos da coluna ``tipo``; qualquer tipo diferente de 'entrada' é saída
+TIPO_SAIDA = 0
+TIPO_ENTRADA = 1
+
+# Valor usado pelo SQLite para datas inválidas ou nulas; vira NaT no NumPy
+_DIA_INVALIDO = np.iinfo(np.int64).min
+
+
+class ColunasTransacoes:
+    """Transações em formato colunar.
+
+    ``id`` e ``centavos`` são int64, ``tipo`` é int8 (TIPO_ENTRADA/TIPO_SAIDA),
+    ``data`` é datetime64[D] e ``nome`` guarda o índice de cada nome na lista
+    ``nomes`` (cada nome distinto é armazenado uma única vez).
+    """
+
+    __slots__ = ('id', 'centavos', 'tipo', 'data', 'nome', 'nomes')
+
+    def __init__(self, id, centavos, tipo, data, nome, nomes):
+        self.id = id
+        self.centavos = centavos
+        self.tipo = tipo
+        self.data = data
+        self.nome = nome
+        self.nomes = nomes
+
+    def __len__(self):
+        return len(self.id)
+
+    def nbytes(self):
+        """Memória ocupada pelos arrays (sem contar a lista de nomes distintos)."""
+        return sum(getattr(self, coluna).nbytes for coluna in ('id', 'centavos', 'tipo', 'data', 'nome'))
+
+
+def ler_colunas(cursor, where='', parametros=(), tamanho_lote=100_000, fonte='transacoes'):
+    """Lê transacoes em lotes de ``tamanho_lote`` e monta um ColunasTransacoes.
+
+    valor já está gravado em centavos; o código de tipo e os dias desde 1970
+    são calculados no próprio SQLite, e do lado do Python só os nomes passam
+    por um dicionário. ``fonte`` é a expressão do FROM (com anos arquivados,
+    a união do principal com as partições, ver particoes.fonte).
+    """
+    entrada = migracoes.EH_ENTRADA.format(linha='transacoes')
+    cursor.execute(f'''
+        SELECT id_transacao,
+               COALESCE(valor, 0),
+               CASE WHEN {entrada} THEN {TIPO_ENTRADA} ELSE {TIPO_SAIDA} END,
+               COALESCE(CAST(julianday(data) - 2440587.5 AS INTEGER), {_DIA_INVALIDO}),
+               COALESCE(nome_transacao, '')
+        FROM {fonte} {where}
+        ORDER BY id_transacao
+    ''', parametros)
+
+    indice_nomes = {}
+    partes = {'id': [], 'centavos': [], 'tipo': [], 'data': [], 'nome': []}
+    while True:
+        linhas = cursor.fetchmany(tamanho_lote)
+        if not linhas:
+            break
+        ids, centavos, tipos, dias, nomes = zip(*linhas)
+        partes['id'].append(np.array(ids, dtype=np.int64))
+        partes['centavos'].append(np.array(centavos, dtype=np.int64))
+        partes['tipo'].append(np.array(tipos, dtype=np.int8))
+        partes['data'].append(np.array(dias, dtype=np.int64))
+        # Só os nomes distintos do lote passam pelo laço em Python; a
+        # tradução de cada linha para o código é feita pelo map em C
+        for nome in dict.fromkeys(nomes):
+            if nome not in indice_nomes:
+                indice_nomes[nome] = len(indice_nomes)
+        partes['nome'].append(np.fromiter(map(indice_nomes.__getitem__, nomes), dtype=np.int32, count=len(nomes)))
+
+    def juntar(coluna, dtype):
+        return np.concatenate(partes[coluna]) if partes[coluna] else np.empty(0, dtype=dtype)
+
+    return ColunasTransacoes(
+        id=juntar('id', np.int64),
+        centavos=juntar('centavos', np.int64),
+        tipo=juntar('tipo', np.int8),
+        data=juntar('data', np.int64).view('datetime64[D]'),
+        nome=juntar('nome', np.int32),
+        nomes=list(indice_nomes),
+    )
+
+
+def _somar_int64(grupos, valores, quantidade_grupos):
+    """Soma de ``valores`` por grupo em int64.
+
+    bincount com weights soma em float64 e perde centavos acima de 2**53;
+    np.add.at acumula no próprio tipo do array e, no numpy atual, não é mais
+    lento que o bincount.
+    """
+    somas = np.zeros(quantidade_grupos, dtype=np.int64)
+    np.add.at(somas, grupos, valores)
+    return somas
+
+
+def _somar_por_grupo(grupos, colunas, quantidade_grupos):
+    """(entradas, saidas) em centavos por grupo."""
+    entrada = colunas.tipo == TIPO_ENTRADA
+    centavos = colunas.centavos.astype(np.int64, copy=False)
+    return (_somar_int64(grupos, np.where(entrada, centavos, 0), quantidade_grupos),
+            _somar_int64(grupos, np.where(entrada, 0, centavos), quantidade_grupos))
+
+
+def _chave_periodo(datas, granularidade):
+    """Chave inteira do período de cada data e a função que a formata como em resumo_periodos."""
+    if granularidade == 'dia':
+        return datas.astype(np.int64), lambda chave: str(np.datetime64(int(chave), 'D'))
+    if granularidade == 'ano':
+        return datas.astype('datetime64[Y]').astype(np.int64), lambda chave: f'{chave + 1970:04d}'
+    if granularidade == 'mes':
+        return (datas.astype('datetime64[M]').astype(np.int64),
+                lambda chave: f'{chave // 12 + 1970:04d}-{chave % 12 + 1:02d}')
+    if granularidade == 'semana':
+        # Mesmo critério do strftime('%W') do SQLite: semanas começam na
+        # segunda-feira e os dias antes da primeira segunda são a semana 00
+        dias = datas.astype(np.int64)
+        anos = datas.astype('datetime64[Y]')
+        dia_do_ano = dias - anos.astype('datetime64[D]').astype(np.int64)
+        dia_da_semana = (dias + 3) % 7  # 1970-01-01 foi uma quinta-feira; segunda = 0
+        semana = (dia_do_ano + 7 - dia_da_semana) // 7
+        return (anos.astype(np.int64) * 100 + semana,
+                lambda chave: f'{chave // 100 + 1970:04d}-{chave % 100:02d}')
+    raise ValueError(f'Granularidade desconhecida: {granularidade}')
+
+
+def saldo_por_periodo(colunas, granularidade='mes'):
+    """Entradas, saídas e total (centavos) por período, em ordem cronológica.
+
+    ``granularidade`` é 'dia', 'semana', 'mes' ou 'ano', com os mesmos rótulos de
+    período de Conexao.calcular_total_por_periodo. Retorna um dicionário de
+    arrays que pode ir direto para um pandas.DataFrame.
+    """
+    validas = ~np.isnat(colunas.data)
+    if not validas.all():
+        colunas = _selecionar(colunas, validas)
+    chaves, formatar = _chave_periodo(colunas.data, granularidade)
+    if len(chaves) == 0:
+        vazio = np.empty(0, dtype=np.int64)
+        return {'periodo': np.empty(0, dtype=object), 'entradas': vazio, 'saidas': vazio, 'total': vazio}
+
+    # As chaves ocupam uma faixa pequena, então usar (chave - mínimo) como
+    # índice do grupo dispensa a ordenação que np.unique faria
+    minimo = chaves.min()
+    grupos = chaves - minimo
+    quantidade_grupos = int(grupos.max()) + 1
+    entradas, saidas = _somar_por_grupo(grupos, colunas, quantidade_grupos)
+    presentes = np.flatnonzero(np.bincount(grupos, minlength=quantidade_grupos))
+    return {
+        'periodo': np.array([formatar(int(chave)) for chave in presentes + minimo], dtype=object),
+        'entradas': entradas[presentes],
+        'saidas': saidas[presentes],
+        'total': entradas[presentes] - saidas[presentes],
+    }
+
+
+def totais_por_tipo(colunas):
+    """{'entrada': (quantidade, centavos), 'saida': (quantidade, centavos)}."""
+    entrada = colunas.tipo == TIPO_ENTRADA
+    return {
+        'entrada': (int(entrada.sum()), int(colunas.centavos[entrada].sum())),
+        'saida': (int((~entrada).sum()), int(colunas.centavos[~entrada].sum())),
+    }
+
+
+def top_nomes(colunas, n=10, tipo=TIPO_SAIDA):
+    """Os ``n`` nomes com maior soma de valores do ``tipo`` dado: [(nome, centavos, quantidade)]."""
+    selecionadas = colunas.tipo == tipo
+    codigos = colunas.nome[selecionadas]
+    somas = _somar_int64(codigos, colunas.centavos[selecionadas].astype(np.int64, copy=False),
+                         len(colunas.nomes))
+    quantidades = np.bincount(codigos, minlength=len(colunas.nomes))
+    n = min(n, int((quantidades > 0).sum()))
+    if n == 0:
+        return []
+    # argpartition separa os n maiores sem ordenar todos os nomes
+    melhores = np.argpartition(-somas, n - 1)[:n]
+    melhores = melhores[np.argsort(-somas[melhores], kind='stable')]
+    return [(colunas.nomes[codigo], int(somas[codigo]), int(quantidades[codigo])) for codigo in melhores]
+
+
+def em_reais(centavos):
+    """Converte centavos (inteiro ou array) para reais em float, só para exibição."""
+    return np.asarray(centavos) / 100
+
+
+def _selecionar(colunas, mascara):
+    return ColunasTransacoes(colunas.id[mascara], colunas.centavos[mascara], colunas.tipo[mascara],
+                             colunas.data[mascara], colunas.nome[mascara], colunas.nomes)
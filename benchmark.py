@@ -0,0 +1,227 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import datetime
+import tempfile
+import tracemalloc
+import subprocess
+import contextlib
+from conexao import Conexao, FORMATOS_LEITURA, PoolConexoes, obter_pool
+
+# Benchmark do Conexao com dados sintéticos, sem Qt. Exemplos:
+#   python benchmark.py --tamanhos 10k
+#   python benchmark.py --tamanhos 10k 1m --saida bench.json --comparar bench_anterior.json
+
+TAMANHOS = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+
+PALAVRAS = ['Mercado', 'Padaria', 'Farmácia', 'Salário', 'Aluguel', 'Energia', 'Água', 'Internet',
+            'Restaurante', 'Combustível', 'Transferência', 'Pix', 'Cartão', 'Academia', 'Escola',
+            'Cinema', 'Livraria', 'Uber', 'Seguro', 'Consultoria']
+
+
+def gerar_transacoes(quantidade, semente=42, data_inicial=datetime.date(2015, 1, 1), dias=3650):
+    """Gera ``quantidade`` tuplas (valor, nome, tipo, data) sempre iguais para a mesma semente."""
+    aleatorio = random.Random(semente)
+    for _ in range(quantidade):
+        entrada = aleatorio.random() < 0.35
+        valor = round(aleatorio.uniform(100, 8000) if entrada else aleatorio.uniform(1, 1500), 2)
+        nome = f'{aleatorio.choice(PALAVRAS)} {aleatorio.choice(PALAVRAS)}'
+        data = data_inicial + datetime.timedelta(days=aleatorio.randrange(dias))
+        yield valor, nome, 'Entrada' if entrada else 'Saída', data.isoformat()
+
+
+def _medir(funcao, repeticoes=1):
+    # As mensagens que o Conexao imprime a cada operação não entram na medição
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao()
+        duracao = time.perf_counter() - inicio
+    return {'segundos': round(duracao, 6), 'operacoes': repeticoes,
+            'ms_por_operacao': round(duracao * 1000 / repeticoes, 4)}
+
+
+def _medir_memoria(funcao, linhas):
+    """MB retidos pelo resultado de ``funcao``, proporcionais a 1 milhão de linhas.
+
+    Conta só a memória alocada pelo Python (tracemalloc), que é a ocupada
+    pelas tuplas, registros ou buffers devolvidos; o cache do SQLite fica fora.
+    """
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        tracemalloc.start()
+        try:
+            resultado = funcao()
+            retido = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+    del resultado
+    return round(retido / max(linhas, 1) * 1_000_000 / 2 ** 20, 1)
+
+
+def _medir_escritores(caminho, transacoes, threads=8):
+    """Inserções avulsas de várias threads: cada uma com seu commit e pela fila de escrita."""
+    def sincrono(parte):
+        with Conexao(caminho) as conexao:
+            for transacao in parte:
+                conexao.insert_transacao(*transacao)
+
+    def pela_fila(parte):
+        with Conexao(caminho) as conexao:
+            for transacao in parte:
+                conexao.enviar_insercao(*transacao).result()
+
+    resultados = {}
+    metade = len(transacoes) // 2
+    for nome, funcao, lote in (('escritores_concorrentes', sincrono, transacoes[:metade]),
+                               ('escritores_fila', pela_fila, transacoes[metade:])):
+        partes = [lote[i::threads] for i in range(threads)]
+
+        def rodar():
+            escritores = [threading.Thread(target=funcao, args=(parte,)) for parte in partes]
+            for escritor in escritores:
+                escritor.start()
+            for escritor in escritores:
+                escritor.join()
+
+        resultado = _medir(rodar)
+        resultado['linhas_por_segundo'] = round(len(lote) / resultado['segundos'])
+        resultados[nome] = resultado
+    with Conexao(caminho) as conexao:
+        resultados['escritores_fila']['media_lote'] = conexao.estatisticas_fila()['media_lote']
+    return resultados
+
+
+def executar_cenario(rotulo, quantidade, diretorio, semente=42, amostras=200, max_read_all=1_000_000):
+    os.makedirs(diretorio, exist_ok=True)
+    caminho = os.path.join(diretorio, f'benchmark_{rotulo}.db')
+    for sufixo in ('', '-wal', '-shm'):
+        if os.path.exists(caminho + sufixo):
+            os.remove(caminho + sufixo)
+
+    aleatorio = random.Random(semente + 1)
+    resultados = {}
+    # Pool próprio sem o cache de leituras: as leituras repetidas abaixo medem
+    # o banco. O ganho do cache é medido à parte, em *_cache.
+    pool = PoolConexoes(caminho, cache_max_entradas=0)
+    with Conexao(caminho, pool=pool) as conexao:
+        resultado = _medir(lambda: conexao.insert_many(gerar_transacoes(quantidade, semente), tamanho_lote=10_000))
+        resultado['linhas_por_segundo'] = round(quantidade / resultado['segundos'])
+        resultados['insert_many'] = resultado
+
+        linhas_avulsas = list(gerar_transacoes(amostras, semente + 2))
+        avulsas = iter(linhas_avulsas)
+        resultados['insert_transacao'] = _medir(lambda: conexao.insert_transacao(*next(avulsas)), amostras)
+        resultados.update(_medir_escritores(caminho, list(gerar_transacoes(amostras * 4, semente + 3))))
+
+        total = quantidade + amostras
+        if total <= max_read_all:
+            for formato in FORMATOS_LEITURA:
+                chave = 'read_all' if formato == 'tuplas' else f'read_all_{formato}'
+                resultados[chave] = _medir(lambda: conexao.read_all(formato))
+                resultados[chave]['mb_por_milhao'] = _medir_memoria(lambda: conexao.read_all(formato), total)
+
+        ids = [aleatorio.randint(1, total) for _ in range(amostras)]
+        ids_iter = iter(ids)
+        resultados['read_one'] = _medir(lambda: conexao.read_one(next(ids_iter)), amostras)
+
+        anos = iter([aleatorio.randint(2015, 2024) for _ in range(amostras)])
+        resultados['read_data_por_ano'] = _medir(lambda: conexao.read_data_por_ano(next(anos)), min(amostras, 20))
+        meses = iter([(aleatorio.randint(2015, 2024), aleatorio.randint(1, 12)) for _ in range(amostras)])
+        resultados['read_data_por_mes'] = _medir(lambda: conexao.read_data_por_mes(*next(meses)), amostras)
+        dias = iter([(datetime.date(2015, 1, 1) + datetime.timedelta(days=aleatorio.randrange(3650))).isoformat()
+                     for _ in range(amostras)])
+        resultados['read_data_por_dia'] = _medir(lambda: conexao.read_data_por_dia(next(dias)), amostras)
+
+        resultados['calcular_total_semanal'] = _medir(conexao.calcular_total_semanal, 10)
+        resultados['calcular_total_mensal'] = _medir(conexao.calcular_total_mensal, 10)
+        resultados['calcular_total_anual'] = _medir(conexao.calcular_total_anual, 10)
+        totais_mensais = conexao.calcular_total_mensal()
+    pool.fechar()
+
+    with Conexao(caminho) as conexao:
+        conexao.calcular_total_mensal()  # a primeira chamada preenche o cache
+        resultados['calcular_total_mensal_cache'] = _medir(conexao.calcular_total_mensal, 10)
+
+    # Relatórios: o PDF de transações é limitado a um mês para ter tamanho comparável
+    try:
+        import relatorios
+        import pandas as pd
+    except ImportError as e:
+        print(f'Benchmark de PDF ignorado: {e}')
+    else:
+        caminho_pdf = os.path.join(diretorio, f'benchmark_{rotulo}.pdf')
+        resultados['gerar_relatorio_pdf_mes'] = _medir(lambda: relatorios.gerar_relatorio_pdf(
+            caminho_pdf, filtros={'inicio': '2020-01-01', 'fim': '2020-02-01'}, caminho_banco=caminho))
+        df = pd.DataFrame(totais_mensais, columns=['Mes', 'Entradas', 'Saidas', 'Total'])
+        resultados['save_dataframe_as_pdf_mensal'] = _medir(
+            lambda: relatorios.salvar_dataframe_pdf(df, os.path.join(diretorio, f'totais_{rotulo}.pdf')))
+
+    obter_pool(caminho).fechar()
+    return resultados
+
+
+def _commit_atual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(atual, anterior):
+    print(f"\nComparação com {anterior.get('commit')} (tempo atual / anterior):")
+    for rotulo, operacoes in atual['resultados'].items():
+        antigas = anterior.get('resultados', {}).get(rotulo, {})
+        for operacao, medida in operacoes.items():
+            antiga = antigas.get(operacao)
+            if antiga and antiga['segundos']:
+                razao = medida['segundos'] / antiga['segundos']
+                print(f"  {rotulo:5s} {operacao:30s} {razao:6.2f}x")
+
+
+def imprimir(resultados):
+    for rotulo, operacoes in resultados['resultados'].items():
+        print(f'\n== {rotulo} ==')
+        for operacao, medida in operacoes.items():
+            extra = f" ({medida['linhas_por_segundo']} linhas/s)" if 'linhas_por_segundo' in medida else ''
+            if 'mb_por_milhao' in medida:
+                extra += f" ({medida['mb_por_milhao']} MB por milhão de linhas)"
+            print(f"  {operacao:30s} {medida['ms_por_operacao']:12.3f} ms/op{extra}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark do Conexao com dados sintéticos')
+    parser.add_argument('--tamanhos', nargs='+', default=['10k'], choices=list(TAMANHOS))
+    parser.add_argument('--diretorio', default=tempfile.gettempdir(), help='onde criar os bancos de teste')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--amostras', type=int, default=200, help='repetições das operações pontuais')
+    parser.add_argument('--max-read-all', type=int, default=1_000_000,
+                        help='não mede read_all acima deste número de linhas')
+    parser.add_argument('--saida', help='grava os resultados em JSON')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior para comparação')
+    argumentos = parser.parse_args()
+
+    resultados = {
+        'commit': _commit_atual(),
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'sqlite': __import__('sqlite3').sqlite_version,
+        'resultados': {},
+    }
+    for rotulo in argumentos.tamanhos:
+        print(f'Executando cenário {rotulo}...')
+        resultados['resultados'][rotulo] = executar_cenario(
+            rotulo, TAMANHOS[rotulo], argumentos.diretorio, argumentos.semente,
+            argumentos.amostras, argumentos.max_read_all)
+
+    imprimir(resultados)
+    if argumentos.saida:
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding='utf-8') as arquivo:
+            comparar(resultados, json.load(arquivo))
@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import tempfile
+import statistics
+import subprocess
+import contextlib
+import migracoes
+import particoes
+
+# Mede a inicialização a frio da interface: cada amostra roda em um processo
+# Python novo. Exemplos:
+#   python benchmark_inicializacao.py
+#   python benchmark_inicializacao.py --repeticoes 10 --saida inicializacao.json --limite-ms 1500
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos medidos isoladamente (tempo de import em processo novo)
+MODULOS = {
+    'conexao': 'import conexao',
+    'interface (main sem a janela)': 'import PyQt5.QtWidgets, conexao, modelo_tabela, tarefas, telas',
+    'relatorios (fpdf)': 'import relatorios',
+    'pandas': 'import pandas',
+}
+
+_MEDIR_IMPORT = 'import time; t = time.perf_counter(); {codigo}; print(time.perf_counter() - t)'
+
+_MEDIR_FORMULARIO = '''
+import sys, time
+from PyQt5 import QtWidgets
+app = QtWidgets.QApplication(sys.argv)
+t = time.perf_counter()
+if {compilado!r}:
+    import telas
+    telas.carregar({nome!r})
+else:
+    from PyQt5 import uic
+    uic.loadUi({nome!r} + '.ui')
+print(time.perf_counter() - t)
+'''
+
+
+def _rodar(codigo, ambiente=None):
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=DIRETORIO, env=ambiente,
+                           capture_output=True, text=True, check=True).stdout
+    return float(saida.strip().splitlines()[-1])
+
+
+def _ambiente_grafico():
+    ambiente = dict(os.environ)
+    # Permite rodar sem monitor (CI, servidor)
+    ambiente.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return ambiente
+
+
+def copiar_banco(diretorio):
+    """Copia o hugobanco.db do projeto para ``diretorio``, já migrado, e retorna o caminho da cópia.
+
+    A janela principal é medida sobre a cópia (via HUGOBANCO_BANCO): o banco do
+    usuário não é alterado e a migração não entra no tempo da primeira amostra.
+    """
+    destino = os.path.join(diretorio, 'hugobanco.db')
+    _copiar(os.path.join(DIRETORIO, 'hugobanco.db'), destino)
+    with contextlib.closing(sqlite3.connect(destino)) as copia:
+        # Os anos arquivados ficam em arquivos ao lado do principal
+        for _, arquivo, *_ in particoes.registradas(copia):
+            _copiar(os.path.join(DIRETORIO, arquivo), os.path.join(diretorio, arquivo))
+        migracoes.migrar(copia)
+    return destino
+
+
+def _copiar(origem, destino):
+    # backup em vez de copiar o arquivo: inclui o que ainda está no WAL
+    if not os.path.exists(origem):
+        return
+    with contextlib.closing(sqlite3.connect(f'file:{origem}?mode=ro', uri=True)) as original, \
+            contextlib.closing(sqlite3.connect(destino)) as copia:
+        original.backup(copia)
+
+
+def medir_primeira_pintura(ambiente):
+    """Tempo de parede desde o início do processo até a primeira pintura da janela principal.
+
+    ``ambiente`` deve trazer HUGOBANCO_BANCO apontando para uma cópia do banco (ver copiar_banco).
+    """
+    ambiente = dict(ambiente, HUGOBANCO_SAIR_APOS_PINTURA='1')
+    inicio = time.perf_counter()
+    processo = subprocess.Popen([sys.executable, 'main.py'], cwd=DIRETORIO, env=ambiente,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    duracao = None
+    for linha in processo.stdout:
+        if linha.startswith('PRIMEIRA_PINTURA'):
+            duracao = time.perf_counter() - inicio
+    processo.wait()
+    if duracao is None:
+        raise RuntimeError('main.py terminou sem pintar a janela principal')
+    return duracao
+
+
+def _resumo(amostras):
+    return {
+        'mediana_ms': round(statistics.median(amostras) * 1000, 1),
+        'min_ms': round(min(amostras) * 1000, 1),
+        'max_ms': round(max(amostras) * 1000, 1),
+    }
+
+
+def executar(repeticoes):
+    ambiente = _ambiente_grafico()
+    resultados = {'python': sys.version.split()[0], 'repeticoes': repeticoes,
+                  'imports': {}, 'formularios': {}}
+
+    for rotulo, codigo in MODULOS.items():
+        amostras = [_rodar(_MEDIR_IMPORT.format(codigo=codigo), ambiente) for _ in range(repeticoes)]
+        resultados['imports'][rotulo] = _resumo(amostras)
+
+    for nome in ('tela_cadastro', 'inserir_dados', 'atualizar_dados', 'tela_excluir'):
+        resultados['formularios'][nome] = {
+            modo: _resumo([_rodar(_MEDIR_FORMULARIO.format(nome=nome, compilado=compilado), ambiente)
+                           for _ in range(repeticoes)])
+            for modo, compilado in (('loadUi', False), ('compilado', True))
+        }
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        ambiente_copia = dict(ambiente, HUGOBANCO_BANCO=copiar_banco(diretorio))
+        resultados['primeira_pintura'] = _resumo([medir_primeira_pintura(ambiente_copia)
+                                                  for _ in range(repeticoes)])
+    return resultados
+
+
+def imprimir(resultados):
+    print('Tempo de import (processo novo):')
+    for rotulo, resumo in resultados['imports'].items():
+        print(f"  {rotulo:32s} {resumo['mediana_ms']:8.1f} ms")
+    print('Montagem dos formulários (loadUi -> compilado):')
+    for nome, modos in resultados['formularios'].items():
+        print(f"  {nome:32s} {modos['loadUi']['mediana_ms']:8.1f} ms -> {modos['compilado']['mediana_ms']:.1f} ms")
+    print(f"Até a primeira pintura: {resultados['primeira_pintura']['mediana_ms']:.1f} ms (mediana)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de inicialização a frio da interface')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--saida', help='grava os resultados em JSON neste arquivo')
+    parser.add_argument('--limite-ms', type=float,
+                        help='termina com erro se a mediana até a primeira pintura passar deste valor')
+    argumentos = parser.parse_args()
+
+    resultados = executar(argumentos.repeticoes)
+    imprimir(resultados)
+    if argumentos.saida:
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+    if argumentos.limite_ms and resultados['primeira_pintura']['mediana_ms'] > argumentos.limite_ms:
+        print(f'Regressão: primeira pintura acima de {argumentos.limite_ms} ms')
+        sys.exit(1)
@@ -0,0 +1,209 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from benchmark import gerar_transacoes
+
+# Teste de carga do servico.py: N clientes simultâneos, cada um com uma conexão
+# keep-alive, disparam uma mistura de consultas (e, opcionalmente, inserções)
+# e o resultado é a vazão em requisições por segundo e a latência p50/p95/p99.
+# Exemplos:
+#   python benchmark_servico.py --url http://127.0.0.1:8765 --clientes 32 --segundos 10
+#   python benchmark_servico.py --subir 100000 --escritas 0.1    (sobe um serviço em um banco temporário)
+
+GRANULARIDADES = ('semana', 'mes', 'ano')
+
+
+class Cliente:
+    """Conexão HTTP/1.1 keep-alive com o serviço."""
+
+    def __init__(self, host, porta):
+        self.host = host
+        self.porta = porta
+        self.reader = self.writer = None
+
+    async def requisitar(self, metodo, caminho, corpo=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.porta)
+        dados = json.dumps(corpo).encode('utf-8') if corpo is not None else b''
+        self.writer.write(f'{metodo} {caminho} HTTP/1.1\r\nHost: {self.host}\r\n'
+                          f'Content-Type: application/json\r\nContent-Length: {len(dados)}\r\n\r\n'
+                          .encode('latin-1') + dados)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        tamanho = 0
+        while True:
+            cabecalho = await self.reader.readline()
+            if cabecalho in (b'\r\n', b''):
+                break
+            nome, _, valor = cabecalho.decode('latin-1').partition(':')
+            if nome.strip().lower() == 'content-length':
+                tamanho = int(valor)
+        return status, json.loads(await self.reader.readexactly(tamanho))
+
+    def fechar(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _proxima_requisicao(aleatorio, maior_id, fracao_escritas):
+    sorteio = aleatorio.random()
+    if sorteio < fracao_escritas:
+        valor, nome, tipo, data = next(gerar_transacoes(1, aleatorio.randrange(1 << 30)))
+        return 'insercao', 'POST', '/transacoes', {'valor': valor, 'nome': nome, 'tipo': tipo, 'data': data}
+    sorteio = (sorteio - fracao_escritas) / (1 - fracao_escritas) if fracao_escritas < 1 else 0
+    if sorteio < 0.70:
+        return 'consulta_id', 'GET', f'/transacoes/{aleatorio.randint(1, maior_id)}', None
+    if sorteio < 0.85:
+        return 'totais', 'GET', f'/totais/{aleatorio.choice(GRANULARIDADES)}', None
+    ano = aleatorio.randint(2015, 2024)
+    return 'saldo', 'GET', f'/saldo?ate={ano}-{aleatorio.randint(1, 12):02d}-01', None
+
+
+async def _trabalhar(host, porta, semente, prazo, maior_id, fracao_escritas, latencias, falhas):
+    aleatorio = random.Random(semente)
+    cliente = Cliente(host, porta)
+    try:
+        while time.perf_counter() < prazo:
+            tipo, metodo, caminho, corpo = _proxima_requisicao(aleatorio, maior_id, fracao_escritas)
+            inicio = time.perf_counter()
+            try:
+                status, _ = await cliente.requisitar(metodo, caminho, corpo)
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                falhas[type(e).__name__] = falhas.get(type(e).__name__, 0) + 1
+                cliente.fechar()
+                cliente = Cliente(host, porta)
+                continue
+            latencias.setdefault(tipo, []).append((time.perf_counter() - inicio) * 1000)
+            if status >= 500 or (status >= 400 and tipo != 'consulta_id'):
+                falhas[status] = falhas.get(status, 0) + 1
+    finally:
+        cliente.fechar()
+
+
+def _percentil(ordenadas, fracao):
+    return ordenadas[min(len(ordenadas) - 1, int(fracao * len(ordenadas)))] if ordenadas else 0.0
+
+
+def _resumo(latencias, segundos):
+    todas = sorted(latencia for lista in latencias.values() for latencia in lista)
+    resumo = {'requisicoes': len(todas), 'segundos': round(segundos, 3),
+              'req_por_segundo': round(len(todas) / segundos, 1)}
+    for nome, ordenadas in [('total', todas)] + sorted((tipo, sorted(lista)) for tipo, lista in latencias.items()):
+        resumo[nome] = {'quantidade': len(ordenadas),
+                        'p50_ms': round(_percentil(ordenadas, 0.50), 3),
+                        'p95_ms': round(_percentil(ordenadas, 0.95), 3),
+                        'p99_ms': round(_percentil(ordenadas, 0.99), 3),
+                        'max_ms': round(ordenadas[-1], 3) if ordenadas else 0.0}
+    return resumo
+
+
+async def _maior_id(host, porta):
+    """Maior id existente, por busca exponencial seguida de busca binária em GET /transacoes/<id>."""
+    cliente = Cliente(host, porta)
+    try:
+        baixo, alto = 0, 1
+        while (await cliente.requisitar('GET', f'/transacoes/{alto}'))[0] == 200:
+            baixo, alto = alto, alto * 2
+        while alto - baixo > 1:
+            meio = (baixo + alto) // 2
+            if (await cliente.requisitar('GET', f'/transacoes/{meio}'))[0] == 200:
+                baixo = meio
+            else:
+                alto = meio
+        return baixo
+    finally:
+        cliente.fechar()
+
+
+async def carga(host, porta, clientes=16, segundos=10.0, fracao_escritas=0.0, aquecimento=1.0):
+    """Roda a carga contra o serviço e retorna o resumo de vazão e latência."""
+    # Ids apagados no meio da faixa só viram 404, que não conta como falha
+    maior_id = max(1, await _maior_id(host, porta))
+
+    if aquecimento:
+        await asyncio.gather(*(_trabalhar(host, porta, -1 - i, time.perf_counter() + aquecimento,
+                                          maior_id, fracao_escritas, {}, {}) for i in range(clientes)))
+
+    latencias, falhas = {}, {}
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_trabalhar(host, porta, i, inicio + segundos, maior_id, fracao_escritas,
+                                      latencias, falhas) for i in range(clientes)))
+    resumo = _resumo(latencias, time.perf_counter() - inicio)
+    resumo['clientes'] = clientes
+    resumo['fracao_escritas'] = fracao_escritas
+    resumo['falhas'] = {str(chave): quantidade for chave, quantidade in falhas.items()}
+    return resumo
+
+
+def _subir_servico(quantidade, diretorio, threads):
+    """Cria um banco temporário com ``quantidade`` transações e sobe servico.py em uma porta livre."""
+    from conexao import Conexao, fechar_pools
+    caminho = os.path.join(diretorio, 'servico.db')
+    with Conexao(caminho) as conexao:
+        conexao.insert_many(gerar_transacoes(quantidade), tamanho_lote=10_000)
+    fechar_pools()
+    # A saída vai para um arquivo: o serviço imprime uma mensagem por inserção
+    # e um pipe que ninguém lê acabaria travando o processo
+    log = os.path.join(diretorio, 'servico.log')
+    with open(log, 'w') as saida:
+        processo = subprocess.Popen(
+            [sys.executable, '-u', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'servico.py'),
+             '--banco', caminho, '--porta', '0', '--threads', str(threads)],
+            stdout=saida, stderr=subprocess.STDOUT)
+    prazo = time.monotonic() + 30
+    while time.monotonic() < prazo and processo.poll() is None:
+        with open(log) as arquivo:
+            linha = arquivo.readline()
+        if linha.startswith('Servindo em http://') and linha.endswith('\n'):
+            host, porta = linha.split('//', 1)[1].strip().rsplit(':', 1)
+            return processo, host, int(porta)
+        time.sleep(0.05)
+    processo.kill()
+    with open(log) as arquivo:
+        raise RuntimeError(f'O serviço não subiu: {arquivo.read()[-500:]!r}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Teste de carga do serviço HTTP de transações')
+    parser.add_argument('--url', default='http://127.0.0.1:8765')
+    parser.add_argument('--subir', type=int, metavar='TRANSACOES',
+                        help='sobe um serviço próprio em um banco temporário com este número de transações')
+    parser.add_argument('--threads', type=int, default=4, help='threads SQLite do serviço criado por --subir')
+    parser.add_argument('--clientes', type=int, default=16, help='conexões simultâneas')
+    parser.add_argument('--segundos', type=float, default=10.0)
+    parser.add_argument('--escritas', type=float, default=0.0, help='fração de requisições que inserem (0 a 1)')
+    parser.add_argument('--saida', help='grava o resultado em JSON')
+    argumentos = parser.parse_args()
+
+    processo = None
+    with tempfile.TemporaryDirectory() as diretorio:
+        if argumentos.subir:
+            processo, host, porta = _subir_servico(argumentos.subir, diretorio, argumentos.threads)
+        else:
+            host, porta = argumentos.url.split('//', 1)[-1].rstrip('/').rsplit(':', 1)
+            porta = int(porta)
+        try:
+            resumo = asyncio.run(carga(host, porta, argumentos.clientes, argumentos.segundos, argumentos.escritas))
+        finally:
+            if processo is not None:
+                processo.terminate()
+                processo.wait()
+
+    print(f'{resumo["requisicoes"]} requisições em {resumo["segundos"]} s com {resumo["clientes"]} clientes: '
+          f'{resumo["req_por_segundo"]} req/s')
+    print(f'{"tipo":14s} {"quantidade":>10s} {"p50 ms":>8s} {"p95 ms":>8s} {"p99 ms":>8s} {"máx ms":>8s}')
+    for nome, dados in resumo.items():
+        if isinstance(dados, dict) and 'p99_ms' in dados:
+            print(f'{nome:14s} {dados["quantidade"]:10d} {dados["p50_ms"]:8.2f} {dados["p95_ms"]:8.2f} '
+                  f'{dados["p99_ms"]:8.2f} {dados["max_ms"]:8.2f}')
+    if resumo['falhas']:
+        print(f'Falhas: {resumo["falhas"]}')
+    if argumentos.saida:
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resumo, arquivo, indent=2, ensure_ascii=False)
@@ -0,0 +1,43 @@
+import io
+import re
+import sys
+import hashlib
+
+# Gera os módulos ui_<nome>.py a partir dos arquivos .ui do Qt Designer.
+# Rode novamente sempre que editar um .ui: telas.carregar compara o hash
+# gravado no módulo e volta para uic.loadUi se o .ui tiver mudado.
+#
+# Uso: python compilar_ui.py
+
+FORMULARIOS = ['tela_cadastro', 'inserir_dados', 'atualizar_dados', 'tela_excluir']
+
+
+def hash_ui(caminho_ui):
+    # Quebras de linha normalizadas para o hash não mudar com o autocrlf do git
+    with open(caminho_ui, 'rb') as arquivo:
+        return hashlib.sha1(arquivo.read().replace(b'\r\n', b'\n')).hexdigest()
+
+
+def compilar(nome):
+    from PyQt5 import uic
+    caminho_ui = f'{nome}.ui'
+    saida = io.StringIO()
+    with open(caminho_ui, encoding='utf-8') as arquivo:
+        uic.compileUi(arquivo, saida)
+    codigo = saida.getvalue()
+
+    # Os .ui referenciam um teste.qrc que não faz parte do projeto; a importação
+    # do módulo de recursos vira opcional, como acontece com uic.loadUi
+    codigo = re.sub(r'^import (\w+_rc)$',
+                    r'try:\n    import \1\nexcept ImportError:\n    pass',
+                    codigo, flags=re.MULTILINE)
+    codigo += f'\n\nHASH_UI = {hash_ui(caminho_ui)!r}\n'
+
+    with open(f'ui_{nome}.py', 'w', encoding='utf-8') as arquivo:
+        arquivo.write(codigo)
+    print(f'{caminho_ui} -> ui_{nome}.py')
+
+
+if __name__ == '__main__':
+    for nome in sys.argv[1:] or FORMULARIOS:
+        compilar(nome)
@@ -1,205 +1,1300 @@
-import os
-import sqlite3
-import pandas as pd
-import matplotlib.pyplot as plt
-from fpdf import FPDF
-from pandas.plotting import table
-
-class Conexao:
-    def __init__(self):
-        self.connection = self.conectar()
-        self.cursor = self.connection.cursor()
-
-    def conectar(self):
-        try:
-            connection = sqlite3.connect("hugobanco.db")
-            return connection
-        except sqlite3.Error as e:
-            print(f'Erro ao conectar ao banco de dados: {e}')
-            return None
-
-    def create_table(self):
-        try:
-            sql = '''
-                    CREATE TABLE IF NOT EXISTS transacoes(
-                        id_transacao INTEGER PRIMARY KEY,
-                        valor FLOAT,
-                        nome_transacao VARCHAR(300),
-                        tipo_transacao VARCHAR(100),
-                        data VARCHAR(12)
-                    )'''
-            self.cursor.execute(sql)
-            self.connection.commit()
-            print('Tabela criada com sucesso')
-        except sqlite3.Error as e:
-            print(f'Erro ao criar a tabela: {e}')
-
-    def insert_transacao(self, valor, nome, tipo, data):
-        try:
-            sql = '''
-                    INSERT INTO transacoes(valor, nome_transacao, tipo_transacao, data)
-                    VALUES(?, ?, ?, ?)
-                  '''
-            self.cursor.execute(sql, (valor, nome, tipo, data))
-            self.connection.commit()
-            print('Transação inserida com sucesso')
-        except sqlite3.Error as e:
-            print(f'Erro ao inserir transação: {e}')
-
-    def update_transacao(self, id_transacao, nome, valor, tipo, data):
-        try:
-            sql = '''
-                UPDATE transacoes
-                SET nome_transacao = ?, valor = ?, tipo_transacao = ?, data = ?
-                WHERE id_transacao = ?
-            '''
-            self.cursor.execute(sql, (nome, valor, tipo, data, id_transacao))
-            self.connection.commit()
-            print('Transação atualizada com sucesso')
-        except sqlite3.Error as e:
-            print(f'Erro ao atualizar transação: {e}')   
-            
-    def delete_transacao(self, id_transacao):
-        try:
-            sql = '''
-                    DELETE FROM transacoes
-                    WHERE id_transacao = ?
-                  '''
-            self.cursor.execute(sql, (id_transacao,))
-            self.connection.commit()
-            print('Transação deletada com sucesso')
-        except sqlite3.Error as e:
-            print(f'Erro ao deletar transação: {e}')
-
-    def read_all(self):
-        try:
-            sql = '''SELECT * FROM transacoes'''
-            self.cursor.execute(sql)
-            rows = self.cursor.fetchall()
-            return rows
-        except sqlite3.Error as e:
-            print(f'Erro ao ler todas as transações: {e}')
-            return []
-
-    def read_one(self, id_transacao):
-        try:
-            sql = '''SELECT * FROM transacoes WHERE id_transacao = ?'''
-            self.cursor.execute(sql, (id_transacao,))
-            row = self.cursor.fetchone()
-            return row
-        except sqlite3.Error as e:
-            print(f'Erro ao ler transação: {e}')
-            return None
-
-    def read_data_por_ano(self, ano):
-        try:
-            query = "SELECT * FROM transacoes WHERE strftime('%Y', data) = ?"
-            self.cursor.execute(query, (str(ano),))
-            return self.cursor.fetchall()
-        except sqlite3.Error as e:
-            print(f'Erro ao ler transações por ano: {e}')
-            return []
-
-    def read_data_por_mes(self, ano, mes):
-        try:
-            query = "SELECT * FROM transacoes WHERE strftime('%Y', data) = ? AND strftime('%m', data) = ?"
-            self.cursor.execute(query, (str(ano), str(mes).zfill(2)))
-            return self.cursor.fetchall()
-        except sqlite3.Error as e:
-            print(f'Erro ao ler transações por mês: {e}')
-            return []
-
-    def read_data_por_dia(self, data_pesquisa):
-        try:
-            query = "SELECT * FROM transacoes WHERE data = ?"
-            self.cursor.execute(query, (data_pesquisa,))
-            return self.cursor.fetchall()
-        except sqlite3.Error as e:
-            print(f'Erro ao ler transações por dia: {e}')
-            return []
-
-    def close(self):
-        if self.connection:
-            self.connection.close()
-            print('Conexão fechada com sucesso')
-        else:
-            print('Nenhuma conexão ativa para fechar')
-
-    def calcular_total_por_periodo(self, periodo):
-        try:
-            query = f"""
-                SELECT strftime('{periodo}', data) AS period, 
-                       id_transacao, valor, nome_transacao, tipo_transacao, data,
-                       SUM(CASE WHEN tipo_transacao = 'entrada' THEN valor ELSE -valor END) AS total
-                FROM transacoes
-                GROUP BY period
-            """
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            return results
-        except sqlite3.Error as e:
-            print(f'Erro ao calcular total por período: {e}')
-            return []
-
-    def calcular_total_semanal(self):
-        return self.calcular_total_por_periodo('%Y-%W')
-
-    def calcular_total_mensal(self):
-        return self.calcular_total_por_periodo('%Y-%m')
-
-    def calcular_total_anual(self):
-        return self.calcular_total_por_periodo('%Y')
-
-def save_dataframe_as_pdf(df, filename):
-    # Ensure the directory exists
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-    fig, ax = plt.subplots(figsize=(12, 6))  # Adjust size for more columns
-    ax.axis('tight')
-    ax.axis('off')
-    table(ax, df, loc='center', cellLoc='center', colWidths=[0.1]*len(df.columns))  # where df is your data frame
-
-    # Save the figure
-    plt.savefig(f"{filename}.png")
-
-    # Create PDF
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.image(f"{filename}.png", x=10, y=10, w=190)
-    pdf.output(f"{filename}.pdf", "F")
-
-if __name__ == '__main__':
-    conexao = Conexao()
-    conexao.create_table()
-    
-    # Inserir transações de entrada e saída
-    conexao.insert_transacao(5000, 'Entrada 1', 'entrada', '2024-01-01')
-    conexao.insert_transacao(5000, 'Entrada 2', 'entrada', '2024-05-01')
-    conexao.insert_transacao(5000, 'Entrada 3', 'entrada', '2024-09-01')
-    conexao.insert_transacao(2000, 'Saída 1', 'saida', '2024-03-01')
-    conexao.insert_transacao(3000, 'Saída 2', 'saida', '2024-07-01')
-    
-    # Calcular e imprimir os totais
-    transacoes_semanal = conexao.calcular_total_semanal()
-    transacoes_mensal = conexao.calcular_total_mensal()
-    transacoes_anual = conexao.calcular_total_anual()
-    
-    # Criar tabelas para exibir os resultados
-    df_semanal = pd.DataFrame(transacoes_semanal, columns=['Semana', 'ID Transacao', 'Valor', 'Nome Transacao', 'Tipo Transacao', 'Data', 'Total'])
-    df_mensal = pd.DataFrame(transacoes_mensal, columns=['Mes', 'ID Transacao', 'Valor', 'Nome Transacao', 'Tipo Transacao', 'Data', 'Total'])
-    df_anual = pd.DataFrame(transacoes_anual, columns=['Ano', 'ID Transacao', 'Valor', 'Nome Transacao', 'Tipo Transacao', 'Data', 'Total'])
-    
-    print('Totais Semanais:')
-    print(df_semanal)
-    print('\nTotais Mensais:')
-    print(df_mensal)
-    print('\nTotais Anuais:')
-    print(df_anual)
-    
-    # Save DataFrames as PDF
-    save_dataframe_as_pdf(df_semanal, 'C:\\Users\\Arthur\\OneDrive\\Documentos\\totais_semanal')
-    save_dataframe_as_pdf(df_mensal, 'C:\\Users\\Arthur\\OneDrive\\Documentos\\totais_mensal')
-    save_dataframe_as_pdf(df_anual, 'C:\\Users\\Arthur\\OneDrive\\Documentos\\totais_anual')
-
-    
-    conexao.close()
\ No newline at end of file
+import os
+import csv
+import bisect
+import time
+import atexit
+import sqlite3
+import datetime
+import itertools
+import decimal
+import threading
+import functools
+from collections import OrderedDict
+from contextlib import contextmanager
+import importacao
+import migracoes
+import particoes
+import registros
+from fila_escrita import FilaEscrita
+from instrumentacao import medir, registrar_erro
+
+# HUGOBANCO_BANCO aponta para outro arquivo (ex.: uma cópia usada em benchmarks)
+CAMINHO_BANCO = os.environ.get('HUGOBANCO_BANCO', "hugobanco.db")
+
+# Pragmas aplicados em toda conexão aberta pelo pool
+PRAGMAS_PADRAO = {
+    'journal_mode': 'WAL',        # leitores não bloqueiam o escritor
+    'synchronous': 'NORMAL',      # seguro com WAL e bem mais barato que FULL
+    'cache_size': -20000,         # ~20 MB de cache de páginas por conexão
+    'mmap_size': 268435456,       # 256 MB mapeados em memória
+    'temp_store': 'MEMORY',       # ordenações e tabelas temporárias em memória
+    'busy_timeout': 5000,         # espera até 5 s por um lock antes de falhar
+}
+
+
+class CacheLeituras:
+    """Cache LRU de resultados de leitura, válido para uma versão dos dados.
+
+    Cada entrada guarda a ``versao_dados`` do pool no momento da consulta; uma
+    entrada de versão anterior é tratada como ausente, então uma leitura feita
+    depois de uma escrita nunca devolve dados velhos, seja a escrita deste
+    processo ou de outro (ver PoolConexoes.versao_atual). O tamanho
+    é limitado pelo número de entradas e pelo total de linhas guardadas
+    (``max_entradas=0`` desliga o cache).
+    """
+
+    def __init__(self, max_entradas=256, max_linhas=100_000):
+        self.max_entradas = max_entradas
+        self.max_linhas = max_linhas
+        self.acertos = 0
+        self.falhas = 0
+        self._entradas = OrderedDict()  # chave -> (versao, valor, linhas)
+        self._linhas = 0
+        self._lock = threading.Lock()
+
+    def obter(self, chave, versao):
+        """(True, valor) se houver resultado guardado para ``versao``, senão (False, None)."""
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and entrada[0] == versao:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+                return True, entrada[1]
+            if entrada is not None:
+                self._remover(chave)
+            self.falhas += 1
+            return False, None
+
+    def guardar(self, chave, versao, valor):
+        linhas = len(valor) if isinstance(valor, list) else 1
+        if linhas > self.max_linhas or self.max_entradas <= 0:
+            return
+        with self._lock:
+            if chave in self._entradas:
+                self._remover(chave)
+            self._entradas[chave] = (versao, valor, linhas)
+            self._linhas += linhas
+            while len(self._entradas) > self.max_entradas or self._linhas > self.max_linhas:
+                self._remover(next(iter(self._entradas)))
+
+    def _remover(self, chave):
+        self._linhas -= self._entradas.pop(chave)[2]
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._linhas = 0
+
+    def estatisticas(self):
+        with self._lock:
+            consultas = self.acertos + self.falhas
+            return {
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+                'entradas': len(self._entradas),
+                'linhas': self._linhas,
+                'max_entradas': self.max_entradas,
+                'max_linhas': self.max_linhas,
+            }
+
+
+class PoolConexoes:
+    """Mantém conexões SQLite abertas e reaproveitadas entre as ações da interface.
+
+    As conexões ociosas ficam guardadas (até ``tamanho_maximo``) e são entregues
+    já com os pragmas aplicados, preservando o cache de páginas entre cliques.
+    Cada conexão é usada por uma thread de cada vez: quem chama ``obter`` tem
+    uso exclusivo dela até chamar ``devolver``.
+    """
+
+    def __init__(self, caminho=CAMINHO_BANCO, tamanho_maximo=4, pragmas=None, somente_leitura=False,
+                 cache_max_entradas=256, cache_max_linhas=100_000):
+        self.caminho = caminho
+        self.tamanho_maximo = tamanho_maximo
+        self.pragmas = dict(PRAGMAS_PADRAO, **(pragmas or {}))
+        self.somente_leitura = somente_leitura
+        self._livres = []
+        self._lock = threading.Lock()
+        self._fechado = False
+        self._esquema_verificado = somente_leitura
+        # Incrementado a cada escrita feita por uma Conexao deste pool ou vista
+        # pelo PRAGMA data_version; valores em cache guardam a versão em que
+        # foram calculados.
+        self.versao_dados = 0
+        self._data_version = {}  # conexão -> último PRAGMA data_version lido
+        self._saldo_cache = None
+        self.cache = CacheLeituras(cache_max_entradas, cache_max_linhas)
+        self._ouvintes = []
+        self._fila_escrita = None
+
+    def _abrir(self):
+        if self.somente_leitura:
+            connection = sqlite3.connect(f'file:{self.caminho}?mode=ro', uri=True, check_same_thread=False)
+        else:
+            # uri=True para que as partições por ano possam ser anexadas somente leitura
+            connection = sqlite3.connect(self.caminho, uri=True, check_same_thread=False)
+        for nome, valor in self.pragmas.items():
+            try:
+                connection.execute(f'PRAGMA {nome} = {valor}')
+            except sqlite3.Error as e:
+                print(f'Não foi possível aplicar PRAGMA {nome}: {e}')
+        if not self._esquema_verificado:
+            # Atualiza bancos antigos no lugar antes do primeiro uso
+            migracoes.migrar(connection)
+            self._esquema_verificado = True
+        return connection
+
+    def obter(self):
+        with self._lock:
+            if self._fechado:
+                raise sqlite3.ProgrammingError('O pool de conexões já foi fechado')
+            if self._livres:
+                return self._livres.pop()
+        # Nenhuma conexão ociosa: abre uma nova fora do lock
+        return self._abrir()
+
+    def devolver(self, connection):
+        # Nunca devolve ao pool uma conexão com transação pendurada
+        if connection.in_transaction:
+            connection.rollback()
+        with self._lock:
+            if not self._fechado and len(self._livres) < self.tamanho_maximo:
+                self._livres.append(connection)
+                return
+            self._data_version.pop(connection, None)
+        connection.close()
+
+    def versao_atual(self, connection):
+        """``versao_dados`` depois de conferir se o banco mudou por fora deste pool.
+
+        O PRAGMA data_version de uma conexão muda quando outra conexão (de
+        outro processo, por exemplo) faz commit no banco. Se mudou desde a
+        última leitura nesta conexão, ou se a conexão ainda não foi vista, os
+        caches são invalidados como em uma escrita, mas sem avisar os ouvintes.
+        """
+        if connection is None:
+            return self.versao_dados
+        try:
+            data_version = connection.execute('PRAGMA data_version').fetchone()[0]
+        except sqlite3.Error:
+            return self.versao_dados
+        with self._lock:
+            if self._data_version.get(connection) == data_version:
+                return self.versao_dados
+            self._data_version[connection] = data_version
+            self.versao_dados += 1
+            self._saldo_cache = None
+            versao = self.versao_dados
+        self.cache.limpar()
+        return versao
+
+    def registrar_escrita(self, evento='lote', linha=None):
+        """Marca uma escrita: invalida os caches e avisa os ouvintes.
+
+        ``evento`` é 'inserida', 'atualizada' ou 'removida' com a ``linha``
+        afetada (a removida traz os valores antigos), ou 'lote' quando várias
+        linhas podem ter mudado.
+        """
+        with self._lock:
+            self.versao_dados += 1
+            self._saldo_cache = None
+            ouvintes = list(self._ouvintes)
+        # As entradas antigas já não seriam usadas; libera a memória agora
+        self.cache.limpar()
+        for ouvinte in ouvintes:
+            try:
+                ouvinte(evento, linha)
+            except Exception as e:  # um ouvinte com problema não desfaz a escrita
+                print(f'Erro ao notificar alteração: {e}')
+
+    def adicionar_ouvinte(self, funcao):
+        """Registra ``funcao(evento, linha)``, chamada na thread que fez a escrita."""
+        with self._lock:
+            self._ouvintes.append(funcao)
+
+    def remover_ouvinte(self, funcao):
+        with self._lock:
+            if funcao in self._ouvintes:
+                self._ouvintes.remove(funcao)
+
+    def fila_escrita(self, **opcoes):
+        """A fila de escrita com commit em grupo deste banco, criada no primeiro uso.
+
+        ``opcoes`` (janela_ms, max_lote, durabilidade) são repassadas na criação
+        e, se a fila já existir, passam a valer a partir do próximo lote.
+        """
+        if self.somente_leitura:
+            raise sqlite3.ProgrammingError('Pool somente leitura não aceita escritas')
+        with self._lock:
+            if self._fechado:
+                raise sqlite3.ProgrammingError('O pool de conexões já foi fechado')
+            if self._fila_escrita is None:
+                self._fila_escrita = FilaEscrita(
+                    self._abrir, self.registrar_escrita,
+                    **{nome: valor for nome, valor in opcoes.items() if valor is not None})
+                return self._fila_escrita
+        self._fila_escrita.configurar(**opcoes)
+        return self._fila_escrita
+
+    @contextmanager
+    def conexao(self):
+        connection = self.obter()
+        try:
+            yield connection
+        finally:
+            self.devolver(connection)
+
+    def fechar(self):
+        with self._lock:
+            self._fechado = True
+            livres, self._livres = self._livres, []
+            fila, self._fila_escrita = self._fila_escrita, None
+            self._data_version.clear()
+        if fila is not None:
+            fila.fechar()  # grava o que ainda estiver pendente
+        for connection in livres:
+            try:
+                if not self.somente_leitura:
+                    connection.execute('PRAGMA main.optimize')  # as partições são somente leitura
+                connection.close()
+            except sqlite3.Error as e:
+                print(f'Erro ao fechar conexão do pool: {e}')
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def obter_pool(caminho=CAMINHO_BANCO, somente_leitura=False):
+    """Retorna o pool compartilhado do processo para ``caminho``, criando-o se preciso."""
+    chave = (os.path.abspath(caminho), somente_leitura)
+    with _pools_lock:
+        pool = _pools.get(chave)
+        if pool is None or pool._fechado:
+            pool = PoolConexoes(caminho, somente_leitura=somente_leitura)
+            _pools[chave] = pool
+        return pool
+
+
+def fechar_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.fechar()
+
+
+atexit.register(fechar_pools)
+
+
+# valor é gravado em centavos inteiros (migração 4). A API do Conexao continua
+# recebendo e devolvendo reais: as escritas passam por para_centavos e as
+# leituras dividem por 100 só no resultado, então as somas no banco são
+# feitas sobre os inteiros.
+COLUNAS_TRANSACAO = 'id_transacao, valor / 100.0 AS valor, nome_transacao, tipo_transacao, data'
+
+# Formatos aceitos por Conexao.read_all (ver registros.py)
+FORMATOS_LEITURA = ('tuplas', 'registros', 'lote')
+
+# Escritas pontuais, compartilhadas pelos métodos síncronos e pela fila de escrita
+SQL_INSERIR = f'''
+        INSERT INTO transacoes(valor, nome_transacao, tipo_transacao, data)
+        VALUES(?, ?, ?, ?)
+        RETURNING {COLUNAS_TRANSACAO}
+      '''
+SQL_ATUALIZAR = f'''
+        UPDATE transacoes
+        SET nome_transacao = ?, valor = ?, tipo_transacao = ?, data = ?
+        WHERE id_transacao = ?
+        RETURNING {COLUNAS_TRANSACAO}
+      '''
+SQL_REMOVER = f'''
+        DELETE FROM transacoes
+        WHERE id_transacao = ?
+        RETURNING {COLUNAS_TRANSACAO}
+      '''
+
+
+def para_centavos(valor):
+    """Converte reais (float, int, Decimal ou texto '12.34') em centavos inteiros."""
+    if valor is None:
+        return None
+    centavos = decimal.Decimal(str(valor)).scaleb(2)
+    return int(centavos.quantize(decimal.Decimal(1), rounding=decimal.ROUND_HALF_UP))
+
+
+def para_data(data):
+    """Normaliza a data para AAAA-MM-DD (ex.: '01/02/2024', datetime.date).
+
+    Datas nulas ou em formato desconhecido são gravadas como vieram; essas
+    linhas ficam fora do resumo por período (ver migracoes._sql_acumular).
+    """
+    if data is None:
+        return None
+    texto = str(data)
+    if len(texto) == 10 and texto[4] == '-' and texto[7] == '-':
+        return texto  # já está no formato da tabela; evita o strptime no caminho comum
+    try:
+        return importacao.converter_data(texto)
+    except ValueError:
+        return data
+
+
+def para_reais(centavos):
+    return centavos / 100
+
+
+def _em_cache(metodo):
+    """Guarda o resultado do método no cache de leituras do pool (ver CacheLeituras).
+
+    As listas devolvidas são cópias rasas, então alterar o resultado não
+    altera o que ficou no cache.
+    """
+    nome = metodo.__name__
+
+    @functools.wraps(metodo)
+    def envolvido(self, *args, **kwargs):
+        chave = (nome, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(chave)
+        except TypeError:
+            return metodo(self, *args, **kwargs)
+        cache = self.pool.cache
+        # A versão é lida antes da consulta: se uma escrita terminar no meio,
+        # o resultado fica guardado com a versão antiga e não é reutilizado
+        versao = self.pool.versao_atual(self.connection)
+        encontrado, valor = cache.obter(chave, versao)
+        if not encontrado:
+            valor = metodo(self, *args, **kwargs)
+            cache.guardar(chave, versao, valor)
+        return list(valor) if isinstance(valor, list) else valor
+
+    return envolvido
+
+
+def consulta_fts(texto):
+    """Converte o texto digitado em uma consulta FTS5 de prefixos.
+
+    'merc pad' vira '"merc"* "pad"*': todas as palavras precisam aparecer,
+    cada uma podendo ser só o começo. Aspas e operadores digitados são
+    tratados como texto comum.
+    """
+    palavras = [palavra.replace('"', '') for palavra in texto.split()]
+    return ' '.join(f'"{palavra}"*' for palavra in palavras if palavra)
+
+
+def _montar_filtros(filtros, after_id=None, before_id=None, anos_arquivados=()):
+    """Monta a cláusula WHERE e os parâmetros para os filtros aceitos pelas leituras.
+
+    Chaves reconhecidas em ``filtros``: 'inicio' e 'fim' (datas ISO, intervalo
+    semiaberto inicio <= data < fim), 'tipo' ('entrada' ou 'saida') e 'nome'
+    (palavras ou começos de palavras do nome, buscadas no índice FTS5 do
+    principal e das partições de ``anos_arquivados``).
+    """
+    filtros = filtros or {}
+    condicoes, parametros = [], []
+    if after_id is not None:
+        condicoes.append('id_transacao > ?')
+        parametros.append(after_id)
+    if before_id is not None:
+        condicoes.append('id_transacao < ?')
+        parametros.append(before_id)
+    if filtros.get('inicio'):
+        condicoes.append('data >= ?')
+        parametros.append(str(filtros['inicio']))
+    if filtros.get('fim'):
+        condicoes.append('data < ?')
+        parametros.append(str(filtros['fim']))
+    if filtros.get('tipo'):
+        entrada = migracoes.EH_ENTRADA.format(linha='transacoes')
+        eh_entrada = filtros['tipo'].strip().lower() == 'entrada'
+        condicoes.append(entrada if eh_entrada else f'NOT ({entrada})')
+    consulta_nome = consulta_fts(filtros.get('nome') or '')
+    if consulta_nome:
+        condicoes.append(f'id_transacao IN ({particoes.subconsulta_busca(anos_arquivados)})')
+        parametros.extend([consulta_nome] * (1 + len(anos_arquivados)))
+    where = 'WHERE ' + ' AND '.join(condicoes) if condicoes else ''
+    return where, parametros
+
+
+class Conexao:
+    """Acesso à tabela de transações usando uma conexão emprestada do pool.
+
+    Pode ser usada como gerenciador de contexto; ao sair do bloco a conexão
+    volta para o pool em vez de ser fechada::
+
+        with Conexao() as conexao:
+            conexao.read_all()
+    """
+
+    def __init__(self, caminho=CAMINHO_BANCO, pool=None, somente_leitura=False):
+        self.pool = pool if pool is not None else obter_pool(caminho, somente_leitura)
+        # Anos arquivados em partições anexadas a esta conexão (ver particoes.py)
+        self.anos_arquivados = ()
+        self.connection = self.conectar()
+        self.cursor = self.connection.cursor() if self.connection else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def conectar(self):
+        try:
+            connection = self.pool.obter()
+        except sqlite3.Error as e:
+            print(f'Erro ao conectar ao banco de dados: {e}')
+            return None
+        try:
+            self.anos_arquivados = particoes.sincronizar(connection)
+        except sqlite3.Error as e:
+            print(f'Erro ao anexar as partições por ano: {e}')
+        return connection
+
+    def _fonte(self, inicio=None, fim=None):
+        """FROM das transações: o principal e só as partições com datas em [inicio, fim)."""
+        return particoes.fonte(self.anos_arquivados, inicio, fim)
+
+    def _consulta(self, filtros=None, after_id=None, before_id=None):
+        """(fonte, where, parametros) de uma leitura filtrada (ver _montar_filtros)."""
+        filtros = filtros or {}
+        inicio, fim = filtros.get('inicio'), filtros.get('fim')
+        anos = particoes.anos_no_intervalo(self.anos_arquivados, inicio, fim)
+        where, parametros = _montar_filtros(filtros, after_id, before_id, anos)
+        return self._fonte(inicio, fim), where, parametros
+
+    @medir
+    def create_table(self):
+        try:
+            sql = '''
+                    CREATE TABLE IF NOT EXISTS transacoes(
+                        id_transacao INTEGER PRIMARY KEY AUTOINCREMENT,
+                        valor INTEGER,  -- centavos
+                        nome_transacao VARCHAR(300),
+                        tipo_transacao VARCHAR(100),
+                        data VARCHAR(12)
+                    )'''
+            self.cursor.execute(sql)
+            self.connection.commit()
+            migracoes.migrar(self.connection)
+            print('Tabela criada com sucesso')
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao criar a tabela: {e}')
+
+    @medir
+    def insert_transacao(self, valor, nome, tipo, data):
+        """Insere a transação e retorna a linha gravada (com o id), ou None em caso de erro."""
+        try:
+            self.cursor.execute(SQL_INSERIR, (para_centavos(valor), nome, tipo, para_data(data)))
+            linha = self.cursor.fetchall()[0]
+            self.connection.commit()
+            self.pool.registrar_escrita('inserida', linha)
+            print('Transação inserida com sucesso')
+            return linha
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao inserir transação: {e}')
+            return None
+
+    @medir(capturar_sql=False)
+    def insert_many(self, transacoes, tamanho_lote=5000, ao_progredir=None):
+        """Insere um iterável de tuplas (valor, nome, tipo, data) em lotes.
+
+        Cada lote é gravado com um único executemany e um único commit. Aceita
+        geradores, então o arquivo de origem nunca precisa estar todo na memória.
+        ``ao_progredir(inseridas)`` é chamado após cada commit; se ele levantar
+        uma exceção a importação para ali, mantendo os lotes já gravados.
+        Retorna o número de transações inseridas.
+        """
+        sql = '''
+                INSERT INTO transacoes(valor, nome_transacao, tipo_transacao, data)
+                VALUES(?, ?, ?, ?)
+              '''
+        iterador = iter(transacoes)
+        inseridas = 0
+        inicio = time.perf_counter()
+        try:
+            while True:
+                lote = [(para_centavos(valor), nome, tipo, para_data(data))
+                        for valor, nome, tipo, data in itertools.islice(iterador, tamanho_lote)]
+                if not lote:
+                    break
+                with self.connection:  # commit no fim do lote, rollback em caso de erro
+                    self.cursor.executemany(sql, lote)
+                inseridas += len(lote)
+                if ao_progredir:
+                    ao_progredir(inseridas)
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao inserir lote de transações: {e}')
+        finally:
+            if inseridas:
+                self.pool.registrar_escrita()
+        duracao = time.perf_counter() - inicio
+        taxa = inseridas / duracao if duracao > 0 else 0.0
+        print(f'{inseridas} transações inseridas em {duracao:.2f} s ({taxa:.0f} transações/s)')
+        return inseridas
+
+    @medir(capturar_sql=False)
+    def import_file(self, caminho, tamanho_lote=5000, ao_progredir=None):
+        """Importa um extrato CSV ou OFX em streaming através de insert_many."""
+        extensao = os.path.splitext(caminho)[1].lower()
+        leitor = importacao.LEITORES.get(extensao)
+        if leitor is None:
+            print(f'Formato de arquivo não suportado: {extensao}')
+            return 0
+        return self.insert_many(leitor(caminho), tamanho_lote=tamanho_lote, ao_progredir=ao_progredir)
+
+    @medir(capturar_sql=False)
+    def export_file(self, caminho, formato=None, filtros=None, tamanho_lote=50_000, ao_progredir=None):
+        """Exporta as transações para CSV, JSON Lines ou Parquet em streaming.
+
+        O formato vem de ``formato`` ('csv', 'jsonl', 'parquet') ou da extensão
+        do arquivo. As linhas saem do cursor em lotes de ``tamanho_lote`` direto
+        para o arquivo, então a memória não cresce com o tamanho da extração.
+        ``filtros`` aceita as chaves de _montar_filtros (datas, tipo, nome).
+        O arquivo é escrito com o sufixo '.parcial' e renomeado só no fim, para
+        que um job que o leia nunca encontre uma extração pela metade.
+        ``ao_progredir(exportadas)`` é chamado após cada lote. Retorna o número
+        de transações exportadas.
+        """
+        formato = (formato or os.path.splitext(caminho)[1].lstrip('.')).lower()
+        exportador = EXPORTADORES.get(formato)
+        if exportador is None:
+            print(f'Formato de exportação não suportado: {formato}')
+            return 0
+        fonte, where, parametros = self._consulta(filtros)
+        parcial = f'{caminho}.parcial'
+        inicio = time.perf_counter()
+        cursor = self.connection.cursor()
+        try:
+            exportadas = exportador(cursor, where, parametros, parcial, tamanho_lote, ao_progredir, fonte)
+            os.replace(parcial, caminho)
+        except (sqlite3.Error, OSError, ImportError) as e:
+            registrar_erro(self)
+            print(f'Erro ao exportar transações: {e}')
+            if os.path.exists(parcial):
+                os.remove(parcial)
+            return 0
+        finally:
+            cursor.close()
+        duracao = time.perf_counter() - inicio
+        taxa = exportadas / duracao if duracao > 0 else 0.0
+        print(f'{exportadas} transações exportadas para {caminho} em {duracao:.2f} s ({taxa:.0f} transações/s)')
+        return exportadas
+
+    @medir
+    def update_transacao(self, id_transacao, nome, valor, tipo, data):
+        """Atualiza a transação e retorna a linha nova, ou None se o id não existir."""
+        try:
+            self.cursor.execute(SQL_ATUALIZAR, (nome, para_centavos(valor), tipo, para_data(data), id_transacao))
+            linhas = self.cursor.fetchall()
+            self.connection.commit()
+            if not linhas:
+                self._avisar_nao_encontrada(id_transacao)
+                return None
+            self.pool.registrar_escrita('atualizada', linhas[0])
+            print('Transação atualizada com sucesso')
+            return linhas[0]
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao atualizar transação: {e}')
+            return None
+
+    @medir
+    def delete_transacao(self, id_transacao):
+        """Remove a transação e retorna a linha removida, ou None se o id não existir."""
+        try:
+            self.cursor.execute(SQL_REMOVER, (id_transacao,))
+            linhas = self.cursor.fetchall()
+            self.connection.commit()
+            if not linhas:
+                self._avisar_nao_encontrada(id_transacao)
+                return None
+            self.pool.registrar_escrita('removida', linhas[0])
+            print('Transação deletada com sucesso')
+            return linhas[0]
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao deletar transação: {e}')
+            return None
+
+    def _avisar_nao_encontrada(self, id_transacao):
+        if self.anos_arquivados and self.read_one(id_transacao) is not None:
+            print(f'Transação {id_transacao} pertence a um ano arquivado e não pode ser alterada')
+        else:
+            print(f'Transação {id_transacao} não encontrada')
+
+    # --- Escritas pela fila com commit em grupo (ver fila_escrita.py) -----------
+    # Retornam um concurrent.futures.Future que resolve, depois do commit, com
+    # o mesmo valor do método síncrono correspondente (a linha, ou None se o id
+    # não existir) ou com a exceção sqlite3.Error da escrita.
+
+    def enviar_insercao(self, valor, nome, tipo, data):
+        return self.pool.fila_escrita().enviar(
+            SQL_INSERIR, (para_centavos(valor), nome, tipo, para_data(data)), 'inserida')
+
+    def enviar_atualizacao(self, id_transacao, nome, valor, tipo, data):
+        return self.pool.fila_escrita().enviar(
+            SQL_ATUALIZAR, (nome, para_centavos(valor), tipo, para_data(data), id_transacao), 'atualizada')
+
+    def enviar_exclusao(self, id_transacao):
+        return self.pool.fila_escrita().enviar(SQL_REMOVER, (id_transacao,), 'removida')
+
+    def configurar_fila(self, janela_ms=None, max_lote=None, durabilidade=None):
+        """Ajusta a janela (ms), o tamanho máximo do lote e a durabilidade
+        ('completa', 'normal' ou 'desligada') da fila de escrita do banco."""
+        return self.pool.fila_escrita(janela_ms=janela_ms, max_lote=max_lote, durabilidade=durabilidade)
+
+    def estatisticas_fila(self):
+        """Profundidade da fila, tamanho dos lotes e tempo de commit."""
+        return self.pool.fila_escrita().estatisticas()
+
+    @medir
+    def read_all(self, formato='tuplas'):
+        """Todas as transações, em ordem de id, em um dos FORMATOS_LEITURA.
+
+        'tuplas' é a lista de tuplas (id, valor, nome, tipo, data); 'registros'
+        a lista de registros.Transacao, com os mesmos campos em atributos; 'lote'
+        um registros.TransacaoBatch, com as colunas em buffers de array, que
+        ocupa uma fração da memória das outras duas.
+        """
+        if formato not in FORMATOS_LEITURA:
+            raise ValueError(f'Formato de leitura desconhecido: {formato}')
+        try:
+            if formato == 'lote':
+                return registros.ler_lote(self.cursor, fonte=self._fonte())
+            # Sem partições a ordem de id sai da própria tabela, sem ordenação;
+            # com elas, o ORDER BY intercala o principal e os anos arquivados
+            sql = f'''SELECT {COLUNAS_TRANSACAO} FROM {self._fonte()} ORDER BY id_transacao'''
+            cursor = self.cursor
+            if formato == 'registros':
+                cursor = self.connection.cursor()
+                cursor.row_factory = registros.fabrica_registros()
+            try:
+                cursor.execute(sql)
+                return cursor.fetchall()
+            finally:
+                if cursor is not self.cursor:
+                    cursor.close()
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao ler todas as transações: {e}')
+            return registros.TransacaoBatch() if formato == 'lote' else []
+
+    @medir
+    def read_columns(self, filtros=None, tamanho_lote=100_000):
+        """Transações em arrays NumPy tipados (ver analise.ColunasTransacoes).
+
+        A tabela é percorrida em lotes de ``tamanho_lote`` linhas, sem montar a
+        lista de tuplas de read_all. As agregações vetorizadas ficam em analise.py.
+        """
+        import analise  # NumPy só é carregado quando o caminho colunar é usado
+        fonte, where, parametros = self._consulta(filtros)
+        try:
+            return analise.ler_colunas(self.cursor, where, parametros, tamanho_lote, fonte)
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao ler transações em colunas: {e}')
+            return None
+
+    @medir
+    @_em_cache
+    def read_one(self, id_transacao):
+        try:
+            sql = f'''SELECT {COLUNAS_TRANSACAO} FROM transacoes WHERE id_transacao = ?'''
+            self.cursor.execute(sql, (id_transacao,))
+            row = self.cursor.fetchone()
+            if row is None and self.anos_arquivados:
+                # Quase toda consulta por id é de uma linha recente; só então as partições
+                sql = f'''SELECT {COLUNAS_TRANSACAO} FROM {self._fonte()} WHERE id_transacao = ?'''
+                self.cursor.execute(sql, (id_transacao,))
+                row = self.cursor.fetchone()
+            return row
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao ler transação: {e}')
+            return None
+
+    @medir
+    def contar_transacoes(self, filtros=None, before_id=None):
+        """Quantidade de transações que atendem aos filtros (ver _montar_filtros).
+
+        Com ``before_id`` conta só as de id menor, ou seja, a posição desse id
+        na listagem ordenada por id.
+        """
+        fonte, where, parametros = self._consulta(filtros, before_id=before_id)
+        query = f'SELECT COUNT(*) FROM {fonte} {where}'
+        if self.anos_arquivados:
+            # Sobre a união o SQLite percorre todas as linhas; somando a
+            # contagem de cada tabela ele conta cada uma pelo menor índice
+            filtros = filtros or {}
+            tabelas = particoes.tabelas(self.anos_arquivados, filtros.get('inicio'), filtros.get('fim'))
+            contagens = [f'SELECT COUNT(*) AS n FROM {tabela} AS transacoes {where}' for tabela in tabelas]
+            query = f"SELECT SUM(n) FROM ({' UNION ALL '.join(contagens)})"
+            parametros = parametros * len(contagens)
+        try:
+            self.cursor.execute(query, parametros)
+            return self.cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao contar transações: {e}')
+            return 0
+
+    @medir
+    def read_janela(self, limite, after_id=None, offset=0, filtros=None):
+        """Até ``limite`` transações em ordem de id.
+
+        Com ``after_id`` a janela começa logo após esse id (paginação por chave,
+        custo independente da posição); sem ele, pula ``offset`` linhas.
+        """
+        fonte, where, parametros = self._consulta(filtros, after_id=after_id)
+        query = f'SELECT {COLUNAS_TRANSACAO} FROM {fonte} {where} ORDER BY id_transacao LIMIT ? OFFSET ?'
+        try:
+            self.cursor.execute(query, parametros + [limite, 0 if after_id is not None else offset])
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao ler janela de transações: {e}')
+            return []
+
+    @medir
+    def read_page(self, after_id=None, limite=500, filtros=None):
+        """Próxima página de até ``limite`` transações com id maior que ``after_id``.
+
+        Usa ``WHERE id_transacao > ? ORDER BY id_transacao LIMIT ?``, que desce
+        direto pela chave primária: o custo não depende de quantas páginas já
+        foram lidas. Passe o id da última linha da página anterior para seguir.
+        """
+        return self.read_janela(limite, after_id=after_id, filtros=filtros)
+
+    def iter_transacoes(self, tamanho_lote=1000, after_id=None, filtros=None):
+        """Gera as transações em ordem de id, buscando ``tamanho_lote`` linhas por vez.
+
+        Uma única consulta é percorrida com fetchmany em um cursor próprio, então
+        a memória fica limitada ao lote atual mesmo em dezenas de milhões de
+        linhas, e as outras leituras deste Conexao podem ser usadas no meio da
+        iteração. ``filtros`` aceita as chaves de _montar_filtros.
+        """
+        fonte, where, parametros = self._consulta(filtros, after_id=after_id)
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f'SELECT {COLUNAS_TRANSACAO} FROM {fonte} {where} ORDER BY id_transacao',
+                           parametros)
+            while True:
+                lote = cursor.fetchmany(tamanho_lote)
+                if not lote:
+                    break
+                yield from lote
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao percorrer transações: {e}')
+        finally:
+            cursor.close()
+
+    @medir
+    def pesquisar_por_nome(self, texto, limite=200):
+        """Transações cujo nome contém palavras começando com os termos de ``texto``.
+
+        Usa o índice FTS5 (sem diferenciar maiúsculas nem acentos), então o
+        custo depende do número de resultados e não do tamanho da tabela.
+        """
+        consulta = consulta_fts(texto)
+        if not consulta:
+            return []
+        if self.anos_arquivados:
+            return self.read_janela(-1 if limite is None else limite, filtros={'nome': texto})
+        query = '''
+            SELECT t.id_transacao, t.valor / 100.0, t.nome_transacao, t.tipo_transacao, t.data
+            FROM transacoes_fts
+            JOIN transacoes AS t ON t.id_transacao = transacoes_fts.rowid
+            WHERE transacoes_fts MATCH ?
+            ORDER BY t.id_transacao
+            LIMIT ?
+        '''
+        try:
+            self.cursor.execute(query, (consulta, -1 if limite is None else limite))
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao pesquisar transações por nome: {e}')
+            return []
+
+    @medir
+    def read_intervalo(self, inicio, fim):
+        """Transações com inicio <= data < fim (datas ISO), usando o índice de data."""
+        query = (f"SELECT {COLUNAS_TRANSACAO} FROM {self._fonte(inicio, fim)} "
+                 "WHERE data >= ? AND data < ? ORDER BY data, id_transacao")
+        self.cursor.execute(query, (inicio, fim))
+        return self.cursor.fetchall()
+
+    @medir
+    @_em_cache
+    def read_data_por_ano(self, ano):
+        try:
+            ano = int(ano)
+            return self.read_intervalo(f'{ano:04d}-01-01', f'{ano + 1:04d}-01-01')
+        except (ValueError, TypeError):
+            print(f'Ano inválido: {ano!r}')
+            return []
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao ler transações por ano: {e}')
+            return []
+
+    @medir
+    @_em_cache
+    def read_data_por_mes(self, ano, mes):
+        try:
+            ano, mes = int(ano), int(mes)
+            proximo_ano, proximo_mes = (ano + 1, 1) if mes == 12 else (ano, mes + 1)
+            return self.read_intervalo(f'{ano:04d}-{mes:02d}-01', f'{proximo_ano:04d}-{proximo_mes:02d}-01')
+        except (ValueError, TypeError):
+            print(f'Mês inválido: {ano!r}/{mes!r}')
+            return []
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao ler transações por mês: {e}')
+            return []
+
+    @medir
+    @_em_cache
+    def read_data_por_dia(self, data_pesquisa):
+        try:
+            # Aceita também DD/MM/AAAA, como as escritas (para_data)
+            dia = datetime.date.fromisoformat(str(para_data(data_pesquisa))[:10])
+            return self.read_intervalo(dia.isoformat(), (dia + datetime.timedelta(days=1)).isoformat())
+        except ValueError:
+            print(f'Data inválida: {data_pesquisa!r}')
+            return []
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao ler transações por dia: {e}')
+            return []
+
+    def close(self):
+        if self.connection:
+            self.cursor.close()
+            self.pool.devolver(self.connection)
+            self.connection = None
+            self.cursor = None
+        else:
+            print('Nenhuma conexão ativa para fechar')
+
+    @medir
+    @_em_cache
+    def calcular_total_por_periodo(self, periodo):
+        """Totais por período como tuplas (periodo, entradas, saidas, total).
+
+        ``periodo`` é o nome da granularidade ('dia', 'semana', 'mes', 'ano') ou o
+        formato strftime correspondente. Os valores vêm da tabela resumo_periodos,
+        mantida por gatilhos a cada escrita, então a consulta não varre transacoes.
+        """
+        formatos = {formato: nome for nome, formato in migracoes.GRANULARIDADES.items()}
+        granularidade = formatos.get(periodo, periodo)
+        try:
+            if granularidade in migracoes.GRANULARIDADES:
+                query = """
+                    SELECT periodo, entradas / 100.0, saidas / 100.0, total / 100.0
+                    FROM resumo_periodos
+                    WHERE granularidade = ?
+                    ORDER BY periodo
+                """
+                self.cursor.execute(query, (granularidade,))
+            else:
+                # Formato arbitrário: agrega direto da tabela de transações
+                entrada = migracoes.EH_ENTRADA.format(linha='transacoes')
+                query = f"""
+                    SELECT strftime(?, data) AS periodo,
+                           SUM(CASE WHEN {entrada} THEN valor ELSE 0 END) / 100.0,
+                           SUM(CASE WHEN {entrada} THEN 0 ELSE valor END) / 100.0,
+                           SUM(CASE WHEN {entrada} THEN valor ELSE -valor END) / 100.0
+                    FROM {self._fonte()}
+                    GROUP BY periodo
+                    ORDER BY periodo
+                """
+                self.cursor.execute(query, (periodo,))
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao calcular total por período: {e}')
+            return []
+
+    @medir
+    def calcular_totais(self, filtros=None):
+        """(entradas, saidas, total) das transações que atendem aos filtros."""
+        fonte, where, parametros = self._consulta(filtros)
+        entrada = migracoes.EH_ENTRADA.format(linha='transacoes')
+        query = f"""
+            SELECT COALESCE(SUM(CASE WHEN {entrada} THEN valor ELSE 0 END), 0) / 100.0,
+                   COALESCE(SUM(CASE WHEN {entrada} THEN 0 ELSE valor END), 0) / 100.0,
+                   COALESCE(SUM(CASE WHEN {entrada} THEN valor ELSE -valor END), 0) / 100.0
+            FROM {fonte} {where}
+        """
+        try:
+            self.cursor.execute(query, parametros)
+            return self.cursor.fetchone()
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao calcular totais: {e}')
+            return 0.0, 0.0, 0.0
+
+    @medir
+    def saldo(self, ate=None):
+        """Saldo líquido (entradas - saídas), opcionalmente até a data ``ate`` inclusive.
+
+        Sem data, soma os totais anuais de resumo_periodos e guarda o resultado
+        no pool até a próxima escrita (deste ou de outro processo). Com data, usa o índice de saldo diário
+        (ver _saldo_centavos), sem percorrer transacoes.
+        """
+        versao = self.pool.versao_atual(self.connection)
+        if ate is None:
+            versao_cache, saldo = self.pool._saldo_cache or (None, None)
+            if versao_cache == versao:
+                return saldo
+        try:
+            if ate is None:
+                self.cursor.execute(
+                    "SELECT COALESCE(SUM(total), 0) / 100.0 FROM resumo_periodos WHERE granularidade = 'ano'")
+                saldo = self.cursor.fetchone()[0]
+                with self.pool._lock:
+                    if self.pool.versao_dados == versao:
+                        self.pool._saldo_cache = (versao, saldo)
+                return saldo
+            return self._saldo_centavos(datetime.date.fromisoformat(str(ate)[:10])) / 100
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao calcular saldo: {e}')
+            return 0.0
+
+    def _saldo_centavos(self, dia):
+        """Saldo em centavos ao fim do dia ``dia`` (datetime.date).
+
+        resumo_periodos funciona como um índice de somas de prefixo em três
+        níveis: os anos anteriores, os meses fechados do ano e os dias do mês
+        até ``dia``. São no máximo algumas dezenas de linhas lidas por faixas da
+        chave primária, qualquer que seja o número de transações.
+        """
+        self.cursor.execute("""
+            SELECT (SELECT COALESCE(SUM(total), 0) FROM resumo_periodos
+                    WHERE granularidade = 'ano' AND periodo < :ano)
+                 + (SELECT COALESCE(SUM(total), 0) FROM resumo_periodos
+                    WHERE granularidade = 'mes' AND periodo >= :ano AND periodo < :mes)
+                 + (SELECT COALESCE(SUM(total), 0) FROM resumo_periodos
+                    WHERE granularidade = 'dia' AND periodo >= :mes AND periodo <= :dia)
+        """, {'ano': f'{dia.year:04d}', 'mes': f'{dia.year:04d}-{dia.month:02d}', 'dia': dia.isoformat()})
+        return self.cursor.fetchone()[0]
+
+    @medir(capturar_sql=False)
+    def variacao(self, de, ate):
+        """Variação do saldo entre as datas ``de`` e ``ate``, ambas inclusive."""
+        try:
+            inicio = datetime.date.fromisoformat(str(de)[:10])
+            fim = datetime.date.fromisoformat(str(ate)[:10])
+            return (self._saldo_centavos(fim) - self._saldo_centavos(inicio - datetime.timedelta(days=1))) / 100
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao calcular variação do saldo: {e}')
+            return 0.0
+
+    @medir(capturar_sql=False)
+    def saldos_acumulados(self, linhas):
+        """Saldo acumulado logo após cada transação de ``linhas``, na mesma ordem.
+
+        O saldo segue a ordem cronológica (data, id), seja qual for a ordem de
+        ``linhas``. O saldo no início de cada dia vem do índice de saldo diário
+        e só as transações do mesmo dia anteriores a cada linha são somadas, em
+        uma consulta, então o custo depende do tamanho da página e não da
+        tabela. Linhas sem data válida ficam com None.
+        """
+        datas = {}
+        for linha in linhas:
+            try:
+                datas[linha[0]] = datetime.date.fromisoformat(str(linha[4])[:10]).isoformat()
+            except ValueError:
+                pass
+        if not datas:
+            return [None] * len(linhas)
+        dias = sorted(set(datas.values()))
+        try:
+            # Saldo no início de cada dia: o saldo da véspera do primeiro dia
+            # mais os totais diários até a véspera de cada um
+            acumulado = self._saldo_centavos(datetime.date.fromisoformat(dias[0]) - datetime.timedelta(days=1))
+            self.cursor.execute("""
+                SELECT periodo, total FROM resumo_periodos
+                WHERE granularidade = 'dia' AND periodo >= ? AND periodo < ?
+                ORDER BY periodo
+            """, (dias[0], dias[-1]))
+            periodos, totais = list(zip(*self.cursor.fetchall())) or ((), ())
+            prefixos = [0, *itertools.accumulate(totais)]
+            inicio_dia = {dia: acumulado + prefixos[bisect.bisect_left(periodos, dia)] for dia in dias}
+
+            # Soma das transações do mesmo dia até cada id pedido. Cada soma é
+            # uma faixa (data, id) do índice idx_transacoes_data; com partições,
+            # uma subconsulta por tabela, porque o SQLite não leva a condição
+            # correlacionada para dentro da visão com UNION ALL
+            entrada = migracoes.EH_ENTRADA.format(linha='transacoes')
+            proximo = (datetime.date.fromisoformat(dias[-1]) + datetime.timedelta(days=1)).isoformat()
+            somas = ' + '.join(f"""
+                COALESCE((SELECT SUM(CASE WHEN {entrada} THEN valor ELSE -valor END)
+                          FROM {tabela} AS transacoes
+                          WHERE transacoes.data = pedidos.data AND transacoes.id_transacao <= pedidos.id), 0)"""
+                for tabela in particoes.tabelas(self.anos_arquivados, dias[0], proximo))
+            self.cursor.execute(f"""
+                WITH pedidos(id, data) AS (VALUES {', '.join(['(?, ?)'] * len(datas))})
+                SELECT id, {somas}
+                FROM pedidos
+            """, [valor for par in datas.items() for valor in par])
+            no_dia = dict(self.cursor.fetchall())
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao calcular saldos acumulados: {e}')
+            return [None] * len(linhas)
+        saldos = []
+        for linha in linhas:
+            dia = datas.get(linha[0])
+            saldos.append(None if dia is None else (inicio_dia[dia] + no_dia.get(linha[0], 0)) / 100)
+        return saldos
+
+    @medir(capturar_sql=False)
+    def reconstruir_resumo(self):
+        """Recalcula do zero a tabela de resumo por período (comando de recuperação)."""
+        try:
+            with self.connection:
+                migracoes.reconstruir_resumo(self.connection, self._fonte())
+            self.pool.registrar_escrita()
+            print('Resumo por período reconstruído com sucesso')
+        except sqlite3.Error as e:
+            registrar_erro(self)
+            print(f'Erro ao reconstruir o resumo por período: {e}')
+
+    @medir(capturar_sql=False)
+    def arquivar_ano(self, ano):
+        """Move um ano fechado para uma partição somente leitura (ver particoes.arquivar_ano).
+
+        Retorna o número de transações movidas, ou 0 se o ano não pôde ser arquivado.
+        """
+        try:
+            linhas = particoes.arquivar_ano(self.connection, ano)
+        except (ValueError, sqlite3.Error, OSError) as e:
+            registrar_erro(self)
+            print(f'Erro ao arquivar o ano {ano}: {e}')
+            return 0
+        self.anos_arquivados = particoes.sincronizar(self.connection)
+        self.pool.registrar_escrita()
+        print(f'{linhas} transações de {ano} arquivadas')
+        return linhas
+
+    @medir(capturar_sql=False)
+    def restaurar_ano(self, ano):
+        """Devolve um ano arquivado ao banco principal; retorna as transações restauradas."""
+        try:
+            linhas = particoes.restaurar_ano(self.connection, ano)
+        except (ValueError, sqlite3.Error) as e:
+            registrar_erro(self)
+            print(f'Erro ao restaurar o ano {ano}: {e}')
+            return 0
+        self.anos_arquivados = particoes.sincronizar(self.connection)
+        self.pool.registrar_escrita()
+        print(f'{linhas} transações de {ano} restauradas')
+        return linhas
+
+    def listar_particoes(self):
+        """[(ano, arquivo, linhas, arquivado_em)] dos anos arquivados."""
+        return particoes.registradas(self.connection)
+
+    def estatisticas_cache(self):
+        """Acertos, falhas e ocupação do cache de leituras do pool."""
+        return self.pool.cache.estatisticas()
+
+    def calcular_total_semanal(self):
+        return self.calcular_total_por_periodo('%Y-%W')
+
+    def calcular_total_mensal(self):
+        return self.calcular_total_por_periodo('%Y-%m')
+
+    def calcular_total_anual(self):
+        return self.calcular_total_por_periodo('%Y')
+
+def save_dataframe_as_pdf(df, filename):
+    # A tabela é escrita com texto vetorial do FPDF, em várias páginas se preciso,
+    # sem passar por figura do matplotlib nem PNG temporário
+    from relatorios import salvar_dataframe_pdf
+    caminho_pdf = filename if filename.lower().endswith('.pdf') else f"{filename}.pdf"
+    return salvar_dataframe_pdf(df, caminho_pdf, titulo=os.path.splitext(os.path.basename(caminho_pdf))[0])
+
+
+# --- Exportação ----------------------------------------------------------------
+# Cada exportador recebe um cursor próprio, a cláusula WHERE já montada e grava
+# lote a lote. A formatação é feita pelo SQLite sempre que possível, para que o
+# Python só copie texto pronto para o arquivo.
+
+CABECALHO_EXPORTACAO = ['id_transacao', 'valor', 'nome_transacao', 'tipo_transacao', 'data']
+
+
+def _percorrer(cursor, sql, parametros, tamanho_lote, ao_progredir):
+    """Gera os lotes da consulta, informando o total exportado após cada um."""
+    cursor.execute(sql, parametros)
+    exportadas = 0
+    while True:
+        lote = cursor.fetchmany(tamanho_lote)
+        if not lote:
+            break
+        yield lote
+        exportadas += len(lote)
+        if ao_progredir:
+            ao_progredir(exportadas)
+
+
+def _exportar_csv(cursor, where, parametros, caminho, tamanho_lote, ao_progredir, fonte='transacoes'):
+    # Separador ',' e ponto decimal; o cabeçalho é reconhecido por importacao.ler_csv
+    sql = f'''
+        SELECT id_transacao, printf('%.2f', valor / 100.0), nome_transacao, tipo_transacao, data
+        FROM {fonte} {where} ORDER BY id_transacao
+    '''
+    exportadas = 0
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(CABECALHO_EXPORTACAO)
+        for lote in _percorrer(cursor, sql, parametros, tamanho_lote, ao_progredir):
+            escritor.writerows(lote)
+            exportadas += len(lote)
+    return exportadas
+
+
+def _exportar_jsonl(cursor, where, parametros, caminho, tamanho_lote, ao_progredir, fonte='transacoes'):
+    # Cada linha do arquivo é um objeto JSON montado pelo próprio SQLite
+    sql = f'''
+        SELECT json_object('id_transacao', id_transacao, 'valor', valor / 100.0,
+                           'nome_transacao', nome_transacao, 'tipo_transacao', tipo_transacao,
+                           'data', data)
+        FROM {fonte} {where} ORDER BY id_transacao
+    '''
+    exportadas = 0
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for lote in _percorrer(cursor, sql, parametros, tamanho_lote, ao_progredir):
+            arquivo.write('\n'.join(linha for linha, in lote))
+            arquivo.write('\n')
+            exportadas += len(lote)
+    return exportadas
+
+
+def _exportar_parquet(cursor, where, parametros, caminho, tamanho_lote, ao_progredir, fonte='transacoes'):
+    # pyarrow é opcional: só é necessário para este formato
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # valor em decimal(18, 2) montado direto dos centavos inteiros (sem float)
+    # e data como date32 a partir dos dias desde 1970
+    esquema = pa.schema([
+        ('id_transacao', pa.int64()),
+        ('valor', pa.decimal128(18, 2)),
+        ('nome_transacao', pa.string()),
+        ('tipo_transacao', pa.string()),
+        ('data', pa.date32()),
+    ])
+    sql = f'''
+        SELECT id_transacao, valor, nome_transacao, tipo_transacao,
+               CAST(julianday(data) - 2440587.5 AS INTEGER)
+        FROM {fonte} {where} ORDER BY id_transacao
+    '''
+    exportadas = 0
+    with pq.ParquetWriter(caminho, esquema) as escritor:
+        for lote in _percorrer(cursor, sql, parametros, tamanho_lote, ao_progredir):
+            ids, centavos, nomes, tipos, dias = zip(*lote)
+            centavos = pa.array(centavos, pa.int64())
+            # decimal128 guarda inteiros de 128 bits: parte baixa + extensão de sinal
+            valores = np.empty((len(centavos), 2), dtype=np.int64)
+            valores[:, 0] = centavos.fill_null(0).to_numpy()
+            valores[:, 1] = valores[:, 0] >> 63
+            valor = pa.Array.from_buffers(pa.decimal128(18, 2), len(centavos),
+                                          [centavos.buffers()[0], pa.py_buffer(valores)],
+                                          null_count=centavos.null_count)
+            escritor.write_table(pa.Table.from_arrays([
+                pa.array(ids, pa.int64()),
+                valor,
+                pa.array(nomes, pa.string()),
+                pa.array(tipos, pa.string()),
+                pa.array(dias, pa.int32()).cast(pa.date32()),
+            ], schema=esquema))
+            exportadas += len(lote)
+    return exportadas
+
+
+EXPORTADORES = {
+    'csv': _exportar_csv,
+    'jsonl': _exportar_jsonl,
+    'parquet': _exportar_parquet,
+}
+
+
+def _demonstracao(diretorio_saida):
+    import pandas as pd
+
+    conexao = Conexao()
+    conexao.create_table()
+
+    # Inserir transações de entrada e saída
+    conexao.insert_transacao(5000, 'Entrada 1', 'entrada', '2024-01-01')
+    conexao.insert_transacao(5000, 'Entrada 2', 'entrada', '2024-05-01')
+    conexao.insert_transacao(5000, 'Entrada 3', 'entrada', '2024-09-01')
+    conexao.insert_transacao(2000, 'Saída 1', 'saida', '2024-03-01')
+    conexao.insert_transacao(3000, 'Saída 2', 'saida', '2024-07-01')
+
+    # Calcular e imprimir os totais
+    transacoes_semanal = conexao.calcular_total_semanal()
+    transacoes_mensal = conexao.calcular_total_mensal()
+    transacoes_anual = conexao.calcular_total_anual()
+
+    # Criar tabelas para exibir os resultados
+    df_semanal = pd.DataFrame(transacoes_semanal, columns=['Semana', 'Entradas', 'Saidas', 'Total'])
+    df_mensal = pd.DataFrame(transacoes_mensal, columns=['Mes', 'Entradas', 'Saidas', 'Total'])
+    df_anual = pd.DataFrame(transacoes_anual, columns=['Ano', 'Entradas', 'Saidas', 'Total'])
+
+    print('Totais Semanais:')
+    print(df_semanal)
+    print('\nTotais Mensais:')
+    print(df_mensal)
+    print('\nTotais Anuais:')
+    print(df_anual)
+
+    # Salva os DataFrames em PDF no diretório de saída
+    save_dataframe_as_pdf(df_semanal, os.path.join(diretorio_saida, 'totais_semanal'))
+    save_dataframe_as_pdf(df_mensal, os.path.join(diretorio_saida, 'totais_mensal'))
+    save_dataframe_as_pdf(df_anual, os.path.join(diretorio_saida, 'totais_anual'))
+
+    conexao.close()
+
+
+if __name__ == '__main__':
+    # Uso:
+    #   python conexao.py [--saida DIR]            demonstração dos totais por período
+    #   python conexao.py exportar saida.parquet --inicio 2024-01-01 --fim 2025-01-01 --tipo saida
+    # Relatórios em lote, em paralelo: python gerar_relatorios.py --saida DIR
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Operações do banco de transações sem interface gráfica')
+    parser.add_argument('--saida', default=os.environ.get('HUGOBANCO_RELATORIOS', os.path.expanduser('~')),
+                        help='diretório dos PDFs da demonstração')
+    comandos = parser.add_subparsers(dest='comando')
+    exportar = comandos.add_parser('exportar', help='exporta as transações para CSV, JSON Lines ou Parquet')
+    exportar.add_argument('caminho', help='arquivo de saída (.csv, .jsonl ou .parquet)')
+    exportar.add_argument('--formato', choices=list(EXPORTADORES), help='padrão: pela extensão do arquivo')
+    exportar.add_argument('--inicio', help='data inicial (inclusive), AAAA-MM-DD')
+    exportar.add_argument('--fim', help='data final (exclusive), AAAA-MM-DD')
+    exportar.add_argument('--tipo', choices=['entrada', 'saida'])
+    exportar.add_argument('--banco', default=CAMINHO_BANCO)
+    exportar.add_argument('--tamanho-lote', type=int, default=50_000)
+    argumentos = parser.parse_args()
+
+    if argumentos.comando == 'exportar':
+        filtros = {'inicio': argumentos.inicio, 'fim': argumentos.fim, 'tipo': argumentos.tipo}
+        with Conexao(argumentos.banco, somente_leitura=True) as conexao:
+            conexao.export_file(argumentos.caminho, argumentos.formato, filtros, argumentos.tamanho_lote)
+    else:
+        _demonstracao(argumentos.saida)
@@ -0,0 +1,230 @@
+import time
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from instrumentacao import metricas
+
+# Fila de escrita com commit em grupo. Cada escrita enviada vira um Future; uma
+# única thread escritora junta as escritas pendentes (até ``max_lote``) em uma
+# só transação, e os Futures só são resolvidos depois do COMMIT. Com
+# ``janela_ms=0`` o lote é o que se acumulou enquanto o commit anterior rodava,
+# que é o melhor para quem espera cada resultado; uma janela maior junta
+# lotes maiores de quem envia em rajadas, ao custo dessa espera a mais. Com
+# muitos escritores simultâneos o custo do commit (e do fsync, conforme a
+# durabilidade) é dividido pelo lote inteiro em vez de cada escritor esperar o
+# lock e pagar o seu. Exemplo:
+#   with Conexao() as conexao:
+#       futuro = conexao.enviar_insercao(10.5, 'Pix', 'Saída', '2024-05-01')
+#   futuro.result()  # a linha gravada, como em insert_transacao
+
+# Valor de PRAGMA synchronous da conexão escritora para cada nível de durabilidade
+DURABILIDADES = {
+    'completa': 'FULL',    # fsync do WAL a cada commit: sobrevive a queda de energia
+    # padrão do pool: sobrevive a queda do processo, mas pode perder o último
+    # lote se o sistema operacional cair
+    'normal': 'NORMAL',
+    'desligada': 'OFF',    # sem fsync; só para cargas que podem ser refeitas
+}
+
+# Acima deste número de linhas, um lote avisa os ouvintes com um único evento
+# 'lote' em vez de um evento por linha
+LIMITE_EVENTOS_POR_LINHA = 100
+
+FAIXAS_LOTE = (1, 2, 5, 10, 50, 100, 500, 1000, float('inf'))
+
+
+class _Operacao:
+    __slots__ = ('sql', 'parametros', 'evento', 'futuro')
+
+    def __init__(self, sql, parametros, evento):
+        self.sql = sql
+        self.parametros = parametros
+        self.evento = evento
+        self.futuro = Future()
+
+
+class FilaEscrita:
+    """Escritor único com commit em grupo para um banco.
+
+    ``abrir()`` cria a conexão exclusiva da thread escritora e
+    ``registrar_escrita(evento, linha)`` é chamado depois de cada commit, antes
+    de os Futures serem resolvidos (quem espera o resultado já encontra os
+    caches invalidados). Cada escrita roda em um SAVEPOINT próprio: um erro
+    numa delas falha só o seu Future, e as demais do lote são gravadas.
+    """
+
+    def __init__(self, abrir, registrar_escrita, janela_ms=0.0, max_lote=500, durabilidade='normal'):
+        self.janela_ms = self.max_lote = self.durabilidade = None
+        self.configurar(janela_ms, max_lote, durabilidade)
+        self._abrir = abrir
+        self._registrar_escrita = registrar_escrita
+        self._fila = queue.Queue()
+        self._lock = threading.Lock()
+        self._fechada = False
+        self._estatisticas = {'enviadas': 0, 'gravadas': 0, 'erros': 0, 'lotes': 0,
+                              'maior_lote': 0, 'maior_profundidade': 0, 'total_commit_ms': 0.0,
+                              'histograma_lotes': [0] * len(FAIXAS_LOTE)}
+        self._thread = threading.Thread(target=self._executar, name='fila_escrita', daemon=True)
+        self._thread.start()
+
+    def configurar(self, janela_ms=None, max_lote=None, durabilidade=None):
+        """Altera as opções informadas; valem a partir do próximo lote."""
+        if durabilidade is not None and durabilidade not in DURABILIDADES:
+            raise ValueError(f'Durabilidade desconhecida: {durabilidade}')
+        if max_lote is not None and max_lote < 1:
+            raise ValueError('max_lote precisa ser pelo menos 1')
+        if janela_ms is not None:
+            self.janela_ms = max(0.0, janela_ms)
+        if max_lote is not None:
+            self.max_lote = max_lote
+        if durabilidade is not None:
+            self.durabilidade = durabilidade
+
+    def enviar(self, sql, parametros=(), evento='lote'):
+        """Enfileira um comando de escrita; o Future resolve com a primeira linha do RETURNING (ou None)."""
+        operacao = _Operacao(sql, parametros, evento)
+        with self._lock:
+            if self._fechada:
+                operacao.futuro.set_exception(sqlite3.ProgrammingError('A fila de escrita já foi fechada'))
+                return operacao.futuro
+            self._fila.put(operacao)
+            self._estatisticas['enviadas'] += 1
+            profundidade = self._fila.qsize()
+            if profundidade > self._estatisticas['maior_profundidade']:
+                self._estatisticas['maior_profundidade'] = profundidade
+        return operacao.futuro
+
+    def aguardar(self, timeout=None):
+        """Bloqueia até que tudo o que foi enviado antes desta chamada esteja gravado."""
+        self.enviar(None).result(timeout)
+
+    def fechar(self):
+        """Grava o que estiver na fila e encerra a thread escritora."""
+        with self._lock:
+            if self._fechada:
+                return
+            self._fechada = True
+            self._fila.put(None)
+        self._thread.join()
+
+    def estatisticas(self):
+        with self._lock:
+            dados = dict(self._estatisticas, histograma_lotes=list(self._estatisticas['histograma_lotes']))
+            dados['profundidade'] = self._fila.qsize()
+        lotes = dados['lotes']
+        dados['media_lote'] = round(dados['gravadas'] / lotes, 2) if lotes else 0.0
+        dados['media_commit_ms'] = round(dados['total_commit_ms'] / lotes, 3) if lotes else 0.0
+        dados['total_commit_ms'] = round(dados['total_commit_ms'], 3)
+        dados['histograma_lotes'] = {('inf' if limite == float('inf') else str(limite)): quantidade
+                                     for limite, quantidade in zip(FAIXAS_LOTE, dados['histograma_lotes'])}
+        dados.update(janela_ms=self.janela_ms, max_lote=self.max_lote, durabilidade=self.durabilidade)
+        return dados
+
+    # --- Thread escritora ------------------------------------------------------
+
+    def _executar(self):
+        connection = None
+        durabilidade = None
+        parar = False
+        while not parar:
+            operacao = self._fila.get()
+            if operacao is None:
+                break
+            lote = [operacao]
+            prazo = time.monotonic() + self.janela_ms / 1000
+            while len(lote) < self.max_lote:
+                restante = prazo - time.monotonic()
+                try:
+                    operacao = self._fila.get(timeout=restante) if restante > 0 else self._fila.get_nowait()
+                except queue.Empty:
+                    break
+                if operacao is None:
+                    parar = True
+                    break
+                lote.append(operacao)
+
+            try:
+                if connection is None:
+                    connection = self._abrir()
+                    connection.isolation_level = None  # BEGIN/COMMIT explícitos abaixo
+                if durabilidade != self.durabilidade:
+                    durabilidade = self.durabilidade
+                    connection.execute(f'PRAGMA synchronous = {DURABILIDADES[durabilidade]}')
+            except sqlite3.Error as e:
+                print(f'Erro ao abrir a conexão da fila de escrita: {e}')
+                for operacao in lote:
+                    operacao.futuro.set_exception(e)
+                continue
+            self._gravar(connection, lote)
+
+        if connection is not None:
+            connection.close()
+
+    def _gravar(self, connection, lote):
+        if all(operacao.sql is None for operacao in lote):
+            for operacao in lote:
+                operacao.futuro.set_result(None)
+            return
+        resultados = []
+        inicio = time.perf_counter()
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            for operacao in lote:
+                if operacao.sql is None:  # marcador de aguardar()
+                    resultados.append((operacao, None, None))
+                    continue
+                connection.execute('SAVEPOINT escrita')
+                try:
+                    linhas = connection.execute(operacao.sql, operacao.parametros).fetchall()
+                    resultados.append((operacao, linhas[0] if linhas else None, None))
+                except sqlite3.Error as e:
+                    connection.execute('ROLLBACK TO escrita')
+                    resultados.append((operacao, None, e))
+                connection.execute('RELEASE escrita')
+            connection.execute('COMMIT')
+        except sqlite3.Error as e:
+            print(f'Erro ao gravar lote da fila de escrita: {e}')
+            if connection.in_transaction:
+                connection.execute('ROLLBACK')
+            with self._lock:
+                self._estatisticas['erros'] += len(lote)
+            for operacao in lote:
+                operacao.futuro.set_exception(e)
+            return
+        duracao_ms = (time.perf_counter() - inicio) * 1000
+
+        gravadas = [(operacao, linha) for operacao, linha, erro in resultados
+                    if erro is None and operacao.sql is not None]
+        self._contabilizar(len(gravadas), sum(erro is not None for *_, erro in resultados), duracao_ms)
+        metricas.registrar('fila_escrita.lote', duracao_ms, len(gravadas))
+
+        alteradas = [(operacao.evento, linha) for operacao, linha in gravadas if linha is not None]
+        if len(alteradas) > LIMITE_EVENTOS_POR_LINHA:
+            self._notificar('lote', None)
+        else:
+            for evento, linha in alteradas:
+                self._notificar(evento, linha)
+
+        for operacao, linha, erro in resultados:
+            if erro is not None:
+                operacao.futuro.set_exception(erro)
+            else:
+                operacao.futuro.set_result(linha)
+
+    def _notificar(self, evento, linha):
+        try:
+            self._registrar_escrita(evento, linha)
+        except Exception as e:  # o lote já foi gravado; não deixa os Futures sem resposta
+            print(f'Erro ao notificar escrita da fila: {e}')
+
+    def _contabilizar(self, gravadas, erros, duracao_ms):
+        with self._lock:
+            estatisticas = self._estatisticas
+            estatisticas['lotes'] += 1
+            estatisticas['gravadas'] += gravadas
+            estatisticas['erros'] += erros
+            estatisticas['total_commit_ms'] += duracao_ms
+            estatisticas['maior_lote'] = max(estatisticas['maior_lote'], gravadas)
+            faixa = next(i for i, limite in enumerate(FAIXAS_LOTE) if gravadas <= limite)
+            estatisticas['histograma_lotes'][faixa] += 1
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from conexao import Conexao, CAMINHO_BANCO, EXPORTADORES, fechar_pools
+
+# Geração de relatórios em lote, sem interface gráfica (não importa o Qt).
+# Cada relatório e cada ano do relatório de transações é uma tarefa
+# independente, executada em um processo separado com sua própria conexão
+# somente leitura, então a geração noturna escala com o número de núcleos.
+# Exemplos:
+#   python gerar_relatorios.py --saida relatorios/
+#   python gerar_relatorios.py --saida relatorios/ --relatorios transacoes mensal --anos 2023 2024
+#   python gerar_relatorios.py --saida extratos/ --relatorios --exportar parquet csv --processos 8
+
+RESUMOS = {
+    'semanal': ('semana', 'Semana'),
+    'mensal': ('mes', 'Mes'),
+    'anual': ('ano', 'Ano'),
+}
+RELATORIOS = ['transacoes'] + list(RESUMOS)
+
+
+# --- Tarefas (rodam nos processos de trabalho) ----------------------------------
+
+def _relatorio_transacoes(caminho_banco, arquivo, filtros):
+    from relatorios import gerar_relatorio_pdf
+    resultado = gerar_relatorio_pdf(arquivo, filtros=filtros, caminho_banco=caminho_banco, somente_leitura=True)
+    return resultado['linhas']
+
+
+def _resumo_por_periodo(caminho_banco, arquivo, granularidade, rotulo):
+    import pandas as pd
+    from relatorios import salvar_dataframe_pdf
+    with Conexao(caminho_banco, somente_leitura=True) as conexao:
+        linhas = conexao.calcular_total_por_periodo(granularidade)
+    df = pd.DataFrame(linhas, columns=[rotulo, 'Entradas', 'Saidas', 'Total'])
+    salvar_dataframe_pdf(df, arquivo, titulo=os.path.splitext(os.path.basename(arquivo))[0])
+    return len(df)
+
+
+def _exportacao(caminho_banco, arquivo, formato, filtros):
+    with Conexao(caminho_banco, somente_leitura=True) as conexao:
+        return conexao.export_file(arquivo, formato, filtros)
+
+
+def _executar(tarefa):
+    rotulo, funcao, argumentos = tarefa
+    inicio = time.perf_counter()
+    linhas = funcao(*argumentos)
+    return rotulo, linhas, time.perf_counter() - inicio
+
+
+# --- Planejamento --------------------------------------------------------------
+
+def _anos_com_dados(caminho_banco):
+    # Abre o banco para escrita uma vez no processo principal: aplica as
+    # migrações pendentes antes que os trabalhadores o abram somente leitura
+    with Conexao(caminho_banco) as conexao:
+        anos = [int(periodo) for periodo, *_ in conexao.calcular_total_por_periodo('ano') if periodo]
+    fechar_pools()
+    return anos
+
+
+def planejar(caminho_banco, diretorio, relatorios, anos=None, por_ano=True, formatos=()):
+    """Lista de tarefas (rotulo, função, argumentos) independentes entre si."""
+    anos_disponiveis = _anos_com_dados(caminho_banco)
+    anos = [ano for ano in anos_disponiveis if not anos or ano in anos]
+    particoes = [(str(ano), {'inicio': f'{ano:04d}-01-01', 'fim': f'{ano + 1:04d}-01-01'}) for ano in anos]
+    if not por_ano:
+        intervalo = {'inicio': f'{min(anos):04d}-01-01', 'fim': f'{max(anos) + 1:04d}-01-01'} if anos else {}
+        particoes = [('todos', intervalo)]
+
+    tarefas = []
+    if 'transacoes' in relatorios:
+        for sufixo, filtros in particoes:
+            arquivo = os.path.join(diretorio, f'transacoes_{sufixo}.pdf')
+            tarefas.append((os.path.basename(arquivo), _relatorio_transacoes, (caminho_banco, arquivo, filtros)))
+    for nome, (granularidade, rotulo) in RESUMOS.items():
+        if nome in relatorios:
+            arquivo = os.path.join(diretorio, f'totais_{nome}.pdf')
+            tarefas.append((os.path.basename(arquivo), _resumo_por_periodo,
+                            (caminho_banco, arquivo, granularidade, rotulo)))
+    for formato in formatos:
+        for sufixo, filtros in particoes:
+            arquivo = os.path.join(diretorio, f'transacoes_{sufixo}.{formato}')
+            tarefas.append((os.path.basename(arquivo), _exportacao, (caminho_banco, arquivo, formato, filtros)))
+    return tarefas
+
+
+def executar(tarefas, processos=None):
+    """Executa as tarefas em paralelo e retorna {rotulo: (linhas, segundos)} e as falhas."""
+    resultados, falhas = {}, {}
+    if not tarefas:
+        return resultados, falhas
+    # 'spawn' em todas as plataformas: nenhum processo herda conexões SQLite abertas
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=processos, mp_context=contexto) as executor:
+        futuros = {executor.submit(_executar, tarefa): tarefa[0] for tarefa in tarefas}
+        for futuro in as_completed(futuros):
+            rotulo = futuros[futuro]
+            try:
+                _, linhas, segundos = futuro.result()
+            except Exception as e:
+                falhas[rotulo] = str(e)
+                print(f'  {rotulo}: falhou ({e})')
+            else:
+                resultados[rotulo] = (linhas, segundos)
+                print(f'  {rotulo}: {linhas} linhas em {segundos:.2f} s')
+    return resultados, falhas
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gera relatórios e resumos por período em paralelo')
+    parser.add_argument('--saida', required=True, help='diretório onde os arquivos são gravados')
+    parser.add_argument('--banco', default=CAMINHO_BANCO)
+    parser.add_argument('--relatorios', nargs='*', default=RELATORIOS, choices=RELATORIOS,
+                        help='relatórios em PDF (padrão: todos; vazio para nenhum)')
+    parser.add_argument('--exportar', nargs='*', default=[], choices=list(EXPORTADORES),
+                        help='também exporta as transações nestes formatos')
+    parser.add_argument('--anos', nargs='*', type=int, help='limita aos anos informados')
+    parser.add_argument('--arquivo-unico', action='store_true',
+                        help='um arquivo de transações para todo o período em vez de um por ano')
+    parser.add_argument('--processos', type=int, default=os.cpu_count(), help='processos em paralelo')
+    argumentos = parser.parse_args()
+
+    os.makedirs(argumentos.saida, exist_ok=True)
+    inicio = time.perf_counter()
+    tarefas = planejar(argumentos.banco, argumentos.saida, argumentos.relatorios, argumentos.anos,
+                       por_ano=not argumentos.arquivo_unico, formatos=argumentos.exportar)
+    print(f'{len(tarefas)} tarefas em até {argumentos.processos} processos:')
+    resultados, falhas = executar(tarefas, argumentos.processos)
+    print(f'Concluído em {time.perf_counter() - inicio:.2f} s: {len(resultados)} arquivos em {argumentos.saida}')
+    sys.exit(1 if falhas else 0)
@@ -0,0 +1,146 @@
+import csv
+import re
+import datetime
+
+# Leitores de extratos bancários. Todos são geradores que produzem tuplas
+# (valor, nome, tipo, data) uma a uma, sem carregar o arquivo inteiro na memória,
+# prontas para Conexao.insert_many.
+
+TIPO_ENTRADA = 'Entrada'
+TIPO_SAIDA = 'Saída'
+
+# Nomes de coluna aceitos no cabeçalho do CSV
+COLUNAS_CSV = {
+    'valor': ('valor', 'value', 'amount', 'quantia'),
+    'nome': ('nome', 'nome_transacao', 'descricao', 'descrição', 'historico', 'histórico', 'memo', 'name'),
+    'tipo': ('tipo', 'tipo_transacao', 'type'),
+    'data': ('data', 'date', 'data_transacao'),
+}
+
+FORMATOS_DATA = ('%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y%m%d')
+
+
+def converter_valor(texto):
+    """Converte '1.234,56', '1234.56' ou '-35,90' para float."""
+    texto = texto.strip().replace('R$', '').replace(' ', '')
+    if ',' in texto:
+        # Formato brasileiro: ponto separa milhar e vírgula separa decimais
+        texto = texto.replace('.', '').replace(',', '.')
+    return float(texto)
+
+
+def converter_data(texto):
+    """Normaliza a data para o formato ISO (YYYY-MM-DD) usado na tabela."""
+    # Descarta a parte de horário, se houver ('2024-01-31 10:00' ou '2024-01-31T10:00')
+    texto = texto.strip().split(' ')[0].split('T')[0]
+    for formato in FORMATOS_DATA:
+        try:
+            return datetime.datetime.strptime(texto, formato).date().isoformat()
+        except ValueError:
+            continue
+    raise ValueError(f'Data em formato desconhecido: {texto!r}')
+
+
+def normalizar_tipo(tipo, valor):
+    """Define o tipo pela coluna 'tipo' quando existir, senão pelo sinal do valor."""
+    if tipo:
+        tipo = tipo.strip().lower()
+        if tipo in ('entrada', 'credito', 'crédito', 'credit', 'c'):
+            return TIPO_ENTRADA
+        if tipo in ('saida', 'saída', 'debito', 'débito', 'debit', 'd'):
+            return TIPO_SAIDA
+    return TIPO_ENTRADA if valor >= 0 else TIPO_SAIDA
+
+
+def _mapear_cabecalho(cabecalho):
+    indices = {}
+    normalizado = [coluna.strip().lower() for coluna in cabecalho]
+    for campo, apelidos in COLUNAS_CSV.items():
+        for i, coluna in enumerate(normalizado):
+            if coluna in apelidos:
+                indices[campo] = i
+                break
+    return indices
+
+
+def ler_csv(caminho, delimitador=None, encoding='utf-8-sig'):
+    """Lê um CSV linha a linha.
+
+    Se a primeira linha tiver nomes de coluna conhecidos ela é usada como cabeçalho;
+    caso contrário as colunas são lidas na ordem valor, nome, tipo, data. O
+    delimitador (',' ou ';') é detectado automaticamente quando não informado.
+    """
+    with open(caminho, newline='', encoding=encoding) as arquivo:
+        if delimitador is None:
+            amostra = arquivo.readline()
+            arquivo.seek(0)
+            delimitador = ';' if amostra.count(';') > amostra.count(',') else ','
+        leitor = csv.reader(arquivo, delimiter=delimitador)
+
+        primeira = next(leitor, None)
+        if primeira is None:
+            return
+        indices = _mapear_cabecalho(primeira)
+        if 'valor' in indices and 'data' in indices:
+            linhas = leitor
+        else:
+            indices = {'valor': 0, 'nome': 1, 'tipo': 2, 'data': 3}
+            linhas = _encadear(primeira, leitor)
+
+        for numero, linha in enumerate(linhas, start=1):
+            if not any(campo.strip() for campo in linha):
+                continue
+            try:
+                valor = converter_valor(linha[indices['valor']])
+                nome = linha[indices['nome']].strip() if 'nome' in indices else ''
+                tipo = linha[indices['tipo']] if 'tipo' in indices else None
+                data = converter_data(linha[indices['data']])
+            except (ValueError, IndexError) as e:
+                print(f'Linha {numero} do CSV ignorada: {e}')
+                continue
+            yield abs(valor), nome, normalizar_tipo(tipo, valor), data
+
+
+def _encadear(primeira, restantes):
+    yield primeira
+    yield from restantes
+
+
+_TAG_OFX = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<]*)')
+
+
+def ler_ofx(caminho, encoding='latin-1'):
+    """Lê os blocos <STMTTRN> de um arquivo OFX (SGML ou XML) em streaming."""
+    transacao = None
+    with open(caminho, encoding=encoding) as arquivo:
+        for linha in arquivo:
+            for fechamento, tag, conteudo in _TAG_OFX.findall(linha):
+                tag = tag.upper()
+                if tag == 'STMTTRN':
+                    if fechamento:
+                        if transacao is not None:
+                            convertida = _converter_transacao_ofx(transacao)
+                            if convertida:
+                                yield convertida
+                        transacao = None
+                    else:
+                        transacao = {}
+                elif transacao is not None and not fechamento:
+                    transacao[tag] = conteudo.strip()
+
+
+def _converter_transacao_ofx(campos):
+    try:
+        valor = converter_valor(campos['TRNAMT'])
+        data = converter_data(campos['DTPOSTED'][:8])
+    except (KeyError, ValueError) as e:
+        print(f'Transação OFX ignorada: {e}')
+        return None
+    nome = campos.get('MEMO') or campos.get('NAME') or campos.get('TRNTYPE', '')
+    return abs(valor), nome, normalizar_tipo(None, valor), data
+
+
+LEITORES = {
+    '.csv': ler_csv,
+    '.ofx': ler_ofx,
+}
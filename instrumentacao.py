@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import atexit
+import sqlite3
+import bisect
+import functools
+import threading
+from collections import deque
+
+# Métricas das operações do Conexao: chamadas, latência (histograma), linhas
+# retornadas e um log opcional de consultas lentas com EXPLAIN QUERY PLAN.
+#
+# Variáveis de ambiente:
+#   HUGOBANCO_LOG_LENTO_MS=50         registra consultas acima de 50 ms
+#   HUGOBANCO_METRICAS=metricas.json  grava um snapshot em JSON ao sair
+
+# Limites superiores (ms) das faixas do histograma de latência
+FAIXAS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000, float('inf'))
+
+
+class _Estatistica:
+    __slots__ = ('chamadas', 'erros', 'linhas', 'total_ms', 'max_ms', 'histograma')
+
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = 0
+        self.linhas = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histograma = [0] * len(FAIXAS_MS)
+
+    def percentil(self, fracao):
+        """Limite superior da faixa que contém o percentil (estimativa pelo histograma)."""
+        alvo = fracao * self.chamadas
+        acumulado = 0
+        for limite, quantidade in zip(FAIXAS_MS, self.histograma):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return min(limite, self.max_ms)
+        return self.max_ms
+
+    def como_dict(self):
+        return {
+            'chamadas': self.chamadas,
+            'erros': self.erros,
+            'linhas': self.linhas,
+            'total_ms': round(self.total_ms, 3),
+            'media_ms': round(self.total_ms / self.chamadas, 3) if self.chamadas else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentil(0.50),
+            'p95_ms': self.percentil(0.95),
+            'p99_ms': self.percentil(0.99),
+            'histograma': {('inf' if limite == float('inf') else str(limite)): quantidade
+                           for limite, quantidade in zip(FAIXAS_MS, self.histograma)},
+        }
+
+
+class Metricas:
+    """Coletor de métricas compartilhado por todas as conexões do processo."""
+
+    def __init__(self, limite_lento_ms=None, max_consultas_lentas=100):
+        self.ativo = True
+        self.limite_lento_ms = limite_lento_ms
+        self.consultas_lentas = deque(maxlen=max_consultas_lentas)
+        self._estatisticas = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, operacao, duracao_ms, linhas=0, erro=False):
+        with self._lock:
+            estatistica = self._estatisticas.get(operacao)
+            if estatistica is None:
+                estatistica = self._estatisticas[operacao] = _Estatistica()
+            estatistica.chamadas += 1
+            estatistica.erros += erro
+            estatistica.linhas += linhas
+            estatistica.total_ms += duracao_ms
+            if duracao_ms > estatistica.max_ms:
+                estatistica.max_ms = duracao_ms
+            estatistica.histograma[bisect.bisect_left(FAIXAS_MS, duracao_ms)] += 1
+
+    def registrar_lenta(self, operacao, duracao_ms, connection, comandos):
+        registro = {
+            'operacao': operacao,
+            'duracao_ms': round(duracao_ms, 3),
+            'quando': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'comandos': [{'sql': ' '.join(sql.split())[:2000], 'plano': _plano(connection, sql)} for sql in comandos],
+        }
+        self.consultas_lentas.append(registro)
+        print(f'[consulta lenta] {operacao}: {duracao_ms:.1f} ms')
+        for comando in registro['comandos']:
+            print(f'    {comando["sql"][:200]}')
+            for linha in comando['plano']:
+                print(f'      {linha}')
+
+    def zerar(self):
+        with self._lock:
+            self._estatisticas.clear()
+            self.consultas_lentas.clear()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'operacoes': {nome: estatistica.como_dict()
+                              for nome, estatistica in sorted(self._estatisticas.items())},
+                'consultas_lentas': list(self.consultas_lentas),
+                'limite_lento_ms': self.limite_lento_ms,
+            }
+
+    def exportar_json(self, caminho=None):
+        texto = json.dumps(self.snapshot(), indent=2, ensure_ascii=False)
+        if caminho:
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write(texto)
+        return texto
+
+    def exportar_texto(self):
+        linhas = [f'{"operação":28s} {"chamadas":>9s} {"média ms":>9s} {"p95 ms":>8s} {"p99 ms":>8s} '
+                  f'{"máx ms":>9s} {"linhas":>10s} {"erros":>6s}']
+        for nome, dados in self.snapshot()['operacoes'].items():
+            linhas.append(f'{nome:28s} {dados["chamadas"]:9d} {dados["media_ms"]:9.3f} {dados["p95_ms"]:8.1f} '
+                          f'{dados["p99_ms"]:8.1f} {dados["max_ms"]:9.3f} {dados["linhas"]:10d} {dados["erros"]:6d}')
+        return '\n'.join(linhas)
+
+
+def _plano(connection, sql):
+    comando = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ''
+    if comando not in ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE'):
+        return []
+    try:
+        return [detalhe for *_, detalhe in connection.execute(f'EXPLAIN QUERY PLAN {sql}')]
+    except sqlite3.Error as e:
+        return [f'(sem plano: {e})']
+
+
+def _contar_linhas(resultado):
+    if isinstance(resultado, list):
+        return len(resultado)
+    if isinstance(resultado, tuple):
+        return 1
+    if isinstance(resultado, int) and not isinstance(resultado, bool):
+        return resultado  # insert_many/import_file retornam as linhas gravadas
+    if hasattr(resultado, '__len__') and not isinstance(resultado, (str, dict)):
+        return len(resultado)  # ex.: analise.ColunasTransacoes
+    return 0
+
+
+metricas = Metricas()
+
+
+def registrar_erro(conexao):
+    """Marca como erro a chamada medida em andamento no ``conexao``.
+
+    Os métodos do Conexao tratam sqlite3.Error e retornam None ou 0 em vez de
+    propagar a exceção; o bloco except chama esta função para que o erro
+    apareça na contagem de ``erros`` da operação.
+    """
+    conexao._erro_capturado = True
+
+
+def medir(metodo=None, *, capturar_sql=True):
+    """Decorador dos métodos do Conexao: registra latência e linhas em ``metricas``.
+
+    Com o log de consultas lentas ligado, os comandos SQL executados durante a
+    chamada mais externa são capturados pelo trace callback do sqlite3 para
+    que o plano possa ser mostrado se a chamada passar do limite. Só os
+    últimos comandos são guardados, e os internos (gatilhos, FTS5) são ignorados.
+    Operações em lote usam ``@medir(capturar_sql=False)``: o trace callback
+    custa mais que o próprio INSERT quando chamado para cada linha. Conta como
+    erro tanto a exceção propagada quanto a tratada com ``registrar_erro``.
+    """
+    if metodo is None:
+        return functools.partial(medir, capturar_sql=capturar_sql)
+    nome = metodo.__name__
+
+    @functools.wraps(metodo)
+    def envolvido(self, *args, **kwargs):
+        if not metricas.ativo:
+            return metodo(self, *args, **kwargs)
+
+        connection = self.connection
+        externa = not getattr(self, '_medindo', False)
+        capturar = (externa and capturar_sql and metricas.limite_lento_ms is not None
+                    and connection is not None)
+        comandos = deque(maxlen=5)
+        self._medindo = True
+        if capturar:
+            connection.set_trace_callback(lambda sql: sql.startswith('--') or comandos.append(sql))
+        erro = False
+        capturado_antes = getattr(self, '_erro_capturado', False)
+        self._erro_capturado = False
+        resultado = None
+        inicio = time.perf_counter()
+        try:
+            resultado = metodo(self, *args, **kwargs)
+            return resultado
+        except Exception:
+            erro = True
+            raise
+        finally:
+            duracao_ms = (time.perf_counter() - inicio) * 1000
+            if capturar:
+                connection.set_trace_callback(None)
+            if externa:
+                self._medindo = False
+            erro = erro or self._erro_capturado
+            self._erro_capturado = capturado_antes
+            metricas.registrar(nome, duracao_ms, _contar_linhas(resultado), erro)
+            if externa and metricas.limite_lento_ms is not None and duracao_ms >= metricas.limite_lento_ms:
+                metricas.registrar_lenta(nome, duracao_ms, connection, comandos)
+
+    return envolvido
+
+
+def _configurar_por_ambiente():
+    limite = os.environ.get('HUGOBANCO_LOG_LENTO_MS')
+    if limite:
+        metricas.limite_lento_ms = float(limite)
+    destino = os.environ.get('HUGOBANCO_METRICAS')
+    if destino:
+        atexit.register(metricas.exportar_json, destino)
+
+
+_configurar_por_ambiente()
@@ -1,119 +1,87 @@
-from PyQt5 import uic, QtWidgets, QtCore
+from PyQt5 import QtWidgets, QtCore
+import os
 import sys
 import datetime
-from conexao import Conexao
 from PyQt5.QtWidgets import QSizePolicy, QAction, QKeySequenceEdit
-from conexao import Conexao, save_dataframe_as_pdf
-import pandas as pd
-from fpdf import FPDF
+from conexao import Conexao
+from modelo_tabela import ModeloTransacoes
+import tarefas
+import telas
+# pandas e fpdf (relatorios.py) só são importados quando um relatório é pedido,
+# e as janelas secundárias só são montadas na primeira vez em que são abertas
 # Permite que a janela seja redimensionável
 
-class MainWindow(QtWidgets.QMainWindow):
-    
-
-   class RelatorioPDF(FPDF):
-    def header(self):
-        self.set_font("Arial", "B", 12)
-        self.cell(0, 10, "Relatório de Transações", 0, 1, "C")
-        self.ln(10)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font("Arial", "I", 8)
-        self.cell(0, 10, f"Página {self.page_no()}", 0, 0, "C")
-
 def calcular_totais_transacoes():
-    conexao = Conexao()
-    # Obtendo transações
-    transacoes = conexao.read_all()
-    
-    # Inicializando totais
-    total = 0.0  # Este será o total líquido (entradas - saídas)
+    # Total líquido (entradas - saídas) calculado pelo banco e mantido em cache
+    with Conexao() as conexao:
+        return conexao.saldo()
+
+def chamar_gerar_relatorio_pdf():
+    from relatorios import gerar_relatorio_pdf, caminho_padrao
+    print("Botão pressionado: gerando relatório...")
+    caminho_pdf, _ = QtWidgets.QFileDialog.getSaveFileName(
+        tela_cadastro, 'Salvar relatório', caminho_padrao(), 'PDF (*.pdf)')
+    if not caminho_pdf:
+        return
 
-    # Filtrando e somando valores de entradas e saídas
-    for transacao in transacoes:
-        try:
-            valor = float(transacao[1])  # Supondo que transacao[1] é o valor
-            tipo = transacao[3].lower()   # Supondo que transacao[3] é o tipo
+    # O relatório é gerado em segundo plano; o progresso aparece na barra de status
+    def gerar(tarefa):
+        return gerar_relatorio_pdf(caminho_pdf, ao_progredir=tarefa.informar_progresso)
 
-            if tipo == "entrada":
-                total += valor  # Adiciona ao total
-            elif tipo == "saida":
-                total -= valor  # Subtrai do total
-        except (ValueError, IndexError) as e:
-            print(f"Erro ao processar a transação {transacao}: {e}")
+    def concluido(resultado):
+        print("Relatório gerado e salvo em:", caminho_pdf)
+        tela_cadastro.statusBar().showMessage(
+            f"Relatório salvo em {caminho_pdf} ({resultado['paginas']} páginas)", 10000)
 
-    return total
+    def falhou(erro):
+        print(f"Erro ao gerar o relatório: {erro}")
+        tela_cadastro.statusBar().clearMessage()
+        QtWidgets.QMessageBox.about(tela_cadastro, 'Erro', f'Erro ao gerar o relatório: {erro}')
 
-def gerar_relatorio_pdf(caminho_pdf):
-    # Calcula os totais
-    total = calcular_totais_transacoes()
-    
-    # Cria o PDF
-    pdf = MainWindow.RelatorioPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", "", 12)
-    
-    # Adiciona as informações de total líquido
-    pdf.cell(0, 10, f"Total Líquido: R$ {total:.2f}", 0, 1)
-    
-    # Adiciona uma tabela com as transações detalhadas
-    pdf.cell(0, 10, "", 0, 1)
-    pdf.cell(0, 10, "Detalhes das Transações", 0, 1)
-    
-    # Definindo cabeçalho da tabela
-    pdf.set_font("Arial", "B", 10)
-    pdf.cell(30, 10, "ID", 1)
-    pdf.cell(50, 10, "Nome", 1)
-    pdf.cell(30, 10, "Tipo", 1)
-    pdf.cell(30, 10, "Valor", 1)
-    pdf.cell(30, 10, "Data", 1)
-    pdf.ln()
-
-    # Preenchendo a tabela com as transações
-    pdf.set_font("Arial", "", 10)
-    conexao = Conexao()
-    transacoes = conexao.read_all()
-    for transacao in transacoes:
-        pdf.cell(30, 10, str(transacao[0]), 1)  # ID
-        pdf.cell(50, 10, transacao[2], 1)       # Nome
-        pdf.cell(30, 10, transacao[3], 1)       # Tipo
-        
-        # Formata o valor diretamente, assumindo que é um float
-        try:
-            valor_formatado = f"R$ {float(transacao[1]):.2f}"
-        except ValueError:  # Caso o valor não possa ser convertido
-            valor_formatado = "Erro"
+    tela_cadastro.statusBar().showMessage("Gerando relatório... (Esc cancela)")
+    tarefas.executar(gerar, ao_concluir=concluido, ao_falhar=falhou,
+                     ao_progredir=lambda feito, total: mostrar_progresso("Gerando relatório", feito, total))
+
+def importar_extrato():
+    caminho, _ = QtWidgets.QFileDialog.getOpenFileName(
+        tela_cadastro, 'Importar extrato', '', 'Extratos (*.csv *.ofx)')
+    if not caminho:
+        return
 
-        pdf.cell(30, 10, valor_formatado, 1)  # Valor
-        pdf.cell(30, 10, transacao[4], 1)       # Data
-        pdf.ln()
+    # A importação roda em segundo plano, em lotes, com conexão própria
+    def importar(tarefa):
+        with Conexao() as conexao:
+            return conexao.import_file(caminho, ao_progredir=tarefa.informar_progresso)
 
-    # Salva o PDF no caminho especificado
-    pdf.output(caminho_pdf)
-    print(f"Relatório salvo em {caminho_pdf}")
+    def concluido(inseridas):
+        tela_cadastro.statusBar().showMessage(f"{inseridas} transações importadas", 10000)
+        atualiza_tabela_principal()
 
+    def falhou(erro):
+        tela_cadastro.statusBar().clearMessage()
+        QtWidgets.QMessageBox.about(tela_cadastro, 'Erro', f'Erro ao importar o extrato: {erro}')
 
+    tela_cadastro.statusBar().showMessage("Importando extrato... (Esc cancela)")
+    tarefas.executar(importar, ao_concluir=concluido, ao_falhar=falhou,
+                     ao_progredir=lambda feito, total: mostrar_progresso("Importando extrato", feito, total))
 
- 
-    def __init__(self):
-        super().__init__()
-        self.conexao = Conexao()
-        self.conexao.create_table()
-        self.initUI()
+def mostrar_progresso(rotulo, feito, total):
+    if total:
+        tela_cadastro.statusBar().showMessage(f"{rotulo}: {feito}/{total} ({100 * feito // total}%) (Esc cancela)")
+    else:
+        tela_cadastro.statusBar().showMessage(f"{rotulo}: {feito} transações (Esc cancela)")
 
+def cancelar_tarefas():
+    tarefas.cancelar_todas()
+    tela_cadastro.statusBar().showMessage("Operação cancelada", 5000)
 
-    def chamar_gerar_relatorio_pdf(self):
-        tela_cadastro.pushButton_6.clicked.connect(self.chamar_gerar_relatorio_pdf)
-        print("Botão pressionado: gerando relatório...")
-        caminho_pdf = "C:\\Users\\Arthur\\OneDrive\\Documentos\\relatorio_transacoes.pdf"
-        try:
-            gerar_relatorio_pdf(caminho_pdf)
-            print("Relatório gerado e salvo em:", caminho_pdf)
-        except Exception as e:
-            print(f"Erro ao gerar o relatório: {e}")
-        tela_cadastro.pushButton_6.clicked.connect(self.chamar_gerar_relatorio_pdf) 
 def abrir_janela_inserir():
+    global tela_inserir_matriculas
+    if tela_inserir_matriculas is None:
+        tela_inserir_matriculas = telas.carregar('inserir_dados')
+        # Conectando os botões da janela de inserir as funções da janela de inserir
+        tela_inserir_matriculas.pushButton_2.clicked.connect(fechar_janela_inserir)
+        tela_inserir_matriculas.pushButton.clicked.connect(inserir_dados)
     tela_inserir_matriculas.show()
 
 
@@ -131,48 +99,17 @@ def show_search_dialog(dialog):
     # Exibe o diálogo de pesquisa
     dialog.exec_()
 
-def limpa_tabela(valor):
-    # Valor é o valor de linhas que terá a tabela
-    conexao = Conexao()
-    if valor == 1:
-        tela_cadastro.tableWidget.setRowCount(1)
-        tela_cadastro.tableWidget.setColumnCount(len(conexao.read_all()[0]))
-        tela_cadastro.tableWidget.setHorizontalHeaderLabels(["id transação","Valor","nome da transação", "tipo", "data"])
-        tela_cadastro.tableWidget.setRowCount(valor)
-        tela_cadastro.tableWidget.setColumnCount(len(conexao.read_all()[0]))
-        tela_cadastro.tableWidget.setHorizontalHeaderLabels(["id transação","Valor","nome da transação", "tipo", "data"])
-
 def voltar():
-    tela_inserir_matriculas.close()
+    if tela_inserir_matriculas is not None:
+        tela_inserir_matriculas.close()
     tela_cadastro.close()
 
 def atualiza_tabela_principal():
-    conexao = Conexao()
-    # Recupera todas as transações do banco de dados
-    rows = conexao.read_all()
-
-    # Limpa a tabela se não houver dados disponíveis
-    if not rows:
-        tela_cadastro.tableWidget.setRowCount(0)
-        tela_cadastro.tableWidget.setColumnCount(0)
-        tela_cadastro.tableWidget.setHorizontalHeaderLabels([])  # Limpa os rótulos do cabeçalho
-        return
-
-    # Define o número de linhas e colunas
-    tela_cadastro.tableWidget.setRowCount(len(rows))
-    tela_cadastro.tableWidget.setColumnCount(len(rows[0]))  # O número de colunas da primeira linha
-
-    # Define os nomes das colunas
-    tela_cadastro.tableWidget.setHorizontalHeaderLabels(["ID Transação", "Valor", "Nome da Transação", "Tipo", "Data"])
-
-    # Preenche a tabela com os dados das transações
-    for i, row in enumerate(rows):  # Para cada linha
-        for j, value in enumerate(row):  # Para cada coluna
-            item = QtWidgets.QTableWidgetItem(str(value))
-            tela_cadastro.tableWidget.setItem(i, j, item)
+    # O modelo reconta as linhas no banco e descarta as páginas carregadas;
+    # as linhas visíveis são buscadas sob demanda pela view
+    modelo_transacoes.limpar_filtro()
 
 def fechar_janela_inserir():
-    atualiza_tabela_principal()
     tela_inserir_matriculas.lineEdit.setText('')
     tela_inserir_matriculas.lineEdit_2.setText('')
     tela_inserir_matriculas.close()
@@ -207,27 +144,30 @@ def inserir_dados():
                 QtWidgets.QMessageBox.about(tela_inserir_matriculas, 'Erro', 'Por favor, não insira números ou caracteres especiais no campo "nome da transação"')
                 return
 
-        # Inserir no banco de dados com o campo data (simulação)
-        conexao = Conexao()
-        resposta = conexao.insert_transacao(valor, nome_transacao, tipo_transacao, data_transacao)
-        atualiza_tabela_principal()
+        # Inserir no banco de dados; a tabela principal recebe só a linha nova
+        with Conexao() as conexao:
+            resposta = conexao.insert_transacao(valor, nome_transacao, tipo_transacao, data_transacao)
+        if resposta is None:
+            QtWidgets.QMessageBox.about(tela_inserir_matriculas, 'Erro', 'Falha ao inserir a transação')
+            return
         QtWidgets.QMessageBox.about(tela_inserir_matriculas, 'Sucesso', 'Transação inserida com sucesso')
 
     except Exception as e:
         QtWidgets.QMessageBox.about(tela_inserir_matriculas, 'Erro', f'Ocorreu um erro: {e}')
     
     return
-def export_to_pdf(self):
-    transacoes = self.conexao.read_all()
-    df = pd.DataFrame(transacoes, columns=["ID", "Valor", "Nome", "Tipo", "Data"])
-    save_dataframe_as_pdf(df, 'C:\\Users\\Arthur\\OneDrive\\Documentos\\totais_semanal')
 
 
 def abrir_janela_atualizar():
+    global tela_atualizar
+    if tela_atualizar is None:
+        tela_atualizar = telas.carregar('atualizar_dados')
+        # Conectando os botões da jenala atualizar as funções da janela atualizar
+        tela_atualizar.pushButton_2.clicked.connect(fechar_janela_atualizar)
+        tela_atualizar.pushButton.clicked.connect(atualizar_dados)
     tela_atualizar.show()
 
 def fechar_janela_atualizar():
-    atualiza_tabela_principal()
     tela_atualizar.lineEdit.setText('')
     tela_atualizar.lineEdit_2.setText('')
     #tela_atualizar.lineEdit_4.setText('')
@@ -244,7 +184,7 @@ def atualizar_dados():
         nome_transacao = tela_atualizar.lineEdit.text().strip()
         valor = tela_atualizar.lineEdit_2.text().strip()
         tipo_transacao = tela_atualizar.comboBox.currentText()  # Captura o tipo de transação selecionado no comboBox
-        data = tela_atualizar.dateTime().toString("yyyy-MM-dd")  # Obtém a data da transação
+        data = tela_atualizar.dateEdit.date().toString("yyyy-MM-dd")  # Obtém a data da transação
 
         # Verifica se o campo ID da transação não está vazio
         if not id_transacao.isdigit():
@@ -267,10 +207,12 @@ def atualizar_dados():
             return
 
         # Atualização no banco de dados
-        conexao = Conexao()
-        conexao.update_transacao(id_transacao, nome_transacao, data, valor, tipo_transacao)
+        with Conexao() as conexao:
+            resposta = conexao.update_transacao(id_transacao, nome_transacao, valor, tipo_transacao, data)
+        if resposta is None:
+            QtWidgets.QMessageBox.about(tela_atualizar, 'Erro', 'Falha ao atualizar, id inexistente na tabela')
+            return
 
-        atualiza_tabela_principal()
         QtWidgets.QMessageBox.about(tela_atualizar, 'Conexão banco de dados', 'Atualização feita com sucesso')
 
     except Exception as e:
@@ -278,10 +220,15 @@ def atualizar_dados():
 
     return
 def abrir_janela_excluir():
+    global tela_excluir
+    if tela_excluir is None:
+        tela_excluir = telas.carregar('tela_excluir')
+        # Conectando os botões da janela excluir as funções da janela excluir
+        tela_excluir.pushButton_2.clicked.connect(fechar_janela_excluir)
+        tela_excluir.pushButton.clicked.connect(excluir_dados)
     tela_excluir.show()
 
 def fechar_janela_excluir():
-    atualiza_tabela_principal()
     tela_excluir.lineEdit.setText('')
     tela_excluir.close()
 
@@ -289,23 +236,21 @@ def excluir_dados():
     try:
         id_transacao = tela_excluir.lineEdit.text()
         id_transacao = int(id_transacao)
-        if id_transacao < 1 or id_transacao > 300:
+        if id_transacao < 1:
             QtWidgets.QMessageBox.about(tela_excluir, 'Erro', 'Por favor insira um id de transacão válido')
             return
-        conexao = Conexao()
-        response = conexao.read_one(id_transacao)
-        if response == None:
-            QtWidgets.QMessageBox.about(tela_excluir, 'Erro', 'Falha ao excluir, id inexistente na tabela')
-            return
 
     except Exception:
         QtWidgets.QMessageBox.about(tela_excluir, 'Erro', 'Insira apenas números')
         return
 
-    # Parte da inserção no banco de dados
-    conexao = Conexao()
-    resposta = conexao.delete_transacao(id_transacao)
-    atualiza_tabela_principal()
+    # Exclusão no banco de dados; o DELETE devolve a linha removida, e a
+    # tabela principal tira só essa linha
+    with Conexao() as conexao:
+        resposta = conexao.delete_transacao(id_transacao)
+    if resposta is None:
+        QtWidgets.QMessageBox.about(tela_excluir, 'Erro', 'Falha ao excluir, id inexistente na tabela')
+        return
     QtWidgets.QMessageBox.about(tela_excluir, 'Conexão banco de dados', 'Registro excluido com sucesso')
     
     return  
@@ -345,26 +290,24 @@ def pesquisar_por_data(data_pesquisa, tela_cadastro):
         QtWidgets.QMessageBox.about(tela_cadastro, 'Alerta', 'Por favor, selecione uma data válida no formato YYYY-MM-DD')
         return
 
-    conexao = Conexao()
-    # Verifica o nível de granularidade da pesquisa
+    # Verifica o nível de granularidade da pesquisa e monta o intervalo [inicio, fim)
+    inicio = data.date()
     if data.day == 1 and data.month == 1:  # Apenas ano
-        rows = conexao.read_data_por_ano(data.year)
+        fim = inicio.replace(year=inicio.year + 1)
     elif data.day == 1:  # Apenas mês
-        rows = conexao.read_data_por_mes(data.year, data.month)
+        fim = (inicio + datetime.timedelta(days=31)).replace(day=1)
     else:  # Dia específico
-        rows = conexao.read_data_por_dia(data_pesquisa)
+        fim = inicio + datetime.timedelta(days=1)
 
-    # Verifica se há resultados
-    if not rows:
-        QtWidgets.QMessageBox.about(tela_cadastro, 'Alerta', 'Valor não encontrado na tabela')
-        return
+    # Verifica se há resultados quando a contagem em segundo plano terminar
+    def verificar_resultado(total):
+        if total == 0:
+            QtWidgets.QMessageBox.about(tela_cadastro, 'Alerta', 'Valor não encontrado na tabela')
+            modelo_transacoes.limpar_filtro()
 
-    # Limpa a tabela e exibe os resultados
-    limpa_tabela(len(rows))
-    for i in range(len(rows)):
-        for j in range(len(rows[0])):
-            item = QtWidgets.QTableWidgetItem(f"{rows[i][j]}")
-            tela_cadastro.tableWidget.setItem(i, j, item)
+    # O filtro é aplicado no próprio modelo da tabela principal
+    modelo_transacoes.definir_filtro(inicio=inicio.isoformat(), fim=fim.isoformat(),
+                                     ao_concluir=verificar_resultado)
 
 def alternar_tela_cheia():
     if tela_cadastro.isFullScreen():
@@ -376,25 +319,13 @@ def obter_nome_transacao(lineEdit):
     return lineEdit.text().strip()  # Retorna o texto do QLineEdit, removendo espaços extras
 
 def pesquisar_por_nome_e_exibir(tela_cadastro, valor_pesquisa):
-    transacao = valor_pesquisa.lower()  # Converte o texto para minúsculas
-    print(f"Buscando por: {transacao}")  # Para depuração
-    encontrou_correspondencia = False  # Para verificar se alguma linha foi exibida
-
-    for row in range(tela_cadastro.tableWidget.rowCount()):
-        item = tela_cadastro.tableWidget.item(row, 2)  # Supondo que o nome está na coluna 2
-        
-        if item:  # Verifica se o item não é None
-            print(f"Linha {row}: {item.text()}")  # Imprime o texto do item
-            if transacao in item.text().lower():  # Verifica se a transação está no texto
-                tela_cadastro.tableWidget.showRow(row)  # Exibe a linha que corresponde
-                encontrou_correspondencia = True  # Marque que encontramos uma correspondência
-            else:
-                tela_cadastro.tableWidget.hideRow(row)  # Oculta a linha que não corresponde
-        else:
-            tela_cadastro.tableWidget.hideRow(row)  # Oculta linhas onde não há item
-
-    if not encontrou_correspondencia:
-        print("Nenhuma correspondência encontrada.")  # Mensagem se nada foi encontrado
+    # A busca usa o índice de texto do banco (prefixos, sem acentos); só as
+    # linhas encontradas são carregadas. Texto vazio volta a exibir tudo.
+    def verificar_resultado(total):
+        if total == 0:
+            print("Nenhuma correspondência encontrada.")  # Mensagem se nada foi encontrado
+
+    modelo_transacoes.definir_filtro(nome=valor_pesquisa, ao_concluir=verificar_resultado)
 
 def mostrar_dialog_pesquisa(tela_cadastro):
     dialog_pesquisa = QtWidgets.QDialog()
@@ -417,6 +348,14 @@ def setup_search_button_with_dialog(tela_cadastro, dialog_pesquisa):
     # Conectar o botão de pesquisa para realizar a ação
     botao_confirmar_pesquisa.clicked.connect(lambda: realizar_pesquisa_dialog(lineEdit_pesquisa, dialog_pesquisa, tela_cadastro))
 
+    # Pesquisa enquanto o usuário digita: o timer é reiniciado a cada tecla e
+    # a consulta só roda depois de uma pausa de 250 ms
+    timer_pesquisa = QtCore.QTimer(dialog_pesquisa)
+    timer_pesquisa.setSingleShot(True)
+    timer_pesquisa.setInterval(250)
+    timer_pesquisa.timeout.connect(lambda: pesquisar_por_nome_e_exibir(tela_cadastro, obter_nome_transacao(lineEdit_pesquisa)))
+    lineEdit_pesquisa.textChanged.connect(timer_pesquisa.start)
+
 def realizar_pesquisa_dialog(lineEdit, dialog, tela_cadastro):
     valor_pesquisa = obter_nome_transacao(lineEdit)  # Obtém o nome da transação
     print(f"Nome da transação a ser pesquisado: {valor_pesquisa}")  # Para depuração
@@ -426,27 +365,8 @@ def realizar_pesquisa_dialog(lineEdit, dialog, tela_cadastro):
 
     dialog.close()  # Fecha o diálogo após a pesquisa
 def att_tabela_cadastro():
-    tela_cadastro.tableWidget.clearContents()  # Limpa a tabela
-
-    # Create a connection to the database
-    conexao = Conexao()
-
-    # Fetch all data from the database
-    data = conexao.read_all()
-
-    # Update the table with the fetched data
-    tela_cadastro.tableWidget.setRowCount(len(data))
-    tela_cadastro.tableWidget.setColumnCount(len(data[0]) if data else 0)
-
-    for row_index, row_data in enumerate(data):
-        for col_index, col_data in enumerate(row_data):
-            tela_cadastro.tableWidget.setItem(row_index, col_index, QtWidgets.QTableWidgetItem(str(col_data)))
-
-    # Close the database connection
-    conexao.close()
-
-# Connect the push button to the function
-    tela_cadastro.pushButton_8.clicked.connect(att_tabela_cadastro)
+    # Recarrega o modelo da tabela principal a partir do banco
+    modelo_transacoes.limpar_filtro()
 
 
 
@@ -459,10 +379,13 @@ def att_tabela_cadastro():
 
 
 app = QtWidgets.QApplication(sys.argv)
-tela_cadastro = uic.loadUi('tela_cadastro.ui')
-tela_inserir_matriculas = uic.loadUi('inserir_dados.ui')
-tela_atualizar = uic.loadUi('atualizar_dados.ui')
-tela_excluir = uic.loadUi('tela_excluir.ui')
+tela_cadastro = telas.carregar('tela_cadastro')
+# Janelas secundárias: criadas sob demanda em abrir_janela_*
+tela_inserir_matriculas = None
+tela_atualizar = None
+tela_excluir = None
+modelo_transacoes = ModeloTransacoes()
+tela_cadastro.tableWidget.setModel(modelo_transacoes)
 setup_button_for_date_search(tela_cadastro)
 dialog_pesquisa = QtWidgets.QDialog()
 setup_search_button_with_dialog(tela_cadastro, dialog_pesquisa)
@@ -474,21 +397,36 @@ tela_cadastro.pushButton_3.clicked.connect(abrir_janela_atualizar)
 tela_cadastro.pushButton_5.clicked.connect(voltar)
 tela_cadastro.pushButton_4.clicked.connect(abrir_janela_excluir)
 tela_cadastro.pushButton_8.clicked.connect(att_tabela_cadastro)
+tela_cadastro.pushButton_6.clicked.connect(chamar_gerar_relatorio_pdf)
 tela_cadastro.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
-# Conectando os botões da janela de inserir as funções da janela de inserir
-tela_inserir_matriculas.pushButton_2.clicked.connect(fechar_janela_inserir)
-tela_inserir_matriculas.pushButton.clicked.connect(inserir_dados)
+# Atalhos da janela principal: Ctrl+I importa um extrato e Esc cancela tarefas em andamento
+acao_importar = QAction('Importar extrato', tela_cadastro)
+acao_importar.setShortcut('Ctrl+I')
+acao_importar.triggered.connect(importar_extrato)
+tela_cadastro.addAction(acao_importar)
+acao_cancelar = QAction('Cancelar operação', tela_cadastro)
+acao_cancelar.setShortcut('Esc')
+acao_cancelar.triggered.connect(cancelar_tarefas)
+tela_cadastro.addAction(acao_cancelar)
 
-# Conectando os botões da jenala atualizar as funções da janela atualizar
-tela_atualizar.pushButton_2.clicked.connect(fechar_janela_atualizar)
-tela_atualizar.pushButton.clicked.connect(atualizar_dados)
+atualiza_tabela_principal()
 
-# Conectando os botões da janela excluir as funções da janela excluir
-tela_excluir.pushButton_2.clicked.connect(fechar_janela_excluir)
-tela_excluir.pushButton.clicked.connect(excluir_dados)
+if os.environ.get('HUGOBANCO_SAIR_APOS_PINTURA'):
+    # Usado por benchmark_inicializacao.py para medir o tempo até a primeira pintura
+    class _SairAposPintura(QtCore.QObject):
+        def eventFilter(self, objeto, evento):
+            if evento.type() == QtCore.QEvent.Paint:
+                print('PRIMEIRA_PINTURA', flush=True)
+                QtCore.QTimer.singleShot(0, app.quit)
+                objeto.removeEventFilter(self)
+            return False
 
-atualiza_tabela_principal()
+    _filtro_pintura = _SairAposPintura()
+    tela_cadastro.installEventFilter(_filtro_pintura)
 
 tela_cadastro.show()
-sys.exit(app.exec_())
\ No newline at end of file
+codigo_saida = app.exec_()
+tarefas.cancelar_todas()
+tarefas.aguardar_todas()
+sys.exit(codigo_saida)
\ No newline at end of file
@@ -0,0 +1,376 @@
+import os
+import sys
+import sqlite3
+from urllib.parse import quote
+import importacao
+
+# Migrações do esquema do hugobanco.db. A versão aplicada fica gravada em
+# PRAGMA user_version, então cada migração roda uma única vez por arquivo e
+# bancos antigos são atualizados no lugar ao serem abertos.
+
+
+def _v1_datas_iso_e_indice(connection):
+    connection.execute('''
+        CREATE TABLE IF NOT EXISTS transacoes(
+            id_transacao INTEGER PRIMARY KEY,
+            valor FLOAT,
+            nome_transacao VARCHAR(300),
+            tipo_transacao VARCHAR(100),
+            data VARCHAR(12)
+        )''')
+
+    # Datas fora do padrão ISO (ex.: '01/02/2024' ou '2024-02-01 10:00') são
+    # convertidas para 'YYYY-MM-DD', que ordena como texto e permite buscas
+    # por intervalo usando o índice.
+    def para_iso(texto):
+        try:
+            return importacao.converter_data(texto)
+        except (ValueError, AttributeError):
+            return texto
+
+    connection.create_function('para_iso', 1, para_iso, deterministic=True)
+    connection.execute('''
+        UPDATE transacoes SET data = para_iso(data)
+        WHERE data IS NOT NULL AND data NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+    ''')
+    connection.execute('CREATE INDEX IF NOT EXISTS idx_transacoes_data ON transacoes(data)')
+
+
+# Granularidades mantidas na tabela resumo_periodos e o formato strftime de cada uma
+GRANULARIDADES = {
+    'dia': '%Y-%m-%d',
+    'semana': '%Y-%W',
+    'mes': '%Y-%m',
+    'ano': '%Y',
+}
+
+# Qualquer tipo diferente de 'entrada' (ex.: 'Saída', 'saida') conta como saída
+EH_ENTRADA = "lower({linha}.tipo_transacao) = 'entrada'"
+
+
+def _sql_acumular(linha, sinal):
+    """Comandos que somam (sinal '+') ou subtraem (sinal '-') a linha NEW/OLD do resumo.
+
+    Linhas com data nula ou que o strftime não reconhece não pertencem a
+    nenhum período: ficam fora do resumo em vez de fazer a escrita falhar.
+    """
+    entrada = EH_ENTRADA.format(linha=linha)
+    valor = f'COALESCE({linha}.valor, 0)'
+    comandos = []
+    for granularidade, formato in GRANULARIDADES.items():
+        periodo = f"strftime('{formato}', {linha}.data)"
+        comandos.append(f'''
+            INSERT INTO resumo_periodos(granularidade, periodo, entradas, saidas, total, quantidade)
+            SELECT
+                '{granularidade}', {periodo},
+                {sinal}CASE WHEN {entrada} THEN {valor} ELSE 0 END,
+                {sinal}CASE WHEN {entrada} THEN 0 ELSE {valor} END,
+                {sinal}CASE WHEN {entrada} THEN {valor} ELSE -{valor} END,
+                {sinal}1
+            WHERE {periodo} IS NOT NULL
+            ON CONFLICT(granularidade, periodo) DO UPDATE SET
+                entradas = entradas + excluded.entradas,
+                saidas = saidas + excluded.saidas,
+                total = total + excluded.total,
+                quantidade = quantidade + excluded.quantidade;''')
+        if sinal == '-':
+            # Períodos que ficaram sem transações saem do resumo
+            comandos.append(f'''
+            DELETE FROM resumo_periodos
+            WHERE granularidade = '{granularidade}' AND periodo = {periodo}
+              AND quantidade <= 0;''')
+    return ''.join(comandos)
+
+
+def criar_gatilhos_resumo(connection):
+    for nome in ('trg_resumo_insert', 'trg_resumo_update', 'trg_resumo_delete'):
+        connection.execute(f'DROP TRIGGER IF EXISTS {nome}')
+    connection.execute(f'''
+        CREATE TRIGGER trg_resumo_insert AFTER INSERT ON transacoes BEGIN
+            {_sql_acumular('NEW', '+')}
+        END''')
+    connection.execute(f'''
+        CREATE TRIGGER trg_resumo_update AFTER UPDATE OF valor, tipo_transacao, data ON transacoes BEGIN
+            {_sql_acumular('OLD', '-')}
+            {_sql_acumular('NEW', '+')}
+        END''')
+    connection.execute(f'''
+        CREATE TRIGGER trg_resumo_delete AFTER DELETE ON transacoes BEGIN
+            {_sql_acumular('OLD', '-')}
+        END''')
+
+
+def reconstruir_resumo(connection, fonte='transacoes', ano=None):
+    """Recalcula resumo_periodos do zero a partir de transacoes (recuperação).
+
+    ``fonte`` é a expressão FROM com as linhas (com anos arquivados, a visão
+    que inclui as partições, apelidada de transacoes). Com ``ano`` só os
+    períodos desse ano são recalculados.
+    """
+    condicao, parametros = 'TRUE', []
+    if ano is None:
+        connection.execute('DELETE FROM resumo_periodos')
+    else:
+        # Todas as granularidades começam pelo ano ('%Y', '%Y-%m', '%Y-%W')
+        connection.execute('DELETE FROM resumo_periodos WHERE substr(periodo, 1, 4) = ?', (f'{int(ano):04d}',))
+        condicao, parametros = 'data >= ? AND data < ?', [f'{int(ano):04d}-01-01', f'{int(ano) + 1:04d}-01-01']
+    for granularidade in GRANULARIDADES:
+        connection.execute(f'''
+            INSERT INTO resumo_periodos(granularidade, periodo, entradas, saidas, total, quantidade)
+            {_sql_agregar(granularidade, fonte, condicao)}
+        ''', parametros)
+
+
+def _sql_agregar(granularidade, fonte='transacoes', condicao='TRUE'):
+    """SELECT com as linhas de resumo_periodos de ``granularidade`` calculadas a partir de ``fonte``.
+
+    Como nos gatilhos, linhas cuja data o strftime não reconhece ficam de fora.
+    """
+    entrada = EH_ENTRADA.format(linha='transacoes')
+    periodo = f"strftime('{GRANULARIDADES[granularidade]}', data)"
+    valor = 'COALESCE(valor, 0)'
+    return f'''
+        SELECT '{granularidade}', {periodo},
+               SUM(CASE WHEN {entrada} THEN {valor} ELSE 0 END),
+               SUM(CASE WHEN {entrada} THEN 0 ELSE {valor} END),
+               SUM(CASE WHEN {entrada} THEN {valor} ELSE -{valor} END),
+               COUNT(*)
+        FROM {fonte}
+        WHERE {periodo} IS NOT NULL AND {condicao}
+        GROUP BY 2'''
+
+
+def _v2_resumo_periodos(connection):
+    connection.execute('''
+        CREATE TABLE IF NOT EXISTS resumo_periodos(
+            granularidade TEXT NOT NULL,
+            periodo TEXT NOT NULL,
+            entradas FLOAT NOT NULL DEFAULT 0,
+            saidas FLOAT NOT NULL DEFAULT 0,
+            total FLOAT NOT NULL DEFAULT 0,
+            quantidade INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (granularidade, periodo)
+        ) WITHOUT ROWID''')
+    criar_gatilhos_resumo(connection)
+    reconstruir_resumo(connection)
+
+
+def criar_gatilhos_busca(connection):
+    """Gatilhos que mantêm o índice FTS5 de nomes sincronizado com transacoes."""
+    for nome in ('trg_busca_insert', 'trg_busca_update', 'trg_busca_delete'):
+        connection.execute(f'DROP TRIGGER IF EXISTS {nome}')
+    connection.execute('''
+        CREATE TRIGGER trg_busca_insert AFTER INSERT ON transacoes BEGIN
+            INSERT INTO transacoes_fts(rowid, nome_transacao) VALUES (NEW.id_transacao, NEW.nome_transacao);
+        END''')
+    connection.execute('''
+        CREATE TRIGGER trg_busca_update AFTER UPDATE OF nome_transacao ON transacoes BEGIN
+            INSERT INTO transacoes_fts(transacoes_fts, rowid, nome_transacao)
+            VALUES ('delete', OLD.id_transacao, OLD.nome_transacao);
+            INSERT INTO transacoes_fts(rowid, nome_transacao) VALUES (NEW.id_transacao, NEW.nome_transacao);
+        END''')
+    connection.execute('''
+        CREATE TRIGGER trg_busca_delete AFTER DELETE ON transacoes BEGIN
+            INSERT INTO transacoes_fts(transacoes_fts, rowid, nome_transacao)
+            VALUES ('delete', OLD.id_transacao, OLD.nome_transacao);
+        END''')
+
+
+# Índice de texto externo (não duplica os nomes); remove_diacritics faz
+# 'saida' encontrar 'Saída' e os índices de prefixo aceleram a busca
+# enquanto o usuário digita.
+SQL_INDICE_BUSCA = '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS transacoes_fts USING fts5(
+        nome_transacao,
+        content='transacoes',
+        content_rowid='id_transacao',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='1 2 3'
+    )'''
+
+
+def _v3_busca_por_nome(connection):
+    connection.execute(SQL_INDICE_BUSCA)
+    criar_gatilhos_busca(connection)
+    connection.execute("INSERT INTO transacoes_fts(transacoes_fts) VALUES ('rebuild')")
+
+
+def _v4_valor_em_centavos(connection):
+    # valor passa a ser gravado em centavos inteiros: somas no SQLite e no
+    # NumPy ficam exatas, sem o acúmulo de erro de arredondamento do FLOAT.
+    # O SQLite não altera o tipo de uma coluna, então a tabela é recriada com
+    # as colunas na mesma ordem e os mesmos ids.
+    connection.execute('''
+        CREATE TABLE transacoes_centavos(
+            id_transacao INTEGER PRIMARY KEY,
+            valor INTEGER,
+            nome_transacao VARCHAR(300),
+            tipo_transacao VARCHAR(100),
+            data VARCHAR(12)
+        )''')
+    connection.execute('''
+        INSERT INTO transacoes_centavos(id_transacao, valor, nome_transacao, tipo_transacao, data)
+        SELECT id_transacao, CAST(ROUND(valor * 100) AS INTEGER), nome_transacao, tipo_transacao, data
+        FROM transacoes''')
+    # Os gatilhos de resumo e de busca são removidos junto com a tabela antiga
+    connection.execute('DROP TABLE transacoes')
+    connection.execute('ALTER TABLE transacoes_centavos RENAME TO transacoes')
+    connection.execute('CREATE INDEX IF NOT EXISTS idx_transacoes_data ON transacoes(data)')
+
+    # O resumo também passa a guardar centavos
+    connection.execute('DROP TABLE IF EXISTS resumo_periodos')
+    connection.execute('''
+        CREATE TABLE resumo_periodos(
+            granularidade TEXT NOT NULL,
+            periodo TEXT NOT NULL,
+            entradas INTEGER NOT NULL DEFAULT 0,
+            saidas INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0,
+            quantidade INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (granularidade, periodo)
+        ) WITHOUT ROWID''')
+    criar_gatilhos_resumo(connection)
+    reconstruir_resumo(connection)
+    criar_gatilhos_busca(connection)
+    connection.execute("INSERT INTO transacoes_fts(transacoes_fts) VALUES ('rebuild')")
+
+
+def _v5_particoes(connection):
+    # Registro dos anos fechados movidos para arquivos próprios (particoes.py).
+    # O resumo por período continua cobrindo esses anos no arquivo principal.
+    connection.execute('''
+        CREATE TABLE IF NOT EXISTS particoes(
+            ano INTEGER PRIMARY KEY,
+            arquivo TEXT NOT NULL,
+            linhas INTEGER NOT NULL,
+            arquivado_em TEXT NOT NULL
+        )''')
+
+
+def _v6_saldo_diario(connection):
+    # Totais por dia no resumo (granularidade 'dia'). Com os anuais e os
+    # mensais eles formam um índice de somas de prefixo: o saldo em qualquer
+    # data soma só os anos anteriores, os meses do ano e os dias do mês
+    # (Conexao.saldo), sem percorrer transacoes.
+    criar_gatilhos_resumo(connection)
+    connection.execute("DELETE FROM resumo_periodos WHERE granularidade = 'dia'")
+    connection.execute(f'''
+        INSERT INTO resumo_periodos(granularidade, periodo, entradas, saidas, total, quantidade)
+        {_sql_agregar('dia')}''')
+    # Os anos arquivados (particoes.py) ficam em outros arquivos; ATTACH não é
+    # permitido dentro da transação da migração, então são lidos à parte
+    diretorio = os.path.dirname(connection.execute('PRAGMA database_list').fetchone()[2])
+    for ano, arquivo in connection.execute('SELECT ano, arquivo FROM particoes').fetchall():
+        caminho = os.path.join(diretorio, arquivo)
+        particao = sqlite3.connect(f'file:{quote(caminho)}?mode=ro', uri=True)
+        try:
+            linhas = particao.execute(_sql_agregar('dia')).fetchall()
+        finally:
+            particao.close()
+        connection.executemany('''
+            INSERT INTO resumo_periodos(granularidade, periodo, entradas, saidas, total, quantidade)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(granularidade, periodo) DO UPDATE SET
+                entradas = entradas + excluded.entradas,
+                saidas = saidas + excluded.saidas,
+                total = total + excluded.total,
+                quantidade = quantidade + excluded.quantidade''', linhas)
+
+
+def _v7_datas_invalidas_no_resumo(connection):
+    # Os gatilhos anteriores inseriam strftime(data) em resumo_periodos.periodo
+    # (NOT NULL) mesmo quando a data era nula ou irreconhecível, e a escrita
+    # inteira falhava; os novos deixam essas linhas fora do resumo
+    criar_gatilhos_resumo(connection)
+
+
+def _v8_ids_autoincremento(connection):
+    # Com anos arquivados (particoes.py) o maior id pode sair do principal; sem
+    # AUTOINCREMENT o SQLite reutilizaria nas inserções seguintes ids que já
+    # estão nas partições. AUTOINCREMENT guarda o maior id já usado em
+    # sqlite_sequence. A tabela é recriada como na migração 4, com os mesmos
+    # ids, então resumo_periodos e o índice FTS5 continuam valendo.
+    connection.execute('''
+        CREATE TABLE transacoes_autoincremento(
+            id_transacao INTEGER PRIMARY KEY AUTOINCREMENT,
+            valor INTEGER,  -- centavos
+            nome_transacao VARCHAR(300),
+            tipo_transacao VARCHAR(100),
+            data VARCHAR(12)
+        )''')
+    connection.execute('''
+        INSERT INTO transacoes_autoincremento(id_transacao, valor, nome_transacao, tipo_transacao, data)
+        SELECT id_transacao, valor, nome_transacao, tipo_transacao, data FROM transacoes''')
+    connection.execute('DROP TABLE transacoes')
+    connection.execute('ALTER TABLE transacoes_autoincremento RENAME TO transacoes')
+    connection.execute('CREATE INDEX IF NOT EXISTS idx_transacoes_data ON transacoes(data)')
+    criar_gatilhos_resumo(connection)
+    criar_gatilhos_busca(connection)
+
+    # O maior id já usado pode estar numa partição (lidas à parte, como na 6)
+    maior, = connection.execute('SELECT COALESCE(MAX(id_transacao), 0) FROM transacoes').fetchone()
+    diretorio = os.path.dirname(connection.execute('PRAGMA database_list').fetchone()[2])
+    for arquivo, in connection.execute('SELECT arquivo FROM particoes').fetchall():
+        caminho = os.path.join(diretorio, arquivo)
+        particao = sqlite3.connect(f'file:{quote(caminho)}?mode=ro', uri=True)
+        try:
+            maior = max(maior, particao.execute('SELECT COALESCE(MAX(id_transacao), 0) FROM transacoes').fetchone()[0])
+        finally:
+            particao.close()
+    connection.execute("DELETE FROM sqlite_sequence WHERE name = 'transacoes'")
+    connection.execute("INSERT INTO sqlite_sequence(name, seq) VALUES ('transacoes', ?)", (maior,))
+
+
+# (versão, função) em ordem crescente
+MIGRACOES = [
+    (1, _v1_datas_iso_e_indice),
+    (2, _v2_resumo_periodos),
+    (3, _v3_busca_por_nome),
+    (4, _v4_valor_em_centavos),
+    (5, _v5_particoes),
+    (6, _v6_saldo_diario),
+    (7, _v7_datas_invalidas_no_resumo),
+    (8, _v8_ids_autoincremento),
+]
+
+VERSAO_ATUAL = MIGRACOES[-1][0]
+
+
+def versao(connection):
+    return connection.execute('PRAGMA user_version').fetchone()[0]
+
+
+def migrar(connection):
+    """Aplica as migrações pendentes, cada uma em sua própria transação."""
+    for numero, migracao in MIGRACOES:
+        if versao(connection) >= numero:
+            continue
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            # Outro processo pode ter migrado enquanto esperávamos o lock
+            if versao(connection) >= numero:
+                connection.rollback()
+                continue
+            migracao(connection)
+            connection.execute(f'PRAGMA user_version = {numero}')
+            connection.commit()
+        except sqlite3.Error:
+            connection.rollback()
+            raise
+        print(f'Banco de dados migrado para a versão {numero}')
+    return versao(connection)
+
+
+if __name__ == '__main__':
+    # Uso: python migracoes.py [caminho_do_banco] [--reconstruir-resumo]
+    argumentos = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    caminho = argumentos[0] if argumentos else 'hugobanco.db'
+    connection = sqlite3.connect(caminho, uri=True)
+    print(f'Versão do esquema: {migrar(connection)}')
+    if '--reconstruir-resumo' in sys.argv:
+        import particoes  # o resumo também cobre os anos arquivados
+        fonte = particoes.fonte(particoes.sincronizar(connection))
+        with connection:
+            reconstruir_resumo(connection, fonte)
+        print('Resumo por período reconstruído')
+    connection.close()
@@ -0,0 +1,353 @@
+import bisect
+from collections import OrderedDict
+from PyQt5 import QtCore
+from conexao import Conexao, obter_pool
+import tarefas
+
+CABECALHOS = ["ID Transação", "Valor", "Nome da Transação", "Tipo", "Data", "Saldo após"]
+COLUNA_SALDO = 5
+DICA_SALDO = 'Saldo da conta logo após a transação, em ordem de data (não segue a ordem da lista)'
+# Exibido nas células cuja página (ou saldo) ainda está sendo lida
+CARREGANDO = '...'
+# Uma leitura que falha é tentada de novo quando a célula é repintada, até
+# este limite; depois a célula fica vazia até o próximo recarregamento
+MAX_TENTATIVAS = 3
+
+
+class ModeloTransacoes(QtCore.QAbstractTableModel):
+    """Modelo virtual da tabela principal.
+
+    O número de linhas vem de um COUNT no banco e as linhas são carregadas em
+    páginas de ``tamanho_pagina`` conforme a view pede para exibi-las. Só as
+    ``max_paginas`` páginas usadas mais recentemente ficam na memória, então o
+    consumo não cresce com o tamanho da tabela. A contagem, as páginas e os
+    saldos são lidos em segundo plano (tarefas.executar): enquanto a leitura não
+    chega, a célula mostra CARREGANDO e, quando chega, dataChanged faz a view
+    pedir os dados de novo. ``data`` nunca lê o banco na thread da interface.
+
+    Inserções, atualizações e exclusões feitas pelo Conexao chegam pelo sinal
+    ``alteracao`` e são aplicadas só na linha afetada, sem recarregar o modelo.
+
+    A coluna "Saldo após" traz o saldo da conta logo após cada transação na
+    ordem cronológica (data, id); como a lista segue a ordem de id, ela não é
+    um acumulado das linhas exibidas. É calculada por página, só quando
+    exibida, pelo índice de saldo diário do Conexao. Como
+    uma escrita muda o saldo de todas as transações posteriores, os saldos
+    calculados são descartados a cada alteração e recalculados sob demanda.
+    """
+
+    # (evento, linha) vindo de PoolConexoes.registrar_escrita; o sinal leva a
+    # alteração para a thread da interface se a escrita veio de outra thread
+    alteracao = QtCore.pyqtSignal(str, object)
+
+    def __init__(self, tamanho_pagina=500, max_paginas=20, parent=None):
+        super().__init__(parent)
+        self.tamanho_pagina = tamanho_pagina
+        self.max_paginas = max_paginas
+        self.filtros = {}
+        self._total = 0
+        self._paginas = OrderedDict()
+        self._saldos = {}
+        # Leituras de página e de saldo em andamento: chave -> (versão, tarefa)
+        self._leituras = {}
+        self._falhas = {}  # chave -> leituras que falharam
+        self._versao = 0
+        self._geracao = 0
+        self._tarefa = None
+        self.alteracao.connect(self._aplicar_alteracao)
+        obter_pool().adicionar_ouvinte(self.alteracao.emit)
+        self.recarregar()
+
+    # --- API usada pela tela principal -------------------------------------
+
+    def recarregar(self, ao_concluir=None):
+        """Reconta as linhas no banco em segundo plano e então descarta as páginas.
+
+        ``ao_concluir(total)`` é chamado na thread da interface quando o modelo
+        já reflete a nova contagem. Se outro recarregamento começar antes, o
+        resultado deste é descartado.
+        """
+        self._geracao += 1
+        geracao = self._geracao
+        if self._tarefa is not None:
+            self._tarefa.cancelar()
+        self._tarefa = tarefas.executar(
+            _contar, dict(self.filtros),
+            ao_concluir=lambda total: self._aplicar_contagem(geracao, total, ao_concluir),
+            ao_finalizar=lambda: self._contagem_finalizada(geracao), interna=True)
+
+    def _contagem_finalizada(self, geracao):
+        # Depois de ao_concluir; se a contagem falhou ou foi cancelada, o
+        # modelo volta a aplicar as alterações pontuais em vez de esperar por ela
+        if geracao == self._geracao:
+            self._tarefa = None
+
+    def _aplicar_contagem(self, geracao, total, ao_concluir):
+        if geracao != self._geracao:
+            return
+        self._tarefa = None
+        self._invalidar_leituras()
+        self._falhas.clear()
+        self.beginResetModel()
+        self._paginas.clear()
+        self._saldos.clear()
+        self._total = total
+        self.endResetModel()
+        if ao_concluir:
+            ao_concluir(total)
+
+    def definir_filtro(self, inicio=None, fim=None, tipo=None, nome=None, ao_concluir=None):
+        """Aplica filtros de data (intervalo semiaberto), tipo e nome e recarrega."""
+        self.filtros = {
+            chave: valor for chave, valor in
+            (('inicio', inicio), ('fim', fim), ('tipo', tipo), ('nome', nome)) if valor
+        }
+        self.recarregar(ao_concluir)
+
+    def limpar_filtro(self, ao_concluir=None):
+        self.definir_filtro(ao_concluir=ao_concluir)
+
+    def linha(self, row):
+        """Tupla completa da transação exibida na linha ``row``.
+
+        Lê a página na hora se ela não estiver carregada; para uso fora da view
+        (a view passa por ``data``, que lê em segundo plano).
+        """
+        numero, indice = divmod(row, self.tamanho_pagina)
+        pagina = self._pagina(numero)
+        if len(pagina) <= indice < self._total - numero * self.tamanho_pagina:
+            # Página encurtada por uma exclusão e ainda não completada
+            self._guardar_pagina(numero, _ler_pagina(None, *self._argumentos_pagina(numero)))
+            pagina = self._paginas[numero]
+        return pagina[indice] if indice < len(pagina) else None
+
+    # --- Alterações pontuais ---------------------------------------------------
+
+    def _aplicar_alteracao(self, evento, linha):
+        if evento == 'lote' or linha is None or self.filtros.get('nome') or self._tarefa is not None:
+            # Várias linhas mudaram, o filtro de nome depende do índice FTS5 ou
+            # uma contagem iniciada antes da escrita ainda vai chegar
+            self.recarregar()
+            return
+        self._invalidar_leituras()
+        self._saldos.clear()
+        if evento == 'inserida':
+            if self._atende_filtros(linha):
+                self._inserir(linha)
+        elif evento == 'removida':
+            if self._atende_filtros(linha):
+                self._remover(linha[0])
+        elif evento == 'atualizada':
+            posicao = self._localizar(linha[0])
+            if self.filtros and (posicao is None or not self._atende_filtros(linha)):
+                # A linha pode ter entrado ou saído do filtro sem estar carregada
+                self.recarregar()
+            elif posicao is not None:
+                numero, indice = posicao
+                self._paginas[numero][indice] = linha
+                row = numero * self.tamanho_pagina + indice
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(CABECALHOS) - 1))
+        if self._total:
+            self.dataChanged.emit(self.index(0, COLUNA_SALDO), self.index(self._total - 1, COLUNA_SALDO))
+
+    def _atende_filtros(self, linha):
+        """Os filtros de data e tipo avaliados em Python sobre a linha (id, valor, nome, tipo, data)."""
+        data = str(linha[4])
+        if self.filtros.get('inicio') and data < str(self.filtros['inicio']):
+            return False
+        if self.filtros.get('fim') and data >= str(self.filtros['fim']):
+            return False
+        if self.filtros.get('tipo'):
+            eh_entrada = str(linha[3]).lower() == 'entrada'
+            return eh_entrada == (self.filtros['tipo'].strip().lower() == 'entrada')
+        return True
+
+    def _localizar(self, id_transacao):
+        """(número da página, índice) do id nas páginas carregadas, ou None."""
+        for numero, pagina in self._paginas.items():
+            if pagina and pagina[0][0] <= id_transacao <= pagina[-1][0]:
+                indice = bisect.bisect_left(pagina, id_transacao, key=lambda linha: linha[0])
+                if indice < len(pagina) and pagina[indice][0] == id_transacao:
+                    return numero, indice
+                return None
+        return None
+
+    def _inserir(self, linha):
+        # O id novo é sempre o maior, então a linha entra no fim
+        row = self._total
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        pagina = self._paginas.get(row // self.tamanho_pagina)
+        if pagina is not None and len(pagina) == row % self.tamanho_pagina:
+            pagina.append(linha)
+        self._total += 1
+        self.endInsertRows()
+
+    def _remover(self, id_transacao):
+        posicao = self._localizar(id_transacao)
+        if posicao is None:
+            # Fora das páginas carregadas a posição da linha não é conhecida;
+            # descobri-la exigiria um COUNT na thread da interface. A contagem
+            # é refeita em segundo plano e as páginas são descartadas.
+            self.recarregar()
+            return
+        numero, indice = posicao
+        row = numero * self.tamanho_pagina + indice
+
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self._total -= 1
+        # As páginas seguintes deslocam uma posição; são descartadas e relidas
+        # sob demanda (por chave, a partir da página anterior)
+        for seguinte in [n for n in self._paginas if n > numero]:
+            del self._paginas[seguinte]
+            self._saldos.pop(seguinte, None)
+        del self._paginas[numero][indice]
+        self.endRemoveRows()
+        # A última linha da página passa a ser a primeira da página seguinte,
+        # que vem com a página relida em segundo plano
+        if numero * self.tamanho_pagina + len(self._paginas[numero]) < self._total:
+            self._agendar_pagina(numero)
+
+    # --- QAbstractTableModel ---------------------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._total
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(CABECALHOS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        numero, indice = divmod(index.row(), self.tamanho_pagina)
+        pagina = self._paginas.get(numero)
+        if pagina is None:
+            return CARREGANDO if self._agendar_pagina(numero) else None
+        self._paginas.move_to_end(numero)
+        if indice >= len(pagina):
+            return CARREGANDO if ('pagina', numero) in self._leituras else None
+        if index.column() == COLUNA_SALDO:
+            saldos = self._saldos.get(numero)
+            if saldos is None or len(saldos) != len(pagina):
+                return CARREGANDO if self._agendar(('saldos', numero), _calcular_saldos, list(pagina)) else None
+            saldo = saldos[indice]
+            return None if saldo is None else f'{saldo:.2f}'
+        return str(pagina[indice][index.column()])
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.ToolTipRole and orientation == QtCore.Qt.Horizontal and section == COLUNA_SALDO:
+            return DICA_SALDO
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            return CABECALHOS[section]
+        return str(section + 1)
+
+    # --- Paginação ---------------------------------------------------------------
+
+    def _pagina(self, numero):
+        pagina = self._paginas.get(numero)
+        if pagina is not None:
+            self._paginas.move_to_end(numero)
+            return pagina
+        self._guardar_pagina(numero, _ler_pagina(None, *self._argumentos_pagina(numero)))
+        return self._paginas[numero]
+
+    def _argumentos_pagina(self, numero):
+        # Rolagem sequencial: continua a partir do último id da página anterior
+        # (paginação por chave). Saltos longos caem no OFFSET.
+        anterior = self._paginas.get(numero - 1)
+        depois_de = anterior[-1][0] if anterior else None
+        return dict(self.filtros), numero * self.tamanho_pagina, self.tamanho_pagina, depois_de
+
+    def _guardar_pagina(self, numero, pagina):
+        self._paginas[numero] = pagina
+        self._paginas.move_to_end(numero)
+        self._saldos.pop(numero, None)
+        if len(self._paginas) > self.max_paginas:
+            descartada, _ = self._paginas.popitem(last=False)
+            self._saldos.pop(descartada, None)
+
+    def _agendar_pagina(self, numero):
+        return self._agendar(('pagina', numero), _ler_pagina, *self._argumentos_pagina(numero))
+
+    def _agendar(self, chave, funcao, *args):
+        """Roda a leitura ``funcao`` em segundo plano, uma vez por chave.
+
+        Retorna False se a leitura já falhou MAX_TENTATIVAS vezes e não foi
+        agendada; True se ela está em andamento.
+        """
+        if chave in self._leituras:
+            return True
+        if self._falhas.get(chave, 0) >= MAX_TENTATIVAS:
+            return False
+        versao = self._versao
+        tarefa = tarefas.executar(
+            funcao, *args,
+            ao_concluir=lambda resultado: self._aplicar_leitura(chave, versao, resultado),
+            ao_falhar=lambda erro: self._encerrar_leitura(chave, versao, falhou=True),
+            ao_finalizar=lambda: self._encerrar_leitura(chave, versao), interna=True)
+        self._leituras[chave] = (versao, tarefa)
+        return True
+
+    def _encerrar_leitura(self, chave, versao, falhou=False):
+        # Chamado quando a leitura falha e, sempre, quando a tarefa termina. Se a
+        # leitura ainda consta como em andamento ela falhou ou foi cancelada
+        # (uma tarefa cancelada não emite resultado nem erro): a chave é
+        # liberada e as células são repintadas para pedir de novo.
+        if self._leituras.get(chave, (None,))[0] != versao:
+            return
+        del self._leituras[chave]
+        if falhou:
+            self._falhas[chave] = self._falhas.get(chave, 0) + 1
+        self._emitir_pagina(chave[1], 0, len(CABECALHOS) - 1)
+
+    def _aplicar_leitura(self, chave, versao, resultado):
+        if versao != self._versao:
+            # Lida antes de uma alteração; a célula pede de novo quando for exibida
+            return
+        del self._leituras[chave]
+        self._falhas.pop(chave, None)
+        tipo, numero = chave
+        if tipo == 'pagina':
+            self._guardar_pagina(numero, resultado)
+            colunas = (0, len(CABECALHOS) - 1)
+        elif numero in self._paginas and len(resultado) == len(self._paginas[numero]):
+            self._saldos[numero] = resultado
+            colunas = (COLUNA_SALDO, COLUNA_SALDO)
+        else:
+            return
+        self._emitir_pagina(numero, *colunas)
+
+    def _invalidar_leituras(self):
+        # Leituras em andamento podem ter visto o banco antes da alteração. As
+        # células que mostravam CARREGANDO são repintadas e pedem de novo.
+        self._versao += 1
+        for (_, numero), (_, tarefa) in self._leituras.items():
+            tarefa.cancelar()
+            self._emitir_pagina(numero, 0, len(CABECALHOS) - 1)
+        self._leituras.clear()
+
+    def _emitir_pagina(self, numero, primeira_coluna, ultima_coluna):
+        inicio = numero * self.tamanho_pagina
+        fim = min(inicio + self.tamanho_pagina, self._total) - 1
+        if inicio <= fim:
+            self.dataChanged.emit(self.index(inicio, primeira_coluna), self.index(fim, ultima_coluna))
+
+
+# As leituras abaixo rodam em uma thread do pool, cada uma com conexão própria
+
+def _contar(tarefa, filtros):
+    with Conexao() as conexao:
+        return conexao.contar_transacoes(filtros)
+
+
+def _ler_pagina(tarefa, filtros, offset, tamanho, depois_de):
+    with Conexao() as conexao:
+        if depois_de is not None:
+            return conexao.read_page(depois_de, tamanho, filtros=filtros)
+        return conexao.read_janela(tamanho, offset=offset, filtros=filtros)
+
+
+def _calcular_saldos(tarefa, pagina):
+    with Conexao() as conexao:
+        return conexao.saldos_acumulados(pagina)
@@ -0,0 +1,287 @@
+import os
+import sys
+import sqlite3
+import datetime
+import argparse
+from urllib.parse import quote
+import migracoes
+
+# Particionamento opcional por ano. Um ano fechado pode ser movido para um
+# arquivo próprio (hugobanco_2019.db, ao lado do principal), compactado com
+# VACUUM e anexado somente leitura a cada conexão, de modo que o arquivo
+# principal fica só com o histórico recente, pequeno e no cache de páginas.
+#
+# - As partições ficam registradas na tabela particoes do banco principal e
+#   são anexadas como ano_AAAA por sincronizar(), chamada ao obter a conexão.
+# - A visão temporária todas_transacoes (UNION ALL do principal com as
+#   partições) mantém read_all e as leituras por id funcionando como antes;
+#   o SQLite aplica os filtros e a ordem por id em cada parte da união.
+# - Consultas com intervalo de datas usam fonte(anos, inicio, fim), que só
+#   inclui as partições dos anos do intervalo.
+# - resumo_periodos continua no principal com os totais dos anos arquivados,
+#   então totais por período e saldo não precisam abrir as partições.
+# - Anos arquivados são somente leitura. Uma transação nova com data num ano
+#   arquivado vai para o principal, que é sempre consultado.
+#
+# Uso: python particoes.py [--banco hugobanco.db] listar
+#      python particoes.py arquivar 2019 2020 [--compactar]
+#      python particoes.py arquivar --ate 2022
+#      python particoes.py restaurar 2019
+
+ESQUEMA = 'ano_{ano:04d}'
+VISAO = 'todas_transacoes'
+
+COLUNAS = 'id_transacao, valor, nome_transacao, tipo_transacao, data'
+
+
+def caminho_particao(caminho_banco, ano):
+    base, extensao = os.path.splitext(caminho_banco)
+    return f'{base}_{int(ano):04d}{extensao or ".db"}'
+
+
+def registradas(connection):
+    """[(ano, arquivo, linhas, arquivado_em)] das partições do banco, em ordem de ano."""
+    try:
+        return connection.execute(
+            'SELECT ano, arquivo, linhas, arquivado_em FROM main.particoes ORDER BY ano').fetchall()
+    except sqlite3.Error:
+        return []  # banco anterior à migração 5 (ex.: aberto somente leitura)
+
+
+def _caminho_principal(connection):
+    for _, nome, arquivo in connection.execute('PRAGMA database_list'):
+        if nome == 'main':
+            return arquivo
+    return ''
+
+
+def sincronizar(connection):
+    """Anexa as partições registradas (somente leitura) e recria a visão todas_transacoes.
+
+    Só altera a conexão quando o registro mudou, então pode ser chamada a cada
+    uso. A conexão precisa ter sido aberta com ``uri=True``. Retorna a tupla
+    dos anos anexados.
+    """
+    esperadas = {ESQUEMA.format(ano=ano): (ano, arquivo) for ano, arquivo, *_ in registradas(connection)}
+    anexadas = {nome for _, nome, _ in connection.execute('PRAGMA database_list') if nome.startswith('ano_')}
+    if anexadas == set(esperadas) and (not esperadas or _tem_visao(connection)):
+        return tuple(sorted(ano for ano, _ in esperadas.values()))
+
+    diretorio = os.path.dirname(_caminho_principal(connection))
+    for nome in anexadas - set(esperadas):
+        connection.execute(f'DETACH DATABASE {nome}')
+    anos = []
+    for nome, (ano, arquivo) in sorted(esperadas.items()):
+        if nome not in anexadas:
+            caminho = os.path.join(diretorio, arquivo)
+            try:
+                connection.execute(f"ATTACH DATABASE 'file:{quote(caminho)}?mode=ro' AS {nome}")
+            except sqlite3.Error as e:
+                print(f'Não foi possível anexar a partição de {ano} ({caminho}): {e}')
+                continue
+        anos.append(ano)
+
+    connection.execute(f'DROP VIEW IF EXISTS temp.{VISAO}')
+    if anos:
+        connection.execute(f'CREATE TEMP VIEW {VISAO} AS '
+                           + ' UNION ALL '.join(f'SELECT {COLUNAS} FROM {tabela}' for tabela in tabelas(anos)))
+    return tuple(anos)
+
+
+def _tem_visao(connection):
+    return connection.execute(
+        "SELECT 1 FROM temp.sqlite_master WHERE type = 'view' AND name = ?", (VISAO,)).fetchone() is not None
+
+
+def anos_no_intervalo(anos, inicio=None, fim=None):
+    """Anos arquivados que podem ter datas em inicio <= data < fim (datas ISO)."""
+    return [ano for ano in anos
+            if (not inicio or f'{ano + 1:04d}-01-01' > str(inicio))
+            and (not fim or f'{ano:04d}-01-01' < str(fim))]
+
+
+def tabelas(anos, inicio=None, fim=None):
+    """As tabelas de transações (principal primeiro) que podem ter datas em [inicio, fim)."""
+    return ['main.transacoes'] + [f'{ESQUEMA.format(ano=ano)}.transacoes'
+                                  for ano in anos_no_intervalo(anos, inicio, fim)]
+
+
+def fonte(anos, inicio=None, fim=None):
+    """Expressão para o FROM, apelidada de transacoes, com o principal e as partições do intervalo."""
+    relevantes = tabelas(anos, inicio, fim)
+    if len(relevantes) == 1:
+        return 'transacoes'
+    if len(relevantes) == len(anos) + 1:
+        return f'{VISAO} AS transacoes'
+    return '(' + ' UNION ALL '.join(f'SELECT {COLUNAS} FROM {tabela}' for tabela in relevantes) + ') AS transacoes'
+
+
+def subconsulta_busca(anos):
+    """SELECT dos rowids que atendem a uma consulta FTS5 no principal e nas partições ``anos``.
+
+    Tem um parâmetro (a consulta) para cada esquema: 1 + len(anos).
+    """
+    esquemas = ['main'] + [ESQUEMA.format(ano=ano) for ano in anos]
+    return ' UNION ALL '.join(f'SELECT rowid FROM {esquema}.transacoes_fts WHERE transacoes_fts MATCH ?'
+                              for esquema in esquemas)
+
+
+def arquivar_ano(connection, ano, tamanho_lote=50_000):
+    """Move as transações de ``ano`` (um ano fechado) para um arquivo próprio.
+
+    As linhas são copiadas com as escritas do principal bloqueadas (BEGIN
+    IMMEDIATE), o arquivo novo ganha índice de data e de busca e é compactado
+    com VACUUM, e só então elas são apagadas do principal e a partição é
+    registrada, na mesma transação. Retorna o número de transações movidas;
+    em caso de erro nada muda no principal e o arquivo novo é removido.
+    """
+    ano = int(ano)
+    if ano >= datetime.date.today().year:
+        raise ValueError(f'Só anos fechados podem ser arquivados ({ano} ainda está em aberto)')
+    existentes = registradas(connection)
+    if any(registrado == ano for registrado, *_ in existentes):
+        raise ValueError(f'O ano {ano} já está arquivado')
+    if len(existentes) >= connection.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED):
+        raise ValueError(f'Limite de {len(existentes)} bancos anexados do SQLite atingido')
+
+    principal = _caminho_principal(connection)
+    destino = caminho_particao(principal, ano)
+    inicio, fim = f'{ano:04d}-01-01', f'{ano + 1:04d}-01-01'
+    for sufixo in ('', '-journal', '-wal', '-shm'):
+        if os.path.exists(destino + sufixo):
+            os.remove(destino + sufixo)  # sobra de uma tentativa interrompida
+
+    particao = sqlite3.connect(destino)
+    try:
+        particao.execute('''
+            CREATE TABLE transacoes(
+                id_transacao INTEGER PRIMARY KEY,
+                valor INTEGER,  -- centavos
+                nome_transacao VARCHAR(300),
+                tipo_transacao VARCHAR(100),
+                data VARCHAR(12)
+            )''')
+        connection.execute('BEGIN IMMEDIATE')
+        # Os ids de transacoes são AUTOINCREMENT (migração 8): mesmo que o
+        # maior id saia do principal, o SQLite não o reutiliza
+        if connection.execute('SELECT 1 FROM main.transacoes WHERE data >= ? AND data < ? LIMIT 1',
+                              (inicio, fim)).fetchone() is None:
+            raise ValueError(f'Nenhuma transação em {ano}')
+
+        cursor = connection.execute(f'''
+            SELECT {COLUNAS} FROM main.transacoes
+            WHERE data >= ? AND data < ? ORDER BY id_transacao''', (inicio, fim))
+        linhas = 0
+        while True:
+            lote = cursor.fetchmany(tamanho_lote)
+            if not lote:
+                break
+            particao.executemany(f'INSERT INTO transacoes({COLUNAS}) VALUES (?, ?, ?, ?, ?)', lote)
+            linhas += len(lote)
+        particao.execute('CREATE INDEX idx_transacoes_data ON transacoes(data)')
+        particao.execute(migracoes.SQL_INDICE_BUSCA)
+        particao.execute("INSERT INTO transacoes_fts(transacoes_fts) VALUES ('rebuild')")
+        particao.execute(f'PRAGMA user_version = {migracoes.VERSAO_ATUAL}')
+        particao.commit()
+        particao.execute('VACUUM')
+        particao.close()
+
+        # Os gatilhos descontam as linhas apagadas do resumo; os totais do ano
+        # são guardados antes e repostos, pois continuam valendo
+        resumo = connection.execute(
+            'SELECT * FROM resumo_periodos WHERE substr(periodo, 1, 4) = ?', (f'{ano:04d}',)).fetchall()
+        connection.execute('DELETE FROM main.transacoes WHERE data >= ? AND data < ?', (inicio, fim))
+        connection.executemany('INSERT OR REPLACE INTO resumo_periodos VALUES (?, ?, ?, ?, ?, ?)', resumo)
+        connection.execute(
+            'INSERT INTO particoes(ano, arquivo, linhas, arquivado_em) VALUES (?, ?, ?, ?)',
+            (ano, os.path.basename(destino), linhas, datetime.datetime.now().isoformat(timespec='seconds')))
+        connection.commit()
+    except BaseException:
+        if connection.in_transaction:
+            connection.rollback()
+        particao.close()
+        if os.path.exists(destino):
+            os.remove(destino)
+        raise
+    return linhas
+
+
+def restaurar_ano(connection, ano):
+    """Devolve as transações de um ano arquivado para o banco principal e apaga a partição.
+
+    Retorna o número de transações restauradas.
+    """
+    ano = int(ano)
+    registro = {registrado: arquivo for registrado, arquivo, *_ in registradas(connection)}
+    if ano not in registro:
+        raise ValueError(f'O ano {ano} não está arquivado')
+    if ano not in sincronizar(connection):
+        raise ValueError(f'A partição de {ano} não pôde ser anexada')
+    esquema = ESQUEMA.format(ano=ano)
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+        cursor = connection.execute(
+            f'INSERT INTO main.transacoes({COLUNAS}) SELECT {COLUNAS} FROM {esquema}.transacoes')
+        linhas = cursor.rowcount
+        # Os gatilhos somaram de novo o que o resumo já tinha: recalcula o ano
+        migracoes.reconstruir_resumo(connection, 'main.transacoes AS transacoes', ano)
+        connection.execute('DELETE FROM particoes WHERE ano = ?', (ano,))
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    sincronizar(connection)
+    caminho = os.path.join(os.path.dirname(_caminho_principal(connection)), registro[ano])
+    try:
+        os.remove(caminho)
+    except OSError as e:  # outra conexão ainda pode estar com o arquivo aberto
+        print(f'Partição restaurada, mas o arquivo {caminho} não pôde ser removido: {e}')
+    return linhas
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Arquiva anos fechados em arquivos próprios')
+    parser.add_argument('--banco', default='hugobanco.db')
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+    subcomandos.add_parser('listar', help='mostra os anos arquivados')
+    arquivar = subcomandos.add_parser('arquivar', help='move anos fechados para partições')
+    arquivar.add_argument('anos', nargs='*', type=int)
+    arquivar.add_argument('--ate', type=int, help='arquiva todos os anos com dados até este, inclusive')
+    arquivar.add_argument('--compactar', action='store_true', help='executa VACUUM no banco principal no fim')
+    restaurar = subcomandos.add_parser('restaurar', help='devolve anos arquivados ao banco principal')
+    restaurar.add_argument('anos', nargs='+', type=int)
+    argumentos = parser.parse_args()
+
+    connection = sqlite3.connect(argumentos.banco, uri=True)
+    migracoes.migrar(connection)
+    codigo = 0
+    if argumentos.comando == 'listar':
+        for ano, arquivo, linhas, arquivado_em in registradas(connection):
+            caminho = os.path.join(os.path.dirname(os.path.abspath(argumentos.banco)), arquivo)
+            tamanho = os.path.getsize(caminho) / 1e6 if os.path.exists(caminho) else float('nan')
+            print(f'{ano}: {linhas} transações em {arquivo} ({tamanho:.1f} MB), arquivado em {arquivado_em}')
+    elif argumentos.comando == 'arquivar':
+        anos = list(argumentos.anos)
+        if argumentos.ate is not None:
+            arquivados = {ano for ano, *_ in registradas(connection)}
+            anos += [int(ano) for ano, in connection.execute(
+                "SELECT DISTINCT substr(data, 1, 4) FROM transacoes WHERE data < ? ORDER BY 1",
+                (f'{argumentos.ate + 1:04d}-01-01',)) if ano.isdigit() and int(ano) not in arquivados]
+        for ano in sorted(set(anos)):
+            try:
+                print(f'{ano}: {arquivar_ano(connection, ano)} transações arquivadas')
+            except (ValueError, sqlite3.Error, OSError) as e:
+                print(f'{ano}: não arquivado ({e})')
+                codigo = 1
+        if argumentos.compactar:
+            connection.execute('VACUUM')
+            print(f'Banco principal compactado: {os.path.getsize(argumentos.banco) / 1e6:.1f} MB')
+    else:
+        for ano in argumentos.anos:
+            try:
+                print(f'{ano}: {restaurar_ano(connection, ano)} transações restauradas')
+            except (ValueError, sqlite3.Error) as e:
+                print(f'{ano}: não restaurado ({e})')
+                codigo = 1
+    connection.close()
+    sys.exit(codigo)
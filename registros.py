@@ -0,0 +1,213 @@
+import array
+import sqlite3
+import datetime
+import contextlib
+
+# Representações compactas de transações em memória, alternativas à lista de
+# tuplas de Conexao.read_all. Transacao é um registro com __slots__ que
+# compartilha os textos repetidos de tipo e data; TransacaoBatch guarda as
+# colunas em buffers de array (8 bytes por id e por valor, 4 por data e por
+# nome, 2 por tipo) e só cria objetos Python quando uma linha é acessada.
+# Exemplo:
+#   with Conexao() as conexao:
+#       lote = conexao.read_all(formato='lote')
+#   lote[0].nome, lote.nbytes(), lote.colunas()  # colunas(): ColunasTransacoes sem cópia
+
+CAMPOS = ('id', 'valor', 'nome', 'tipo', 'data')
+
+# Marcadores nos buffers: valor nulo e data nula ou fora do formato AAAA-MM-DD
+VALOR_NULO = -2 ** 63
+DIA_INVALIDO = -2 ** 31
+
+_EPOCA = datetime.date(1970, 1, 1).toordinal()
+
+
+class Transacao:
+    """Uma transação com atributos nomeados.
+
+    Também se comporta como a tupla (id, valor, nome, tipo, data) de read_all
+    (índice, fatia, desempacotamento, comparação com tuplas), então pode ser
+    usada onde o código espera a tupla.
+    """
+
+    __slots__ = CAMPOS
+
+    def __init__(self, id, valor, nome, tipo, data):
+        self.id = id
+        self.valor = valor
+        self.nome = nome
+        self.tipo = tipo
+        self.data = data
+
+    def _tupla(self):
+        return (self.id, self.valor, self.nome, self.tipo, self.data)
+
+    def __getitem__(self, indice):
+        return self._tupla()[indice]
+
+    def __iter__(self):
+        return iter(self._tupla())
+
+    def __len__(self):
+        return len(CAMPOS)
+
+    def __eq__(self, outro):
+        if isinstance(outro, (Transacao, tuple)):
+            return self._tupla() == tuple(outro)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._tupla())
+
+    def __repr__(self):
+        return (f'Transacao(id={self.id!r}, valor={self.valor!r}, nome={self.nome!r}, '
+                f'tipo={self.tipo!r}, data={self.data!r})')
+
+
+def fabrica_registros():
+    """row_factory do sqlite3 que monta Transacao a partir das colunas de COLUNAS_TRANSACAO.
+
+    Tipo e data se repetem muito (dois tipos, alguns milhares de dias); cada
+    texto distinto é guardado uma vez e compartilhado pelas linhas do cursor.
+    """
+    compartilhados = {}
+
+    def fabrica(cursor, linha):
+        id_transacao, valor, nome, tipo, data = linha
+        return Transacao(id_transacao, valor, nome,
+                         compartilhados.setdefault(tipo, tipo), compartilhados.setdefault(data, data))
+    return fabrica
+
+
+class TransacaoBatch:
+    """Transações em colunas de array.
+
+    ``id`` e ``centavos`` são array('q'), ``tipo`` é array('h') com o índice de
+    cada tipo em ``tipos``, ``nome`` é array('i') com o índice em ``nomes`` e
+    ``data`` é array('i') com os dias desde 1970-01-01. Datas nulas ou fora do
+    formato AAAA-MM-DD ficam como DIA_INVALIDO, com o texto original em
+    ``datas_invalidas`` (posição -> texto), então o lote devolve exatamente as
+    mesmas linhas que read_all.
+    """
+
+    __slots__ = ('id', 'centavos', 'tipo', 'data', 'nome', 'tipos', 'nomes', 'datas_invalidas',
+                 '_indice_tipos', '_indice_nomes')
+
+    def __init__(self):
+        self.id = array.array('q')
+        self.centavos = array.array('q')
+        self.tipo = array.array('h')
+        self.data = array.array('i')
+        self.nome = array.array('i')
+        self.tipos = []
+        self.nomes = []
+        self.datas_invalidas = {}
+        self._indice_tipos = {}
+        self._indice_nomes = {}
+
+    def __len__(self):
+        return len(self.id)
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return [self[i] for i in range(*posicao.indices(len(self)))]
+        if posicao < 0:
+            posicao += len(self)
+        centavos = self.centavos[posicao]
+        dia = self.data[posicao]
+        if dia == DIA_INVALIDO:
+            data = self.datas_invalidas.get(posicao)
+        else:
+            data = datetime.date.fromordinal(dia + _EPOCA).isoformat()
+        return Transacao(self.id[posicao], None if centavos == VALOR_NULO else centavos / 100.0,
+                         self.nomes[self.nome[posicao]], self.tipos[self.tipo[posicao]], data)
+
+    def __iter__(self):
+        for posicao in range(len(self)):
+            yield self[posicao]
+
+    def tuplas(self):
+        """As linhas como lista de tuplas, no formato de read_all."""
+        return [registro._tupla() for registro in self]
+
+    def nbytes(self):
+        """Memória ocupada pelos buffers (sem contar os textos distintos de tipos e nomes)."""
+        colunas = (self.id, self.centavos, self.tipo, self.data, self.nome)
+        return sum(len(coluna) * coluna.itemsize for coluna in colunas)
+
+    def estender(self, ids, centavos, tipos, dias, nomes, textos_data):
+        """Acrescenta um lote de colunas (sequências do mesmo tamanho), como vêm de ler_lote."""
+        inicio = len(self.id)
+        self.id.extend(ids)
+        self.centavos.extend(centavos)
+        self.data.extend(dias)
+        _codificar(tipos, self._indice_tipos, self.tipos, self.tipo)
+        _codificar(nomes, self._indice_nomes, self.nomes, self.nome)
+        # O texto original só vem para datas que não cabem no formato compacto
+        if textos_data.count(None) != len(textos_data):
+            for deslocamento, texto in enumerate(textos_data):
+                if texto is not None:
+                    self.datas_invalidas[inicio + deslocamento] = texto
+
+    def colunas(self):
+        """Os mesmos dados como analise.ColunasTransacoes, compartilhando os buffers de id e nome."""
+        import numpy as np
+        import analise
+        centavos = np.frombuffer(self.centavos, dtype=np.int64)
+        entrada = np.array([str(tipo).lower() == 'entrada' for tipo in self.tipos], dtype=bool)
+        tipo = np.where(entrada, analise.TIPO_ENTRADA, analise.TIPO_SAIDA).astype(np.int8)
+        dias = np.frombuffer(self.data, dtype=np.int32).astype(np.int64)
+        dias[dias == DIA_INVALIDO] = analise._DIA_INVALIDO
+        if self.datas_invalidas:
+            # O mesmo julianday de ler_colunas, que aceita hora depois da data e
+            # normaliza dias como 2020-02-30
+            with contextlib.closing(sqlite3.connect(':memory:')) as calculadora:
+                for posicao, texto in self.datas_invalidas.items():
+                    dia, = calculadora.execute('SELECT CAST(julianday(?) - 2440587.5 AS INTEGER)', (texto,)).fetchone()
+                    if dia is not None:
+                        dias[posicao] = dia
+        return analise.ColunasTransacoes(
+            id=np.frombuffer(self.id, dtype=np.int64),
+            centavos=np.where(centavos == VALOR_NULO, 0, centavos),
+            tipo=tipo[np.frombuffer(self.tipo, dtype=np.int16)] if len(tipo) else np.empty(0, dtype=np.int8),
+            data=dias.view('datetime64[D]'),
+            nome=np.frombuffer(self.nome, dtype=np.int32),
+            nomes=['' if nome is None else nome for nome in self.nomes],
+        )
+
+
+def _codificar(valores, indice, distintos, destino):
+    # Só os valores distintos do lote passam pelo laço em Python; a tradução
+    # de cada linha para o código é feita pelo map em C
+    for valor in dict.fromkeys(valores):
+        if valor not in indice:
+            indice[valor] = len(distintos)
+            distintos.append(valor)
+    destino.extend(map(indice.__getitem__, valores))
+
+
+def ler_lote(cursor, where='', parametros=(), tamanho_lote=100_000, fonte='transacoes'):
+    """Lê transacoes em lotes de ``tamanho_lote`` e monta um TransacaoBatch.
+
+    Os centavos vêm direto da coluna valor e os dias desde 1970 são calculados
+    no SQLite; o texto da data só é lido quando ela não está no formato
+    AAAA-MM-DD. ``fonte`` é a expressão do FROM (ver particoes.fonte).
+    """
+    compacta = 'date(julianday(data)) = data'  # também recusa dias inexistentes, como 2021-02-29
+    cursor.execute(f'''
+        SELECT id_transacao,
+               COALESCE(valor, {VALOR_NULO}),
+               tipo_transacao,
+               CASE WHEN {compacta} THEN CAST(julianday(data) - 2440587.5 AS INTEGER) ELSE {DIA_INVALIDO} END,
+               nome_transacao,
+               CASE WHEN {compacta} THEN NULL ELSE data END
+        FROM {fonte} {where}
+        ORDER BY id_transacao
+    ''', parametros)
+    lote = TransacaoBatch()
+    while True:
+        linhas = cursor.fetchmany(tamanho_lote)
+        if not linhas:
+            break
+        lote.estender(*zip(*linhas))
+    return lote
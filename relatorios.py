@@ -0,0 +1,254 @@
+import os
+import time
+import itertools
+from fpdf import FPDF
+from conexao import Conexao, CAMINHO_BANCO, para_centavos, para_reais
+
+# Diretório padrão dos relatórios; pode ser trocado pela variável de ambiente
+DIRETORIO_RELATORIOS = os.environ.get('HUGOBANCO_RELATORIOS', os.path.expanduser('~'))
+
+# (título, largura em mm) das colunas da tabela de transações
+COLUNAS = [("ID", 16), ("Nome", 56), ("Tipo", 24), ("Valor", 30), ("Data", 30), ("Saldo após", 34)]
+ALTURA_LINHA = 7
+
+
+def caminho_padrao(nome_arquivo='relatorio_transacoes.pdf'):
+    return os.path.join(DIRETORIO_RELATORIOS, nome_arquivo)
+
+
+def _texto(valor):
+    # As fontes padrão do FPDF só aceitam latin-1
+    return str(valor).encode('latin-1', 'replace').decode('latin-1')
+
+
+def _moeda(valor):
+    try:
+        return f"R$ {float(valor):.2f}"
+    except (TypeError, ValueError):  # Caso o valor não possa ser convertido
+        return "Erro"
+
+
+class _BufferPDF:
+    """Buffer de saída para o FPDF 1.7 que acumula os pedaços em uma lista.
+
+    O FPDF 1.7 monta o arquivo final com ``self.buffer += texto``, copiando o
+    buffer inteiro a cada linha, o que fica quadrático em relatórios com
+    milhares de páginas. Implementa só o que o FPDF usa: +=, len e encode.
+    """
+
+    def __init__(self):
+        self._partes = []
+        self._tamanho = 0
+
+    def __iadd__(self, texto):
+        self._partes.append(texto)
+        self._tamanho += len(texto)
+        return self
+
+    def __len__(self):
+        return self._tamanho
+
+    def __str__(self):
+        return ''.join(self._partes)
+
+    def encode(self, *args):
+        return str(self).encode(*args)
+
+
+class DocumentoPDF(FPDF):
+    """Base dos PDFs gerados pelo sistema: título no topo e número da página no rodapé."""
+
+    titulo = ""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Versões novas (fpdf2) já usam um bytearray como buffer
+        if isinstance(self.buffer, str):
+            self.buffer = _BufferPDF()
+
+    def header(self):
+        self.set_font("Arial", "B", 12)
+        self.cell(0, 10, _texto(self.titulo), 0, 1, "C")
+        self.ln(10)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font("Arial", "I", 8)
+        self.cell(0, 10, _texto(f"Página {self.page_no()}"), 0, 0, "C")
+
+
+class RelatorioPDF(DocumentoPDF):
+    titulo = "Relatório de Transações"
+
+    def cabecalho_tabela(self):
+        self.set_font("Arial", "B", 10)
+        for titulo, largura in COLUNAS:
+            self.cell(largura, ALTURA_LINHA, titulo, 1)
+        self.ln()
+        self.set_font("Arial", "", 10)
+
+    def linha_transacao(self, transacao, saldo=None):
+        id_transacao, valor, nome, tipo, data = transacao[:5]
+        celulas = (str(id_transacao), _texto(nome)[:32], _texto(tipo), _moeda(valor), str(data),
+                   _moeda(saldo) if saldo is not None else "")
+        for (_, largura), texto in zip(COLUNAS, celulas):
+            self.cell(largura, ALTURA_LINHA, texto, 1)
+        self.ln()
+
+    def subtotal(self, rotulo, entradas, saidas):
+        # entradas e saidas em centavos
+        self.set_font("Arial", "B", 10)
+        entradas, saidas, liquido = para_reais(entradas), para_reais(saidas), para_reais(entradas - saidas)
+        texto = f"{rotulo}: entradas {_moeda(entradas)} | saídas {_moeda(saidas)} | líquido {_moeda(liquido)}"
+        self.cell(sum(largura for _, largura in COLUNAS), ALTURA_LINHA, _texto(texto), 1, 1)
+        self.set_font("Arial", "", 10)
+
+
+def _com_saldos(conexao, transacoes, tamanho_lote):
+    """(transação, saldo logo após ela) de cada transação, com os saldos calculados um lote por vez."""
+    while True:
+        lote = list(itertools.islice(transacoes, tamanho_lote))
+        if not lote:
+            return
+        yield from zip(lote, conexao.saldos_acumulados(lote))
+
+
+def gerar_relatorio_pdf(caminho_pdf=None, filtros=None, linhas_por_lote=1000, ao_progredir=None,
+                        caminho_banco=CAMINHO_BANCO, somente_leitura=False):
+    """Gera o relatório de transações lendo o banco em lotes.
+
+    As linhas vêm de Conexao.iter_transacoes (``linhas_por_lote`` de cada
+    vez) e são escritas direto no PDF, com quebra de página manual e subtotal de
+    entradas/saídas ao fim de cada página. A coluna "Saldo após" traz o saldo
+    da conta logo após cada transação em ordem cronológica (data, id), calculado
+    por lote (Conexao.saldos_acumulados). As linhas seguem a ordem de id, então
+    a coluna não é um acumulado das linhas impressas.
+    ``filtros`` aceita as mesmas chaves de Conexao.read_janela ('inicio',
+    'fim', 'tipo', 'nome').
+    ``ao_progredir(linhas, total)`` é chamado a cada lote; se levantar uma
+    exceção a geração é interrompida e o arquivo não é escrito.
+
+    Retorna um dicionário com o número de páginas, de linhas e a vazão em páginas/s.
+    """
+    caminho_pdf = caminho_pdf or caminho_padrao()
+    pasta = os.path.dirname(caminho_pdf)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    inicio = time.perf_counter()
+
+    pdf = RelatorioPDF()
+    pdf.set_auto_page_break(False)
+    limite_pagina = pdf.h - 20  # deixa espaço para o rodapé
+    pdf.add_page()
+    pdf.set_font("Arial", "", 12)
+
+    with Conexao(caminho_banco, somente_leitura=somente_leitura) as conexao:
+        # Totais calculados por agregação no banco, com o mesmo filtro do relatório
+        entradas, saidas, total = conexao.calcular_totais(filtros)
+        pdf.cell(0, 10, _texto(f"Total Líquido: R$ {total:.2f}"), 0, 1)
+        pdf.cell(0, 10, _texto(f"Entradas: R$ {entradas:.2f}   Saídas: R$ {saidas:.2f}"), 0, 1)
+        pdf.cell(0, 10, _texto("Detalhes das Transações"), 0, 1)
+        pdf.cabecalho_tabela()
+        total_linhas = conexao.contar_transacoes(filtros) if ao_progredir else 0
+
+        linhas = 0
+        # Subtotais acumulados em centavos inteiros, sem erro de arredondamento
+        entradas_pagina = saidas_pagina = 0
+        transacoes = conexao.iter_transacoes(linhas_por_lote, filtros=filtros)
+        for transacao, saldo in _com_saldos(conexao, transacoes, linhas_por_lote):
+            # Reserva espaço para a linha e para o subtotal da página
+            if pdf.get_y() + 2 * ALTURA_LINHA > limite_pagina:
+                pdf.subtotal(f"Subtotal da página {pdf.page_no()}", entradas_pagina, saidas_pagina)
+                pdf.add_page()
+                pdf.cabecalho_tabela()
+                entradas_pagina = saidas_pagina = 0
+            pdf.linha_transacao(transacao, saldo)
+            valor = para_centavos(transacao[1] or 0)
+            if str(transacao[3]).lower() == 'entrada':
+                entradas_pagina += valor
+            else:
+                saidas_pagina += valor
+            linhas += 1
+            if ao_progredir and linhas % linhas_por_lote == 0:
+                ao_progredir(linhas, total_linhas)
+        if ao_progredir:
+            ao_progredir(linhas, total_linhas)
+
+    pdf.subtotal(f"Subtotal da página {pdf.page_no()}", entradas_pagina, saidas_pagina)
+
+    # Salva o PDF no caminho especificado
+    pdf.output(caminho_pdf)
+    duracao = time.perf_counter() - inicio
+    paginas = pdf.page_no()
+    taxa = paginas / duracao if duracao > 0 else 0.0
+    print(f"Relatório salvo em {caminho_pdf}: {linhas} transações, {paginas} páginas ({taxa:.1f} páginas/s)")
+    return {'paginas': paginas, 'linhas': linhas, 'segundos': duracao, 'paginas_por_segundo': taxa}
+
+
+def salvar_dataframe_pdf(df, caminho_pdf, titulo="", linhas_por_bloco=5000):
+    """Escreve um DataFrame como tabela de texto no PDF, em quantas páginas precisar.
+
+    As larguras das colunas são estimadas pelo cabeçalho e por uma amostra das
+    primeiras linhas; tabelas com muitas colunas usam página deitada e fonte
+    menor. As células são formatadas por coluna (vetorizado no pandas) em blocos
+    de ``linhas_por_bloco`` linhas, sem gerar imagens intermediárias.
+    """
+    pasta = os.path.dirname(caminho_pdf)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+
+    colunas = [str(coluna) for coluna in df.columns]
+    pdf = DocumentoPDF(orientation='L' if len(colunas) > 6 else 'P')
+    pdf.titulo = titulo
+    pdf.set_auto_page_break(False)
+    pdf.add_page()
+    if not colunas:
+        pdf.output(caminho_pdf)
+        return caminho_pdf
+
+    largura_util = pdf.w - pdf.l_margin - pdf.r_margin
+    tamanho_fonte = max(6, min(10, 120 // len(colunas)))  # 10 pt até 12 colunas
+    pdf.set_font("Arial", "", tamanho_fonte)
+
+    # Largura proporcional ao maior texto de cada coluna (cabeçalho + amostra)
+    amostra = _formatar_bloco(df.head(200))
+    tamanhos = [max([len(coluna)] + [len(texto) for texto in amostra[i]]) + 1
+                for i, coluna in enumerate(colunas)]
+    larguras = [largura_util * tamanho / sum(tamanhos) for tamanho in tamanhos]
+    largura_caractere = pdf.get_string_width('0')
+    max_caracteres = [max(1, int(largura / largura_caractere)) for largura in larguras]
+    altura = tamanho_fonte * 0.6
+    limite_pagina = pdf.h - 20
+
+    def cabecalho():
+        pdf.set_font("Arial", "B", tamanho_fonte)
+        for coluna, largura, limite in zip(colunas, larguras, max_caracteres):
+            pdf.cell(largura, altura, _texto(coluna)[:limite], 1, 0, "C")
+        pdf.ln()
+        pdf.set_font("Arial", "", tamanho_fonte)
+
+    cabecalho()
+    for inicio in range(0, len(df), linhas_por_bloco):
+        bloco = _formatar_bloco(df.iloc[inicio:inicio + linhas_por_bloco])
+        for linha in zip(*bloco):
+            if pdf.get_y() + altura > limite_pagina:
+                pdf.add_page()
+                cabecalho()
+            for texto, largura, limite in zip(linha, larguras, max_caracteres):
+                pdf.cell(largura, altura, texto[:limite], 1)
+            pdf.ln()
+
+    pdf.output(caminho_pdf)
+    return caminho_pdf
+
+
+def _formatar_bloco(bloco):
+    """Converte cada coluna do bloco em uma lista de textos prontos para o PDF."""
+    colunas = []
+    for _, serie in bloco.items():
+        if serie.dtype.kind == 'f':
+            textos = serie.map('{:.2f}'.format)
+        else:
+            textos = serie.astype(str)
+        colunas.append([_texto(texto) for texto in textos.tolist()])
+    return colunas
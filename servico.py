@@ -0,0 +1,244 @@
+import os
+import json
+import asyncio
+import sqlite3
+import argparse
+import datetime
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+import migracoes
+from conexao import (Conexao, CAMINHO_BANCO, CABECALHO_EXPORTACAO, SQL_INSERIR, obter_pool, para_centavos,
+                     para_data)
+from instrumentacao import metricas
+
+# Serviço HTTP/JSON local sobre o Conexao, para que outros processos gravem e
+# consultem transações sem passar pela interface. O laço asyncio só cuida da
+# rede; cada operação no banco roda em um pequeno pool dedicado de threads,
+# que compartilham as conexões do PoolConexoes. Exemplo:
+#   python servico.py --porta 8765
+#   curl -X POST localhost:8765/transacoes -d '{"valor": 10.5, "nome": "Pix", "tipo": "Saída", "data": "2024-05-01"}'
+#
+# Rotas:
+#   POST /transacoes                 {valor, nome, tipo, data} -> transação gravada
+#   POST /transacoes/lote            [{valor, nome, tipo, data}, ...] -> {"inseridas": n}
+#   GET  /transacoes/<id>            -> transação
+#   GET  /totais/<dia|semana|mes|ano> -> [{periodo, entradas, saidas, total}, ...]
+#   GET  /saldo[?ate=AAAA-MM-DD]     -> {"saldo": ...}
+#   GET  /variacao?de=...&ate=...    -> {"variacao": ...} entre as duas datas, inclusive
+#   GET  /metricas                   -> snapshot de instrumentacao e da fila de escrita
+
+LIMITE_CORPO = 64 * 1024 * 1024  # lotes grandes cabem, mas não sem limite
+MOTIVOS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class ErroRequisicao(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def _como_dict(linha):
+    return dict(zip(CABECALHO_EXPORTACAO, linha))
+
+
+def _campos(objeto):
+    try:
+        valor, nome, tipo, data = objeto['valor'], objeto['nome'], objeto['tipo'], objeto['data']
+    except (KeyError, TypeError):
+        raise ErroRequisicao(400, 'Cada transação precisa de valor, nome, tipo e data')
+    try:
+        if valor is None or isinstance(valor, bool):
+            raise ValueError(valor)
+        para_centavos(valor)
+    except (ArithmeticError, ValueError):  # decimal.InvalidOperation para textos como 'abc'
+        raise ErroRequisicao(400, f'valor inválido: {valor!r}')
+    for campo, texto in (('nome', nome), ('tipo', tipo)):
+        if not isinstance(texto, str) or not texto.strip():
+            raise ErroRequisicao(400, f'{campo} deve ser um texto não vazio')
+    return valor, nome, tipo, _data(data)
+
+
+def _data(texto, campo='data'):
+    """A data normalizada por para_data (aceita também DD/MM/AAAA); 400 se não for uma data."""
+    data = para_data(texto)
+    try:
+        if datetime.date.fromisoformat(data).isoformat() == data:
+            return data
+    except (TypeError, ValueError):
+        pass
+    raise ErroRequisicao(400, f'{campo} inválida: {texto!r} (use AAAA-MM-DD)')
+
+
+class Servico:
+    """Servidor HTTP/1.1 mínimo (keep-alive, corpo JSON) sobre um pool de threads SQLite."""
+
+    def __init__(self, caminho_banco=CAMINHO_BANCO, threads=4):
+        self.caminho_banco = caminho_banco
+        # Uma conexão ociosa por thread, para não abrir e fechar a cada requisição
+        obter_pool(caminho_banco).tamanho_maximo = max(obter_pool(caminho_banco).tamanho_maximo, threads)
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='sqlite')
+        # A fila de escrita tem conexão própria; só enfileirar não bloqueia o laço
+        self._fila = obter_pool(caminho_banco).fila_escrita()
+
+    async def _no_banco(self, metodo, *args):
+        def executar():
+            with Conexao(self.caminho_banco) as conexao:
+                return getattr(conexao, metodo)(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, executar)
+
+    # --- Rotas -----------------------------------------------------------------
+
+    async def despachar(self, metodo, alvo, corpo):
+        url = urlsplit(alvo)
+        partes = [parte for parte in url.path.split('/') if parte]
+        consulta = {chave: valores[-1] for chave, valores in parse_qs(url.query).items()}
+
+        if partes == ['transacoes']:
+            self._exigir(metodo, 'POST')
+            # Inserções avulsas vão para a fila com commit em grupo: clientes
+            # simultâneos dividem o mesmo commit, e o laço só espera o Future
+            valor, nome, tipo, data = _campos(self._json(corpo))
+            futuro = self._fila.enviar(SQL_INSERIR, (para_centavos(valor), nome, tipo, data), 'inserida')
+            return 201, _como_dict(await asyncio.wrap_future(futuro))
+
+        if partes == ['transacoes', 'lote']:
+            self._exigir(metodo, 'POST')
+            objetos = self._json(corpo)
+            if isinstance(objetos, dict):
+                objetos = objetos.get('transacoes')
+            if not isinstance(objetos, list):
+                raise ErroRequisicao(400, 'Envie uma lista de transações')
+            transacoes = [_campos(objeto) for objeto in objetos]
+            inseridas = await self._no_banco('insert_many', transacoes)
+            if inseridas < len(transacoes):
+                # insert_many trata o erro do banco e para no lote que falhou
+                return 500, {'erro': f'Só {inseridas} de {len(transacoes)} transações foram inseridas',
+                             'inseridas': inseridas}
+            return 201, {'inseridas': inseridas}
+
+        if len(partes) == 2 and partes[0] == 'transacoes':
+            self._exigir(metodo, 'GET')
+            if not partes[1].isdigit():
+                raise ErroRequisicao(400, 'id inválido')
+            linha = await self._no_banco('read_one', int(partes[1]))
+            if linha is None:
+                raise ErroRequisicao(404, f'Transação {partes[1]} não encontrada')
+            return 200, _como_dict(linha)
+
+        if len(partes) == 2 and partes[0] == 'totais':
+            self._exigir(metodo, 'GET')
+            if partes[1] not in migracoes.GRANULARIDADES:
+                raise ErroRequisicao(404, f'Granularidade desconhecida: {partes[1]}')
+            linhas = await self._no_banco('calcular_total_por_periodo', partes[1])
+            return 200, [dict(zip(('periodo', 'entradas', 'saidas', 'total'), linha)) for linha in linhas]
+
+        if partes == ['saldo']:
+            self._exigir(metodo, 'GET')
+            ate = _data(consulta['ate'], 'ate') if 'ate' in consulta else None
+            return 200, {'saldo': await self._no_banco('saldo', ate)}
+
+        if partes == ['variacao']:
+            self._exigir(metodo, 'GET')
+            if 'de' not in consulta or 'ate' not in consulta:
+                raise ErroRequisicao(400, 'Informe de e ate')
+            de, ate = _data(consulta['de'], 'de'), _data(consulta['ate'], 'ate')
+            return 200, {'variacao': await self._no_banco('variacao', de, ate)}
+
+        if partes == ['metricas']:
+            self._exigir(metodo, 'GET')
+            return 200, dict(metricas.snapshot(), fila_escrita=self._fila.estatisticas())
+
+        raise ErroRequisicao(404, f'Rota desconhecida: {url.path}')
+
+    @staticmethod
+    def _exigir(metodo, esperado):
+        if metodo != esperado:
+            raise ErroRequisicao(405, f'Use {esperado}')
+
+    @staticmethod
+    def _json(corpo):
+        try:
+            return json.loads(corpo or b'null')
+        except ValueError:
+            raise ErroRequisicao(400, 'Corpo não é um JSON válido')
+
+    # --- Protocolo -------------------------------------------------------------
+
+    async def atender(self, reader, writer):
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                metodo, alvo, versao = linha.decode('latin-1').split()
+                cabecalhos = {}
+                while True:
+                    cabecalho = await reader.readline()
+                    if cabecalho in (b'\r\n', b'\n', b''):
+                        break
+                    nome, _, valor = cabecalho.decode('latin-1').partition(':')
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+                tamanho = int(cabecalhos.get('content-length', 0))
+
+                try:
+                    if tamanho > LIMITE_CORPO:
+                        raise ErroRequisicao(413, 'Corpo grande demais')
+                    corpo = await reader.readexactly(tamanho) if tamanho else b''
+                    status, resposta = await self.despachar(metodo.upper(), alvo, corpo)
+                except ErroRequisicao as e:
+                    status, resposta = e.status, {'erro': str(e)}
+                except sqlite3.Error as e:
+                    status, resposta = 500, {'erro': f'Erro no banco de dados: {e}'}
+                except Exception as e:
+                    print(f'Erro ao atender {metodo} {alvo}: {e}')
+                    status, resposta = 500, {'erro': str(e)}
+
+                manter = versao == 'HTTP/1.1' and cabecalhos.get('connection', '').lower() != 'close'
+                dados = json.dumps(resposta, ensure_ascii=False).encode('utf-8')
+                writer.write((f'HTTP/1.1 {status} {MOTIVOS[status]}\r\n'
+                              'Content-Type: application/json; charset=utf-8\r\n'
+                              f'Content-Length: {len(dados)}\r\n'
+                              f'{"" if manter else "Connection: close" + chr(13) + chr(10)}\r\n').encode('latin-1')
+                             + dados)
+                await writer.drain()
+                if not manter or status == 413:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass  # cliente desconectou ou mandou uma requisição malformada
+        finally:
+            writer.close()
+
+    async def servir(self, host='127.0.0.1', porta=8765, socket_unix=None):
+        if socket_unix:
+            servidor = await asyncio.start_unix_server(self.atender, path=socket_unix)
+            print(f'Servindo em unix:{socket_unix}', flush=True)
+        else:
+            servidor = await asyncio.start_server(self.atender, host, porta)
+            host, porta = servidor.sockets[0].getsockname()[:2]
+            print(f'Servindo em http://{host}:{porta}', flush=True)
+        async with servidor:
+            await servidor.serve_forever()
+
+    def fechar(self):
+        self.executor.shutdown(wait=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serviço HTTP/JSON local de transações')
+    parser.add_argument('--banco', default=CAMINHO_BANCO)
+    parser.add_argument('--host', default='127.0.0.1', help='padrão: só conexões locais')
+    parser.add_argument('--porta', type=int, default=8765, help='0 escolhe uma porta livre')
+    parser.add_argument('--unix', help='escuta neste socket Unix em vez de TCP')
+    parser.add_argument('--threads', type=int, default=4, help='threads dedicadas ao SQLite')
+    argumentos = parser.parse_args()
+
+    servico = Servico(argumentos.banco, argumentos.threads)
+    try:
+        asyncio.run(servico.servir(argumentos.host, argumentos.porta, argumentos.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servico.fechar()
+        if argumentos.unix and os.path.exists(argumentos.unix):
+            os.remove(argumentos.unix)
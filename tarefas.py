@@ -0,0 +1,108 @@
+import threading
+import traceback
+from PyQt5 import QtCore
+
+# Camada de tarefas em segundo plano para a interface. Consultas ao banco,
+# importações e relatórios rodam no QThreadPool e devolvem o resultado para a
+# thread da interface por sinais (conexões enfileiradas do Qt). Cada tarefa que
+# usa o banco abre seu próprio `with Conexao()`, e o pool de conexões entrega
+# uma conexão exclusiva para cada thread.
+
+
+class TarefaCancelada(Exception):
+    pass
+
+
+class SinaisTarefa(QtCore.QObject):
+    progresso = QtCore.pyqtSignal(int, int)  # (feito, total); total 0 quando desconhecido
+    resultado = QtCore.pyqtSignal(object)
+    erro = QtCore.pyqtSignal(str)
+    finalizado = QtCore.pyqtSignal()
+
+
+class Tarefa(QtCore.QRunnable):
+    """Executa ``funcao(tarefa, *args, **kwargs)`` em uma thread do pool.
+
+    A função recebe a própria tarefa para informar progresso
+    (``tarefa.informar_progresso``) e para encerrar cedo quando cancelada
+    (``tarefa.verificar_cancelamento`` levanta TarefaCancelada).
+    """
+
+    def __init__(self, funcao, *args, **kwargs):
+        super().__init__()
+        self.funcao = funcao
+        self.args = args
+        self.kwargs = kwargs
+        self.sinais = SinaisTarefa()
+        self._cancelada = threading.Event()
+
+    def cancelar(self):
+        self._cancelada.set()
+
+    @property
+    def cancelada(self):
+        return self._cancelada.is_set()
+
+    def verificar_cancelamento(self):
+        if self.cancelada:
+            raise TarefaCancelada()
+
+    def informar_progresso(self, feito, total=0):
+        self.verificar_cancelamento()
+        self.sinais.progresso.emit(int(feito), int(total))
+
+    def run(self):
+        try:
+            resultado = self.funcao(self, *self.args, **self.kwargs)
+        except TarefaCancelada:
+            print('Tarefa cancelada')
+        except Exception as e:
+            traceback.print_exc()
+            self.sinais.erro.emit(str(e))
+        else:
+            if not self.cancelada:
+                self.sinais.resultado.emit(resultado)
+        finally:
+            self.sinais.finalizado.emit()
+
+
+# Tarefas em andamento; a referência mantém os sinais vivos até o fim da execução
+_ativas = set()
+
+
+def executar(funcao, *args, ao_concluir=None, ao_falhar=None, ao_progredir=None, ao_finalizar=None,
+             interna=False, **kwargs):
+    """Agenda ``funcao`` no pool global do Qt e retorna a Tarefa criada.
+
+    Os callbacks são chamados na thread da interface. ``ao_finalizar()`` é
+    chamado sempre, depois de ``ao_concluir`` ou ``ao_falhar``, inclusive
+    quando a tarefa foi cancelada e nenhum dos dois é chamado. Tarefas com
+    ``interna=True`` (leituras do próprio modelo da tabela, por exemplo) não
+    são canceladas por cancelar_todas, que atende o Esc do usuário.
+    """
+    tarefa = Tarefa(funcao, *args, **kwargs)
+    tarefa.interna = interna
+    if ao_concluir:
+        tarefa.sinais.resultado.connect(ao_concluir)
+    if ao_falhar:
+        tarefa.sinais.erro.connect(ao_falhar)
+    if ao_progredir:
+        tarefa.sinais.progresso.connect(ao_progredir)
+    if ao_finalizar:
+        tarefa.sinais.finalizado.connect(ao_finalizar)
+    _ativas.add(tarefa)
+    tarefa.sinais.finalizado.connect(lambda: _ativas.discard(tarefa))
+    QtCore.QThreadPool.globalInstance().start(tarefa)
+    return tarefa
+
+
+def cancelar_todas():
+    """Cancela as tarefas em andamento, menos as internas (ver executar)."""
+    for tarefa in list(_ativas):
+        if not tarefa.interna:
+            tarefa.cancelar()
+
+
+def aguardar_todas(timeout_ms=-1):
+    """Espera as tarefas em andamento terminarem (usado ao fechar a aplicação)."""
+    return QtCore.QThreadPool.globalInstance().waitForDone(timeout_ms)
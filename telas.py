@@ -0,0 +1,39 @@
+import importlib
+from PyQt5 import QtWidgets
+from compilar_ui import hash_ui
+
+# Cache das classes de janela já montadas a partir dos módulos compilados
+_classes = {}
+
+
+def carregar(nome):
+    """Cria a janela do formulário ``nome`` (ex.: 'inserir_dados').
+
+    Usa o módulo pré-compilado ui_<nome>.py, que só instancia widgets, em vez
+    de interpretar o XML do .ui a cada abertura. Se o módulo não existir ou
+    tiver sido gerado de uma versão anterior do .ui, volta para uic.loadUi.
+    """
+    classe = _classes.get(nome)
+    if classe is None:
+        classe = _classe_compilada(nome)
+        if classe is None:
+            print(f'ui_{nome}.py ausente ou desatualizado; rode "python compilar_ui.py"')
+            from PyQt5 import uic
+            return uic.loadUi(f'{nome}.ui')
+        _classes[nome] = classe
+    janela = classe()
+    janela.setupUi(janela)
+    return janela
+
+
+def _classe_compilada(nome):
+    try:
+        modulo = importlib.import_module(f'ui_{nome}')
+    except ImportError:
+        return None
+    if getattr(modulo, 'HASH_UI', None) != hash_ui(f'{nome}.ui'):
+        return None
+    formulario = next(valor for chave, valor in vars(modulo).items() if chave.startswith('Ui_'))
+    # Todos os formulários do projeto têm QMainWindow como raiz. Os widgets
+    # criados por setupUi viram atributos da própria janela, como no loadUi
+    return type(nome, (QtWidgets.QMainWindow, formulario), {})
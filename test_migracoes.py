@@ -0,0 +1,113 @@
+import os
+import io
+import sqlite3
+import tempfile
+import unittest
+import contextlib
+import migracoes
+from conexao import Conexao, obter_pool
+
+# Uso: python -m unittest test_migracoes   (ou python -m pytest test_migracoes.py)
+
+
+class TestDatasInvalidas(unittest.TestCase):
+    """Bancos com datas nulas ou irreconhecíveis migram e continuam aceitando escritas."""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'antigo.db')
+        # Esquema da versão 0, antes de qualquer migração
+        connection = sqlite3.connect(self.caminho)
+        connection.execute('''
+            CREATE TABLE transacoes(
+                id_transacao INTEGER PRIMARY KEY,
+                valor FLOAT,
+                nome_transacao VARCHAR(300),
+                tipo_transacao VARCHAR(100),
+                data VARCHAR(12)
+            )''')
+        connection.executemany(
+            'INSERT INTO transacoes(valor, nome_transacao, tipo_transacao, data) VALUES (?, ?, ?, ?)',
+            [(10.0, 'Salário', 'Entrada', '2024-01-05'),
+             (2.5, 'Padaria', 'Saída', '05/01/2024'),   # para_iso converte
+             (7.0, 'Sem data', 'Saída', None),
+             (3.0, 'Data ruim', 'Saída', 'ontem')])   # para_iso não reconhece
+        connection.commit()
+        connection.close()
+
+    def tearDown(self):
+        obter_pool(self.caminho).fechar()
+        self.diretorio.cleanup()
+
+    def _abrir(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return Conexao(self.caminho)
+
+    def test_migra_banco_com_data_invalida(self):
+        conexao = self._abrir()
+        self.assertIsNotNone(conexao.connection)
+        self.assertEqual(migracoes.versao(conexao.connection), migracoes.VERSAO_ATUAL)
+        self.assertEqual(conexao.contar_transacoes(), 4)
+        # Só as linhas com data reconhecida entram no resumo
+        self.assertEqual(conexao.calcular_total_por_periodo('mes'), [('2024-01', 10.0, 2.5, 7.5)])
+        conexao.close()
+
+    def test_escritas_com_data_nula_ou_fora_do_padrao(self):
+        conexao = self._abrir()
+        with contextlib.redirect_stdout(io.StringIO()):
+            sem_data = conexao.insert_transacao(1, 'a', 'Entrada', None)
+            brasileira = conexao.insert_transacao(1, 'b', 'Entrada', '01/02/2024')
+            desconhecida = conexao.insert_transacao(1, 'c', 'Entrada', 'amanhã')
+            atualizada = conexao.update_transacao(sem_data[0], 'a', 4, 'Saída', 'ontem')
+            removida = conexao.delete_transacao(desconhecida[0])
+        self.assertIsNotNone(sem_data)
+        self.assertEqual(brasileira[4], '2024-02-01')
+        self.assertEqual(desconhecida[4], 'amanhã')
+        self.assertEqual(atualizada[4], 'ontem')
+        self.assertIsNotNone(removida)
+        self.assertEqual(conexao.calcular_total_por_periodo('mes'),
+                         [('2024-01', 10.0, 2.5, 7.5), ('2024-02', 1.0, 0.0, 1.0)])
+        conexao.close()
+
+
+    def test_leituras_por_data_com_entrada_malformada(self):
+        conexao = self._abrir()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(conexao.read_data_por_dia('abc'), [])
+            self.assertEqual(conexao.read_data_por_dia(None), [])
+            self.assertEqual(conexao.read_data_por_ano('abc'), [])
+            self.assertEqual(conexao.read_data_por_mes(2024, 'janeiro'), [])
+            # O formato DD/MM/AAAA é normalizado como nas escritas
+            self.assertEqual(len(conexao.read_data_por_dia('05/01/2024')), 2)
+        conexao.close()
+
+
+class TestIdsComAnosArquivados(unittest.TestCase):
+    """Ids de anos arquivados em partições não são reutilizados pelo principal."""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'particionado.db')
+
+    def tearDown(self):
+        obter_pool(self.caminho).fechar()
+        self.diretorio.cleanup()
+
+    def test_id_novo_depois_de_arquivar_e_excluir(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            conexao = Conexao(self.caminho)
+            conexao.insert_many([(1, 'a', 'Entrada', '2018-01-01'),
+                                 (2, 'b', 'Entrada', '2018-06-01'),
+                                 (3, 'c', 'Entrada', '2018-12-31'),
+                                 (4, 'd', 'Saída', '2019-01-01')])
+            self.assertEqual(conexao.arquivar_ano(2018), 3)
+            conexao.delete_transacao(4)
+            nova = conexao.insert_transacao(5, 'e', 'Entrada', '2019-02-01')
+        self.assertEqual(nova[0], 5)
+        ids = [linha[0] for linha in conexao.read_all()]
+        self.assertEqual(ids, [1, 2, 3, 5])
+        conexao.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
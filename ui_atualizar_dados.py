@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'atualizar_dados.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_InsertWindow(object):
+    def setupUi(self, InsertWindow):
+        InsertWindow.setObjectName("InsertWindow")
+        InsertWindow.resize(676, 478)
+        InsertWindow.setMinimumSize(QtCore.QSize(676, 478))
+        InsertWindow.setMaximumSize(QtCore.QSize(676, 478))
+        self.centralwidget = QtWidgets.QWidget(InsertWindow)
+        self.centralwidget.setMinimumSize(QtCore.QSize(0, 0))
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame = QtWidgets.QFrame(self.centralwidget)
+        self.frame.setMinimumSize(QtCore.QSize(0, 0))
+        self.frame.setMaximumSize(QtCore.QSize(6526262, 16777215))
+        self.frame.setStyleSheet("QFrame{background-color: rgb(75, 83, 98);}\n"
+"")
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.frame_2 = QtWidgets.QFrame(self.frame)
+        self.frame_2.setMinimumSize(QtCore.QSize(150, 0))
+        self.frame_2.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.frame_2.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.frame_2)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.frame_8 = QtWidgets.QFrame(self.frame_2)
+        self.frame_8.setMaximumSize(QtCore.QSize(16777215, 240))
+        self.frame_8.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_8.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_8.setObjectName("frame_8")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.frame_8)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.label_4 = QtWidgets.QLabel(self.frame_8)
+        self.label_4.setStyleSheet("background-color: transparent;\n"
+"color: rgb(255, 255, 255);\n"
+"font: 25 20pt \"Segoe UI Light\";\n"
+" border-radius: 15px;\n"
+"background-color: rgb(206, 183, 99);")
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_4.addWidget(self.label_4)
+        self.line_3 = QtWidgets.QFrame(self.frame_8)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_4.addWidget(self.line_3)
+        self.verticalLayout_3.addWidget(self.frame_8)
+        self.pushButton_2 = QtWidgets.QPushButton(self.frame_2)
+        self.pushButton_2.setStyleSheet("QPushButton{\n"
+"  padding: 10px 25px;\n"
+"  font-size: 24px;\n"
+"\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"  background-color: rgb(52, 59, 72);\n"
+"  border-radius: 15px;\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:hover{\n"
+"    background-color: rgb(57, 65, 80);\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:pressed{\n"
+"  background-color: #3e8e41;\n"
+"\n"
+"}")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("Icons/Setapratras-removebg-preview.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_2.setIcon(icon)
+        self.pushButton_2.setIconSize(QtCore.QSize(25, 15))
+        self.pushButton_2.setObjectName("pushButton_2")
+        self.verticalLayout_3.addWidget(self.pushButton_2)
+        self.horizontalLayout.addWidget(self.frame_2)
+        self.line_2 = QtWidgets.QFrame(self.frame)
+        self.line_2.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.horizontalLayout.addWidget(self.line_2)
+        self.frame_4 = QtWidgets.QFrame(self.frame)
+        self.frame_4.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.frame_4)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_6 = QtWidgets.QLabel(self.frame_4)
+        self.label_6.setMaximumSize(QtCore.QSize(16777215, 25))
+        self.label_6.setStyleSheet("background-color: transparent;\n"
+"font: 25 20pt \"Segoe UI Light\";\n"
+"")
+        self.label_6.setObjectName("label_6")
+        self.verticalLayout_2.addWidget(self.label_6)
+        self.lineEdit_id = QtWidgets.QLineEdit(self.frame_4)
+        self.lineEdit_id.setMinimumSize(QtCore.QSize(0, 25))
+        self.lineEdit_id.setMaximumSize(QtCore.QSize(656566, 16777215))
+        self.lineEdit_id.setStyleSheet("QLineEdit {\n"
+"color: rgb(172, 172, 172);\n"
+"    background-color: rgb(52, 59, 72);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(33, 37, 43);\n"
+"    padding-left: 10px;\n"
+"    selection-color: rgb(255, 255, 255);\n"
+"    selection-background-color: rgb(255, 121, 198);\n"
+"}\n"
+"QLineEdit:hover {\n"
+"    border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"")
+        self.lineEdit_id.setText("")
+        self.lineEdit_id.setObjectName("lineEdit_id")
+        self.verticalLayout_2.addWidget(self.lineEdit_id)
+        self.label = QtWidgets.QLabel(self.frame_4)
+        self.label.setMaximumSize(QtCore.QSize(16777215, 25))
+        self.label.setStyleSheet("background-color: transparent;\n"
+"font: 25 20pt \"Segoe UI Light\";\n"
+"")
+        self.label.setObjectName("label")
+        self.verticalLayout_2.addWidget(self.label)
+        self.lineEdit = QtWidgets.QLineEdit(self.frame_4)
+        self.lineEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.lineEdit.setMaximumSize(QtCore.QSize(656566, 16777215))
+        self.lineEdit.setStyleSheet("QLineEdit {\n"
+"color: rgb(172, 172, 172);\n"
+"    background-color: rgb(52, 59, 72);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(33, 37, 43);\n"
+"    padding-left: 10px;\n"
+"    selection-color: rgb(255, 255, 255);\n"
+"    selection-background-color: rgb(255, 121, 198);\n"
+"}\n"
+"QLineEdit:hover {\n"
+"    border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"")
+        self.lineEdit.setText("")
+        self.lineEdit.setObjectName("lineEdit")
+        self.verticalLayout_2.addWidget(self.lineEdit)
+        self.label_5 = QtWidgets.QLabel(self.frame_4)
+        self.label_5.setMaximumSize(QtCore.QSize(16777215, 25))
+        self.label_5.setStyleSheet("background-color: transparent;\n"
+"font: 25 20pt \"Segoe UI Light\";")
+        self.label_5.setObjectName("label_5")
+        self.verticalLayout_2.addWidget(self.label_5)
+        self.dateEdit = QtWidgets.QDateEdit(self.frame_4)
+        self.dateEdit.setMaximumSize(QtCore.QSize(130, 30))
+        self.dateEdit.setStyleSheet("color: white;\n"
+"    background-color: rgb(52, 59, 72);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(33, 37, 43);\n"
+"    padding: 5px;\n"
+"    padding-left: 10px;\n"
+"font: 25 12pt \"Segoe UI Light\";")
+        self.dateEdit.setCalendarPopup(True)
+        self.dateEdit.setObjectName("dateEdit")
+        self.verticalLayout_2.addWidget(self.dateEdit)
+        self.label_2 = QtWidgets.QLabel(self.frame_4)
+        self.label_2.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_2.setStyleSheet("background-color: transparent;\n"
+"font: 25 20pt \"Segoe UI Light\";")
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_2.addWidget(self.label_2)
+        self.lineEdit_2 = QtWidgets.QLineEdit(self.frame_4)
+        self.lineEdit_2.setMinimumSize(QtCore.QSize(0, 25))
+        self.lineEdit_2.setStyleSheet("QLineEdit {\n"
+"color: rgb(172, 172, 172);\n"
+"    background-color: rgb(52, 59, 72);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(33, 37, 43);\n"
+"    padding-left: 10px;\n"
+"    selection-color: rgb(255, 255, 255);\n"
+"    selection-background-color: rgb(255, 121, 198);\n"
+"}\n"
+"QLineEdit:hover {\n"
+"    border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"")
+        self.lineEdit_2.setText("")
+        self.lineEdit_2.setObjectName("lineEdit_2")
+        self.verticalLayout_2.addWidget(self.lineEdit_2)
+        self.label_3 = QtWidgets.QLabel(self.frame_4)
+        self.label_3.setMaximumSize(QtCore.QSize(16777215, 25))
+        self.label_3.setStyleSheet("background-color: transparent;\n"
+"font: 25 20pt \"Segoe UI Light\";\n"
+"")
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_2.addWidget(self.label_3)
+        self.comboBox = QtWidgets.QComboBox(self.frame_4)
+        self.comboBox.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.comboBox.setStyleSheet("QComboBox{\n"
+"color: white;\n"
+"    background-color: rgb(52, 59, 72);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(33, 37, 43);\n"
+"    padding: 5px;\n"
+"    padding-left: 10px;\n"
+"font: 25 12pt \"Segoe UI Light\";\n"
+"}\n"
+"QComboBox:hover{\n"
+"    border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QComboBox::drop-down {\n"
+"\n"
+"background-position: center;\n"
+"background-repeat: no-reperat;\n"
+"subcontrol-origin: padding;\n"
+"subcontrol-position: top right;\n"
+"width: 25px; \n"
+"border-left-width: 3px;\n"
+"border-left-color: rgba(39, 44, 54, 150);\n"
+"border-left-style: solid;\n"
+"border-top-right-radius: 3px;\n"
+"border-bottom-right-radius: 3px;    \n"
+"    background-image: url(:/newPrefix/icons/cil-arrow-bottom.png);\n"
+"background-position: center;\n"
+"background-repeat: no-reperat\n"
+" }\n"
+"QComboBox QAbstractItemView {\n"
+"    color: rgb(255, 121, 198);    \n"
+"    background-color: rgb(33, 37, 43);\n"
+"    padding: 10px;\n"
+"    selection-background-color: rgb(39, 44, 54);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"")
+        self.comboBox.setObjectName("comboBox")
+        self.comboBox.addItem("")
+        self.comboBox.addItem("")
+        self.verticalLayout_2.addWidget(self.comboBox)
+        self.verticalLayout_5.addLayout(self.verticalLayout_2)
+        self.line = QtWidgets.QFrame(self.frame_4)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_5.addWidget(self.line)
+        self.frame_5 = QtWidgets.QFrame(self.frame_4)
+        self.frame_5.setMaximumSize(QtCore.QSize(16777215, 70))
+        self.frame_5.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_5.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_5.setObjectName("frame_5")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_5)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.frame_6 = QtWidgets.QFrame(self.frame_5)
+        self.frame_6.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.frame_6.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_6.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_6.setObjectName("frame_6")
+        self.horizontalLayout_2.addWidget(self.frame_6)
+        self.pushButton = QtWidgets.QPushButton(self.frame_5)
+        self.pushButton.setStyleSheet("QPushButton{\n"
+"  padding: 10px 25px;\n"
+"  font-size: 24px;\n"
+"\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"  background-color: rgb(52, 59, 72);\n"
+"  border-radius: 15px;\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:hover{\n"
+"background-color: rgb(206, 183, 99);\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:pressed{\n"
+"  background-color: #3e8e41;\n"
+"\n"
+"}")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("Icons/updateicon-removebg-preview-removebg-preview.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton.setIcon(icon1)
+        self.pushButton.setIconSize(QtCore.QSize(40, 25))
+        self.pushButton.setObjectName("pushButton")
+        self.horizontalLayout_2.addWidget(self.pushButton)
+        self.frame_7 = QtWidgets.QFrame(self.frame_5)
+        self.frame_7.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.frame_7.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_7.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_7.setObjectName("frame_7")
+        self.horizontalLayout_2.addWidget(self.frame_7)
+        self.verticalLayout_5.addWidget(self.frame_5)
+        self.horizontalLayout.addWidget(self.frame_4)
+        self.frame_3 = QtWidgets.QFrame(self.frame)
+        self.frame_3.setMinimumSize(QtCore.QSize(0, 0))
+        self.frame_3.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.frame_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.horizontalLayout.addWidget(self.frame_3)
+        self.verticalLayout.addWidget(self.frame)
+        InsertWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(InsertWindow)
+        QtCore.QMetaObject.connectSlotsByName(InsertWindow)
+
+    def retranslateUi(self, InsertWindow):
+        _translate = QtCore.QCoreApplication.translate
+        InsertWindow.setWindowTitle(_translate("InsertWindow", "Inserir dados"))
+        self.label_4.setText(_translate("InsertWindow", "<html><head/><body><p align=\"center\">ALTERAR</p><p align=\"center\">DADOS</p></body></html>"))
+        self.pushButton_2.setText(_translate("InsertWindow", "Voltar"))
+        self.label_6.setText(_translate("InsertWindow", "ID Transação que será alterada:"))
+        self.label.setText(_translate("InsertWindow", "Nome da transação:"))
+        self.label_5.setText(_translate("InsertWindow", "Data:"))
+        self.label_2.setText(_translate("InsertWindow", "Valor:"))
+        self.label_3.setText(_translate("InsertWindow", "Tipo:"))
+        self.comboBox.setItemText(0, _translate("InsertWindow", "Entrada"))
+        self.comboBox.setItemText(1, _translate("InsertWindow", "Saída"))
+        self.pushButton.setText(_translate("InsertWindow", "Atualizar"))
+try:
+    import teste_rc
+except ImportError:
+    pass
+
+
+HASH_UI = '51a628a7a95b75571d49cfd2c7ba4f8967222421'
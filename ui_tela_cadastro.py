@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'tela_cadastro.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1000, 700)
+        MainWindow.setMinimumSize(QtCore.QSize(800, 600))
+        MainWindow.setMaximumSize(QtCore.QSize(1000, 700))
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("Icons/crosslifeIcon.jpg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        MainWindow.setWindowIcon(icon)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame_2 = QtWidgets.QFrame(self.centralwidget)
+        self.frame_2.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame_2)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.frame_3 = QtWidgets.QFrame(self.frame_2)
+        self.frame_3.setMinimumSize(QtCore.QSize(90, 0))
+        self.frame_3.setMaximumSize(QtCore.QSize(1421, 16777215))
+        self.frame_3.setStyleSheet("font: 25 12pt \"Segoe UI Light\";\n"
+"color: white;\n"
+"\n"
+"background-color: rgb(33, 37, 43);\n"
+"background-color: rgb(102, 138, 172);")
+        self.frame_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.line_3 = QtWidgets.QFrame(self.frame_3)
+        self.line_3.setGeometry(QtCore.QRect(10, 526, 84, 16))
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.pushButton_8 = QtWidgets.QPushButton(self.frame_3)
+        self.pushButton_8.setGeometry(QtCore.QRect(10, 429, 60, 60))
+        self.pushButton_8.setMinimumSize(QtCore.QSize(0, 0))
+        self.pushButton_8.setMaximumSize(QtCore.QSize(60, 60))
+        self.pushButton_8.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        self.pushButton_8.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.pushButton_8.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 15px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        self.pushButton_8.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-reinicialização-50.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_8.setIcon(icon1)
+        self.pushButton_8.setIconSize(QtCore.QSize(50, 35))
+        self.pushButton_8.setObjectName("pushButton_8")
+        self.dateTimeEdit = QtWidgets.QDateTimeEdit(self.frame_3)
+        self.dateTimeEdit.setGeometry(QtCore.QRect(-600, 20, 0, 0))
+        self.dateTimeEdit.setMaximumSize(QtCore.QSize(0, 0))
+        self.dateTimeEdit.setStyleSheet("color: transparent;\n"
+"background-color: transparent;")
+        self.dateTimeEdit.setObjectName("dateTimeEdit")
+        self.pushButton_7 = QtWidgets.QPushButton(self.frame_3)
+        self.pushButton_7.setGeometry(QtCore.QRect(10, 138, 60, 60))
+        self.pushButton_7.setMinimumSize(QtCore.QSize(0, 0))
+        self.pushButton_7.setMaximumSize(QtCore.QSize(60, 60))
+        self.pushButton_7.setWhatsThis("")
+        self.pushButton_7.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 15px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        self.pushButton_7.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-pesquisar-50 (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_7.setIcon(icon2)
+        self.pushButton_7.setIconSize(QtCore.QSize(25, 25))
+        self.pushButton_7.setObjectName("pushButton_7")
+        self.buttonSelectDate = QtWidgets.QPushButton(self.frame_3)
+        self.buttonSelectDate.setGeometry(QtCore.QRect(10, 235, 60, 60))
+        self.buttonSelectDate.setMaximumSize(QtCore.QSize(60, 60))
+        self.buttonSelectDate.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 15px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        self.buttonSelectDate.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-calendário-50.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.buttonSelectDate.setIcon(icon3)
+        self.buttonSelectDate.setIconSize(QtCore.QSize(40, 40))
+        self.buttonSelectDate.setObjectName("buttonSelectDate")
+        self.pushButton_6 = QtWidgets.QPushButton(self.frame_3)
+        self.pushButton_6.setGeometry(QtCore.QRect(10, 332, 60, 60))
+        self.pushButton_6.setMinimumSize(QtCore.QSize(0, 0))
+        self.pushButton_6.setMaximumSize(QtCore.QSize(60, 60))
+        self.pushButton_6.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        self.pushButton_6.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.pushButton_6.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 15px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        self.pushButton_6.setText("")
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-pdf-50 (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_6.setIcon(icon4)
+        self.pushButton_6.setIconSize(QtCore.QSize(50, 35))
+        self.pushButton_6.setObjectName("pushButton_6")
+        self.pushButton_7.raise_()
+        self.buttonSelectDate.raise_()
+        self.pushButton_6.raise_()
+        self.dateTimeEdit.raise_()
+        self.line_3.raise_()
+        self.pushButton_8.raise_()
+        self.horizontalLayout.addWidget(self.frame_3)
+        self.line_2 = QtWidgets.QFrame(self.frame_2)
+        self.line_2.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.line_2.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.horizontalLayout.addWidget(self.line_2)
+        self.frame_4 = QtWidgets.QFrame(self.frame_2)
+        self.frame_4.setStyleSheet("QFrame{background-color: rgb(75, 83, 98);}\n"
+"\n"
+"\n"
+"QScrollBar:horizontal {\n"
+"    border: none;\n"
+"    background: rgb(52, 59, 72);\n"
+"    height: 8px;\n"
+"    margin: 0px 21px 0 21px;\n"
+"    border-radius: 0px;\n"
+"}\n"
+"QScrollBar::handle:horizontal {\n"
+"    background: rgb(189, 147, 249);\n"
+"    min-width: 25px;\n"
+"    border-radius: 4px\n"
+"}\n"
+"QScrollBar::add-line:horizontal {\n"
+"    border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"    width: 20px;\n"
+"    border-top-right-radius: 4px;\n"
+"    border-bottom-right-radius: 4px;\n"
+"    subcontrol-position: right;\n"
+"    subcontrol-origin: margin;\n"
+"}\n"
+"QScrollBar::sub-line:horizontal {\n"
+"    border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"    width: 20px;\n"
+"    border-top-left-radius: 4px;\n"
+"    border-bottom-left-radius: 4px;\n"
+"    subcontrol-position: left;\n"
+"    subcontrol-origin: margin;\n"
+"}\n"
+"QScrollBar::up-arrow:horizontal, QScrollBar::down-arrow:horizontal\n"
+"{\n"
+"     background: none;\n"
+"}\n"
+"QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal\n"
+"{\n"
+"     background: none;\n"
+"}\n"
+" QScrollBar:vertical {\n"
+"    border: none;\n"
+"    background: rgb(52, 59, 72);\n"
+"    width: 8px;\n"
+"    margin: 21px 0 21px 0;\n"
+"    border-radius: 0px;\n"
+" }\n"
+" QScrollBar::handle:vertical {    \n"
+"    background: rgb(189, 147, 249);\n"
+"    min-height: 25px;\n"
+"    border-radius: 4px\n"
+" }\n"
+" QScrollBar::add-line:vertical {\n"
+"     border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"     height: 20px;\n"
+"    border-bottom-left-radius: 4px;\n"
+"    border-bottom-right-radius: 4px;\n"
+"     subcontrol-position: bottom;\n"
+"     subcontrol-origin: margin;\n"
+" }\n"
+" QScrollBar::sub-line:vertical {\n"
+"    border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"     height: 20px;\n"
+"    border-top-left-radius: 4px;\n"
+"    border-top-right-radius: 4px;\n"
+"     subcontrol-position: top;\n"
+"     subcontrol-origin: margin;\n"
+" }\n"
+" QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {\n"
+"     background: none;\n"
+" }\n"
+"\n"
+" QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {\n"
+"     background: none;\n"
+" }\n"
+"\n"
+"\n"
+"QRadioButton::indicator {\n"
+"    border: 3px solid rgb(52, 59, 72);\n"
+"    width: 15px;\n"
+"    height: 15px;\n"
+"    border-radius: 10px;\n"
+"    background: rgb(44, 49, 60);\n"
+"}\n"
+"QRadioButton::indicator:hover {\n"
+"    border: 3px solid rgb(58, 66, 81);\n"
+"}\n"
+"QRadioButton::indicator:checked {\n"
+"    background: 3px solid rgb(94, 106, 130);\n"
+"    border: 3px solid rgb(52, 59, 72);    \n"
+"}\n"
+"\n"
+"/* /////////////////////////////////////////////////////////////////////////////////////////////////\n"
+"ComboBox */\n"
+"QComboBox{\n"
+"    background-color: rgb(27, 29, 35);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(33, 37, 43);\n"
+"    padding: 5px;\n"
+"    padding-left: 10px;\n"
+"}\n"
+"QComboBox:hover{\n"
+"    border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QComboBox::drop-down {\n"
+"    subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 25px; \n"
+"    border-left-width: 3px;\n"
+"    border-left-color: rgba(39, 44, 54, 150);\n"
+"    border-left-style: solid;\n"
+"    border-top-right-radius: 3px;\n"
+"    border-bottom-right-radius: 3px;    \n"
+"    background-image: url(:/icons/images/icons/cil-arrow-bottom.png);\n"
+"    background-position: center;\n"
+"    background-repeat: no-reperat;\n"
+" }\n"
+"QComboBox QAbstractItemView {\n"
+"    color: rgb(255, 121, 198);    \n"
+"    background-color: rgb(33, 37, 43);\n"
+"    padding: 10px;\n"
+"    selection-background-color: rgb(39, 44, 54);\n"
+"}\n"
+"\n"
+"")
+        self.frame_4.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.frame_4)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.tableWidget = QtWidgets.QTableView(self.frame_4)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.tableWidget.setFont(font)
+        self.tableWidget.setStyleSheet("QTableView{\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"QHeaderView::section{\n"
+"font: 12pt \"MS Shell Dlg 2\";\n"
+" background-color:grey\n"
+"border-stye: none;\n"
+"\n"
+"\n"
+"}")
+        self.tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.tableWidget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableWidget.setObjectName("tableWidget")
+        self.tableWidget.horizontalHeader().setDefaultSectionSize(110)
+        self.tableWidget.horizontalHeader().setMinimumSectionSize(110)
+        self.verticalLayout_4.addWidget(self.tableWidget)
+        self.horizontalLayout.addWidget(self.frame_4)
+        self.frame_4.raise_()
+        self.frame_3.raise_()
+        self.line_2.raise_()
+        self.verticalLayout.addWidget(self.frame_2)
+        self.line = QtWidgets.QFrame(self.centralwidget)
+        self.line.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout.addWidget(self.line)
+        self.frame = QtWidgets.QFrame(self.centralwidget)
+        self.frame.setMaximumSize(QtCore.QSize(9898989, 120))
+        self.frame.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.frame_5 = QtWidgets.QFrame(self.frame)
+        self.frame_5.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.frame_5.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.frame_5.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_5.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_5.setObjectName("frame_5")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.frame_5)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.pushButton_5 = QtWidgets.QPushButton(self.frame_5)
+        self.pushButton_5.setMinimumSize(QtCore.QSize(50, 80))
+        self.pushButton_5.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"    color: #FA5252;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 5px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-excluir-50 (6).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_5.setIcon(icon5)
+        self.pushButton_5.setIconSize(QtCore.QSize(30, 30))
+        self.pushButton_5.setObjectName("pushButton_5")
+        self.verticalLayout_2.addWidget(self.pushButton_5)
+        self.horizontalLayout_2.addWidget(self.frame_5)
+        self.frame_6 = QtWidgets.QFrame(self.frame)
+        self.frame_6.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.frame_6.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_6.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_6.setObjectName("frame_6")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.frame_6)
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.pushButton_2 = QtWidgets.QPushButton(self.frame_6)
+        self.pushButton_2.setMinimumSize(QtCore.QSize(50, 50))
+        self.pushButton_2.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 5px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-inserir-50 (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_2.setIcon(icon6)
+        self.pushButton_2.setIconSize(QtCore.QSize(50, 20))
+        self.pushButton_2.setObjectName("pushButton_2")
+        self.horizontalLayout_3.addWidget(self.pushButton_2)
+        self.pushButton_3 = QtWidgets.QPushButton(self.frame_6)
+        self.pushButton_3.setMinimumSize(QtCore.QSize(50, 50))
+        self.pushButton_3.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 5px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        icon7 = QtGui.QIcon()
+        icon7.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-17372-0-73111-repetição-direita-43-setas-64.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_3.setIcon(icon7)
+        self.pushButton_3.setIconSize(QtCore.QSize(60, 25))
+        self.pushButton_3.setObjectName("pushButton_3")
+        self.horizontalLayout_3.addWidget(self.pushButton_3)
+        self.pushButton_4 = QtWidgets.QPushButton(self.frame_6)
+        self.pushButton_4.setMinimumSize(QtCore.QSize(50, 50))
+        self.pushButton_4.setStyleSheet("QPushButton{\n"
+"  padding: 15px 25px;\n"
+"  font-size: 24px;\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"      border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 5px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"} QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}\n"
+"\n"
+"\n"
+"\n"
+"")
+        icon8 = QtGui.QIcon()
+        icon8.addPixmap(QtGui.QPixmap("../../../Downloads/icons8-delete-64.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_4.setIcon(icon8)
+        self.pushButton_4.setIconSize(QtCore.QSize(50, 25))
+        self.pushButton_4.setObjectName("pushButton_4")
+        self.horizontalLayout_3.addWidget(self.pushButton_4)
+        self.horizontalLayout_2.addWidget(self.frame_6)
+        self.verticalLayout.addWidget(self.frame)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Gerenciador de transações"))
+        self.pushButton_7.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:11pt; font-weight:600;\">Botão pesquisar. A pesquisa é feita de acordo com o tipo de pesquisa selecionado acima.</span></p></body></html>"))
+        self.pushButton_5.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:11pt; font-weight:600;\">Botão voltar. Volta ao modulo inicial.</span></p></body></html>"))
+        self.pushButton_5.setText(_translate("MainWindow", "Fechar"))
+        self.pushButton_2.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:11pt; font-weight:600;\">Botão inserir. Abre uma nova janela para a inserção de registros.</span></p></body></html>"))
+        self.pushButton_2.setText(_translate("MainWindow", "Inserir"))
+        self.pushButton_3.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:11pt; font-weight:600;\">Botão alterar. Abre uma nova janela para alteração de registros.</span></p></body></html>"))
+        self.pushButton_3.setText(_translate("MainWindow", "Alterar"))
+        self.pushButton_4.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:11pt; font-weight:600;\">Botão excluir. Abre uma nova janela para e exclusão de registros.</span></p></body></html>"))
+        self.pushButton_4.setText(_translate("MainWindow", "Excluir"))
+
+
+HASH_UI = '7bd782bdb27bcdd107bb643881028c4cdba31e65'
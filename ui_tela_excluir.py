@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'tela_excluir.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_InsertWindow(object):
+    def setupUi(self, InsertWindow):
+        InsertWindow.setObjectName("InsertWindow")
+        InsertWindow.resize(676, 478)
+        InsertWindow.setMinimumSize(QtCore.QSize(676, 478))
+        InsertWindow.setMaximumSize(QtCore.QSize(676, 478))
+        self.centralwidget = QtWidgets.QWidget(InsertWindow)
+        self.centralwidget.setMinimumSize(QtCore.QSize(0, 0))
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame = QtWidgets.QFrame(self.centralwidget)
+        self.frame.setMinimumSize(QtCore.QSize(0, 0))
+        self.frame.setMaximumSize(QtCore.QSize(6526262, 16777215))
+        self.frame.setStyleSheet("QFrame{background-color: rgb(75, 83, 98);}\n"
+"\n"
+"QScrollBar:horizontal {\n"
+"    border: none;\n"
+"    background: rgb(52, 59, 72);\n"
+"    height: 8px;\n"
+"    margin: 0px 21px 0 21px;\n"
+"    border-radius: 0px;\n"
+"}\n"
+"QScrollBar::handle:horizontal {\n"
+"    background: rgb(189, 147, 249);\n"
+"    min-width: 25px;\n"
+"    border-radius: 4px\n"
+"}\n"
+"QScrollBar::add-line:horizontal {\n"
+"    border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"    width: 20px;\n"
+"    border-top-right-radius: 4px;\n"
+"    border-bottom-right-radius: 4px;\n"
+"    subcontrol-position: right;\n"
+"    subcontrol-origin: margin;\n"
+"}\n"
+"QScrollBar::sub-line:horizontal {\n"
+"    border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"    width: 20px;\n"
+"    border-top-left-radius: 4px;\n"
+"    border-bottom-left-radius: 4px;\n"
+"    subcontrol-position: left;\n"
+"    subcontrol-origin: margin;\n"
+"}\n"
+"QScrollBar::up-arrow:horizontal, QScrollBar::down-arrow:horizontal\n"
+"{\n"
+"     background: none;\n"
+"}\n"
+"QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal\n"
+"{\n"
+"     background: none;\n"
+"}\n"
+" QScrollBar:vertical {\n"
+"    border: none;\n"
+"    background: rgb(52, 59, 72);\n"
+"    width: 8px;\n"
+"    margin: 21px 0 21px 0;\n"
+"    border-radius: 0px;\n"
+" }\n"
+" QScrollBar::handle:vertical {    \n"
+"    background: rgb(189, 147, 249);\n"
+"    min-height: 25px;\n"
+"    border-radius: 4px\n"
+" }\n"
+" QScrollBar::add-line:vertical {\n"
+"     border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"     height: 20px;\n"
+"    border-bottom-left-radius: 4px;\n"
+"    border-bottom-right-radius: 4px;\n"
+"     subcontrol-position: bottom;\n"
+"     subcontrol-origin: margin;\n"
+" }\n"
+" QScrollBar::sub-line:vertical {\n"
+"    border: none;\n"
+"    background: rgb(55, 63, 77);\n"
+"     height: 20px;\n"
+"    border-top-left-radius: 4px;\n"
+"    border-top-right-radius: 4px;\n"
+"     subcontrol-position: top;\n"
+"     subcontrol-origin: margin;\n"
+" }\n"
+" QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {\n"
+"     background: none;\n"
+" }\n"
+"\n"
+" QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {\n"
+"     background: none;\n"
+" }\n"
+"\n"
+"\n"
+"QRadioButton::indicator {\n"
+"    border: 3px solid rgb(52, 59, 72);\n"
+"    width: 15px;\n"
+"    height: 15px;\n"
+"    border-radius: 10px;\n"
+"    background: rgb(44, 49, 60);\n"
+"}\n"
+"QRadioButton::indicator:hover {\n"
+"    border: 3px solid rgb(58, 66, 81);\n"
+"}\n"
+"QRadioButton::indicator:checked {\n"
+"    background: 3px solid rgb(94, 106, 130);\n"
+"    border: 3px solid rgb(52, 59, 72);    \n"
+"}\n"
+"\n"
+"/* /////////////////////////////////////////////////////////////////////////////////////////////////\n"
+"ComboBox */\n"
+"QPushButton {\n"
+"    border: 2px solid rgb(52, 59, 72);\n"
+"    border-radius: 5px;    \n"
+"    background-color: rgb(52, 59, 72);\n"
+"}\n"
+"#pagesContainer QPushButton:hover {\n"
+"    background-color: rgb(57, 65, 80);\n"
+"    border: 2px solid rgb(61, 70, 86);\n"
+"}\n"
+"#pagesContainer QPushButton:pressed {    \n"
+"    background-color: rgb(35, 40, 49);\n"
+"    border: 2px solid rgb(43, 50, 61);\n"
+"}")
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.frame_2 = QtWidgets.QFrame(self.frame)
+        self.frame_2.setMinimumSize(QtCore.QSize(150, 0))
+        self.frame_2.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.frame_2.setStyleSheet("background-color: rgb(33, 37, 43);")
+        self.frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.frame_2)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.frame_8 = QtWidgets.QFrame(self.frame_2)
+        self.frame_8.setMaximumSize(QtCore.QSize(16777215, 240))
+        self.frame_8.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_8.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_8.setObjectName("frame_8")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.frame_8)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.label_4 = QtWidgets.QLabel(self.frame_8)
+        self.label_4.setStyleSheet("\n"
+"background-color: rgb(194, 9, 9);\n"
+"color: rgb(255, 255, 255);\n"
+"font: 25 20pt \"Segoe UI Light\";\n"
+" border-radius: 15px;\n"
+"")
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_4.addWidget(self.label_4)
+        self.line_3 = QtWidgets.QFrame(self.frame_8)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_4.addWidget(self.line_3)
+        self.verticalLayout_3.addWidget(self.frame_8)
+        self.pushButton_2 = QtWidgets.QPushButton(self.frame_2)
+        self.pushButton_2.setStyleSheet("QPushButton{\n"
+"  padding: 10px 25px;\n"
+"  font-size: 24px;\n"
+"\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"  background-color: rgb(52, 59, 72);\n"
+"  border-radius: 15px;\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:hover{\n"
+"    background-color: rgb(57, 65, 80);\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:pressed{\n"
+"  background-color: #3e8e41;\n"
+"\n"
+"}")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("Icons/Setapratras-removebg-preview.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton_2.setIcon(icon)
+        self.pushButton_2.setIconSize(QtCore.QSize(25, 15))
+        self.pushButton_2.setObjectName("pushButton_2")
+        self.verticalLayout_3.addWidget(self.pushButton_2)
+        self.horizontalLayout.addWidget(self.frame_2)
+        self.line_2 = QtWidgets.QFrame(self.frame)
+        self.line_2.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.horizontalLayout.addWidget(self.line_2)
+        self.frame_4 = QtWidgets.QFrame(self.frame)
+        self.frame_4.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.frame_4)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_2 = QtWidgets.QLabel(self.frame_4)
+        self.label_2.setMaximumSize(QtCore.QSize(16777215, 50))
+        self.label_2.setStyleSheet("background-color: TRANSPARENT;\n"
+"background-color: transparent;\n"
+"font: 25 18pt \"Segoe UI Light\";\n"
+"\n"
+"")
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_2.addWidget(self.label_2)
+        self.lineEdit = QtWidgets.QLineEdit(self.frame_4)
+        self.lineEdit.setMinimumSize(QtCore.QSize(0, 25))
+        self.lineEdit.setMaximumSize(QtCore.QSize(656566, 16777215))
+        self.lineEdit.setStyleSheet("QLineEdit {\n"
+"color: rgb(172, 172, 172);\n"
+"    background-color: rgb(52, 59, 72);\n"
+"    border-radius: 5px;\n"
+"    border: 2px solid rgb(33, 37, 43);\n"
+"    padding-left: 10px;\n"
+"    selection-color: rgb(255, 255, 255);\n"
+"    selection-background-color: rgb(255, 121, 198);\n"
+"}\n"
+"QLineEdit:hover {\n"
+"    border: 2px solid rgb(64, 71, 88);\n"
+"}\n"
+"QLineEdit:focus {\n"
+"    border: 2px solid rgb(91, 101, 124);\n"
+"}\n"
+"")
+        self.lineEdit.setObjectName("lineEdit")
+        self.verticalLayout_2.addWidget(self.lineEdit)
+        self.line = QtWidgets.QFrame(self.frame_4)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_2.addWidget(self.line)
+        self.frame_5 = QtWidgets.QFrame(self.frame_4)
+        self.frame_5.setMaximumSize(QtCore.QSize(16777215, 70))
+        self.frame_5.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_5.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_5.setObjectName("frame_5")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_5)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.frame_6 = QtWidgets.QFrame(self.frame_5)
+        self.frame_6.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.frame_6.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_6.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_6.setObjectName("frame_6")
+        self.horizontalLayout_2.addWidget(self.frame_6)
+        self.pushButton = QtWidgets.QPushButton(self.frame_5)
+        self.pushButton.setStyleSheet("QPushButton{\n"
+"  padding: 10px 25px;\n"
+"  font-size: 24px;\n"
+"\n"
+"  text-align: center;\n"
+"  color: #fff;\n"
+"  \n"
+"    \n"
+"  border-radius: 15px;\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:hover{\n"
+"    \n"
+"    background-color: rgb(204, 89, 89);\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton:pressed{\n"
+"  background-color: #3e8e41;\n"
+"\n"
+"}")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("Icons/deleteicon-removebg-preview-removebg-preview.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pushButton.setIcon(icon1)
+        self.pushButton.setIconSize(QtCore.QSize(40, 25))
+        self.pushButton.setObjectName("pushButton")
+        self.horizontalLayout_2.addWidget(self.pushButton)
+        self.frame_7 = QtWidgets.QFrame(self.frame_5)
+        self.frame_7.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.frame_7.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_7.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_7.setObjectName("frame_7")
+        self.horizontalLayout_2.addWidget(self.frame_7)
+        self.verticalLayout_2.addWidget(self.frame_5)
+        self.horizontalLayout.addWidget(self.frame_4)
+        self.frame_3 = QtWidgets.QFrame(self.frame)
+        self.frame_3.setMinimumSize(QtCore.QSize(0, 0))
+        self.frame_3.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.frame_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.horizontalLayout.addWidget(self.frame_3)
+        self.verticalLayout.addWidget(self.frame)
+        InsertWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(InsertWindow)
+        QtCore.QMetaObject.connectSlotsByName(InsertWindow)
+
+    def retranslateUi(self, InsertWindow):
+        _translate = QtCore.QCoreApplication.translate
+        InsertWindow.setWindowTitle(_translate("InsertWindow", "Inserir dados"))
+        self.label_4.setText(_translate("InsertWindow", "<html><head/><body><p align=\"center\"><span style=\" font-size:18pt; font-weight:600;\">Excluir</span></p><p align=\"center\"><span style=\" font-size:18pt; font-weight:600;\">dados</span></p></body></html>"))
+        self.pushButton_2.setText(_translate("InsertWindow", "Voltar"))
+        self.label_2.setText(_translate("InsertWindow", "Insira o nome da transação que será excluida:"))
+        self.pushButton.setText(_translate("InsertWindow", "Excluir"))
+
+
+HASH_UI = '494cce73d140062f6467062e0401e858c105b734'